@@ -24,9 +24,14 @@
 
 __metaclass__ = type
 
+# ``pkg_resources`` scans every installed distribution when imported, which
+# costs more than the rest of starting the CLI.
 try:
-    import pkg_resources
+    from importlib import metadata
+except ImportError:
+    import importlib_metadata as metadata
 
-    __version__ = pkg_resources.get_distribution('molecule').version
+try:
+    __version__ = metadata.version('molecule')
 except Exception:
     __version__ = 'unknown'
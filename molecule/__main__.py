@@ -18,7 +18,21 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
-from .shell import main
+import sys
+
+from molecule import daemon
+
+
+def main():
+    # a running daemon runs the command, before the CLI is even imported
+    exit_code = daemon.forward(sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
+
+    from molecule import shell
+
+    shell.main()
+
 
 if __name__ == '__main__':
     main()
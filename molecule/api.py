@@ -1,5 +1,12 @@
-import pkg_resources
+import collections
+import hashlib
+import importlib
+import json
+import os
+import sys
+
 from molecule import logger
+from molecule import util
 
 
 LOG = logger.get_logger(__name__)
@@ -9,18 +16,152 @@
 except ImportError:
     from backports.functools_lru_cache import lru_cache
 
+ENTRY_POINT_GROUP = 'molecule_driver'
+
+# The metadata directories of installed distributions, which hold their
+# ``entry_points.txt``.
+_METADATA_SUFFIXES = ('.dist-info', '.egg-info')
+
 
 @lru_cache()
 def molecule_drivers(as_dict=False):
+    """
+    Lists the names of the installed drivers, without importing them, and
+    returns a list.  When ``as_dict`` is set, every driver is imported and
+    a dict of the loaded modules keyed by their name is returned instead,
+    leaving out the ones failing to load.
+
+    :param as_dict: An optional bool to load all drivers.
+    :return: list, or dict
+    """
+    index = _driver_index()
+    if not as_dict:
+        return list(index.keys())
 
     plugins = {}
-    for entry_point in pkg_resources.iter_entry_points('molecule_driver'):
+    for name in index:
         try:
-            plugins[entry_point.name] = entry_point.load()
+            plugins[name] = _load_entry_point(index[name])
         except Exception as e:
-            LOG.error("Failed to load %s driver: %s", entry_point.name, str(e))
+            LOG.error("Failed to load %s driver: %s", name, str(e))
+
+    return plugins
+
+
+@lru_cache()
+def load_driver(name):
+    """
+    Imports the module of the given driver and returns it, exiting when it
+    fails to load.
+
+    :param name: A string containing the name of the driver.
+    :return: module
+    """
+    value = _driver_index()[name]
+    try:
+        return _load_entry_point(value)
+    except Exception as e:
+        msg = "Failed to load {} driver: {}".format(name, str(e))
+        util.sysexit_with_message(msg)
+
+
+@lru_cache()
+def _driver_index():
+    """
+    Reads the names and the targets of the ``molecule_driver`` entry points
+    from the index kept in Molecule's cache directory, rebuilding it when the
+    installed distributions changed, and returns a dict.
+
+    :return: dict
+    """
+    # imported here, listing the drivers does not need the rest of Molecule
+    from molecule import scenario
+
+    fingerprint = _fingerprint()
+    filename = os.path.join(
+        scenario.ephemeral_directory('molecule_drivers'), 'index.json'
+    )
+    try:
+        with util.open_file(filename) as stream:
+            entry = json.load(stream)
+        if entry['fingerprint'] == fingerprint:
+            return _ordered(entry['drivers'])
+    except (IOError, OSError, ValueError, KeyError, TypeError):
+        pass
+
+    drivers = _scan_entry_points()
+    data = json.dumps({'fingerprint': fingerprint, 'drivers': drivers})
+    try:
+        util.write_file_atomically(filename, data)
+    except (IOError, OSError):
+        pass
+
+    return _ordered(drivers)
 
-    if as_dict:
-        return plugins
+
+def _scan_entry_points():
+    # ``pkg_resources`` scans every installed distribution when imported, and
+    # the driver modules are only imported once one is used
+    try:
+        from importlib import metadata
+    except ImportError:
+        import importlib_metadata as metadata
+
+    entry_points = metadata.entry_points()
+    if hasattr(entry_points, 'select'):
+        entry_points = entry_points.select(group=ENTRY_POINT_GROUP)
     else:
-        return list(plugins.keys())
+        entry_points = entry_points.get(ENTRY_POINT_GROUP, [])
+
+    drivers = []
+    names = set()
+    for entry_point in entry_points:
+        # the first distribution on ``sys.path`` providing a driver wins
+        if entry_point.name not in names:
+            names.add(entry_point.name)
+            drivers.append([entry_point.name, entry_point.value])
+
+    return drivers
+
+
+def _fingerprint():
+    """
+    Summarizes the installed distributions as cheaply as possible and returns
+    a string.  Installing, removing or upgrading a distribution changes its
+    metadata directory, or at least the ``entry_points.txt`` within it.
+
+    :return: str
+    """
+    data = [sys.version, sys.path]
+    for path in sys.path:
+        try:
+            names = sorted(os.listdir(path or '.'))
+        except (IOError, OSError):
+            data.append(_mtime(path))
+            continue
+        for name in names:
+            if name.endswith(_METADATA_SUFFIXES):
+                filename = os.path.join(path, name, 'entry_points.txt')
+                data.append([name, _mtime(filename)])
+
+    return hashlib.sha256(json.dumps(data).encode('utf-8')).hexdigest()
+
+
+def _load_entry_point(value):
+    module_name, _, attrs = value.partition(':')
+    obj = importlib.import_module(module_name.strip())
+    for attr in attrs.strip().split('.') if attrs.strip() else []:
+        obj = getattr(obj, attr)
+
+    return obj
+
+
+def _mtime(filename):
+    try:
+        return os.stat(filename).st_mtime
+    except (IOError, OSError):
+        return None
+
+
+def _ordered(drivers):
+    return collections.OrderedDict((name, value) for name, value in drivers)
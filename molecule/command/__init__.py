@@ -18,26 +18,6 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
-# NOTE(retr0h): Importing into the ``molecule.command`` namespace, to prevent
-# collisions (e.g. ``list``).  The CLI usage may conflict with reserved words
-# or builtins.
-
-from molecule.command import base  # noqa
-from molecule.command import cleanup  # noqa
-from molecule.command import check  # noqa
-from molecule.command import converge  # noqa
-from molecule.command import create  # noqa
-from molecule.command import dependency  # noqa
-from molecule.command import destroy  # noqa
-from molecule.command import drivers  # noqa
-from molecule.command import idempotence  # noqa
-from molecule.command import lint  # noqa
-from molecule.command import list  # noqa
-from molecule.command import login  # noqa
-from molecule.command import matrix  # noqa
-from molecule.command import prepare  # noqa
-from molecule.command import side_effect  # noqa
-from molecule.command import syntax  # noqa
-from molecule.command import test  # noqa
-from molecule.command import verify  # noqa
-from molecule.command.init import init  # noqa
+# NOTE: The subcommand modules are imported by ``molecule.shell`` when the
+# subcommand runs, and by ``base.execute_subcommand`` for the actions of a
+# sequence, starting Molecule does not import all of them.
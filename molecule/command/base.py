@@ -18,17 +18,28 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
+from __future__ import print_function
+
 import abc
 import collections
 import glob
+import importlib
+import json
+import multiprocessing
 import os
+import sys
+import time
+import traceback
 
 import six
+import tabulate
 
-import molecule.command
+import molecule.scenario
 import molecule.scenarios
 from molecule import config
 from molecule import logger
+from molecule import timings
+from molecule import trace
 from molecule import util
 
 LOG = logger.get_logger(__name__)
@@ -42,15 +53,17 @@ class Base(object):
     An abstract base class used to define the command interface.
     """
 
-    def __init__(self, c):
+    def __init__(self, c, setup=True):
         """
         Base initializer for all :ref:`Command` classes.
 
         :param c: An instance of a Molecule config.
+        :param setup: An optional bool to prepare Molecule's provisioner.
         :returns: None
         """
         self._config = c
-        self._setup()
+        if setup:
+            self._setup()
 
     @abc.abstractmethod
     def execute(self):  # pragma: no cover
@@ -93,7 +106,57 @@ def execute_cmdline_scenarios(scenario_name, args, command_args, ansible_args=()
         get_configs(args, command_args, ansible_args), scenario_name
     )
     scenarios.print_matrix()
-    for scenario in scenarios:
+
+    try:
+        jobs = command_args.get('jobs', 1)
+        if jobs > 1 and len(scenarios.all) > 1:
+            # the workers are forked with the project linted, which happens
+            # before any of them, unlike the first ``lint`` of a serial run
+            _lint_project(scenarios)
+            _execute_scenarios_concurrently(scenarios, command_args, jobs)
+            return
+
+        for scenario in scenarios:
+            _execute_scenario_with_cleanup(scenario, command_args)
+    finally:
+        if scenarios.all and scenarios.all[0].config.timings:
+            timings.report(_get_timings_file(scenarios.all[0]))
+        if scenarios.all and trace.enabled():
+            trace.write(_get_trace_file(scenarios.all[0]))
+
+
+def _lint_project(scenarios):
+    """
+    Execute the project linters of the scenarios which lint, once per
+    distinct project lint, and returns None.
+
+    The project linter's inputs are identical across the scenarios of a
+    project, so its result is reused by every scenario's ``lint`` action
+    run by the worker processes forked afterwards.  Linters whose inputs are
+    scenario specific still run with each scenario.
+
+    :param scenarios: A Scenarios object.
+    :returns: None
+    """
+    fingerprints = set()
+    for scenario in scenarios.all:
+        lint = scenario.config.lint
+        if 'lint' in scenario.sequence and lint:
+            if lint.fingerprint not in fingerprints:
+                fingerprints.add(lint.fingerprint)
+                lint.execute_once()
+
+
+def _execute_scenario_with_cleanup(scenario, command_args):
+    """
+    Execute the given scenario, honouring the ``destroy`` strategy of the
+    subcommand when the sequence fails, and returns None.
+
+    :param scenario: The scenario to execute.
+    :param command_args: dict of command arguments.
+    :returns: None
+    """
+    with trace.span(scenario.name, 'scenario'):
         try:
             execute_scenario(scenario)
         except SystemExit:
@@ -101,8 +164,7 @@ def execute_cmdline_scenarios(scenario_name, args, command_args, ansible_args=()
             # handle that behavior here.
             if command_args.get('destroy') == 'always':
                 msg = (
-                    'An error occurred during the {} sequence action: '
-                    "'{}'. Cleaning up."
+                    "An error occurred during the {} sequence action: '{}'. Cleaning up."
                 ).format(scenario.config.subcommand, scenario.config.action)
                 LOG.warning(msg)
                 execute_subcommand(scenario.config, 'cleanup')
@@ -116,8 +178,146 @@ def execute_cmdline_scenarios(scenario_name, args, command_args, ansible_args=()
                 raise
 
 
-def execute_subcommand(config, subcommand):
-    command_module = getattr(molecule.command, subcommand)
+def _execute_scenarios_concurrently(scenarios, command_args, jobs):
+    """
+    Execute the given scenarios in a pool of ``jobs`` worker processes and
+    returns None.
+
+    Each scenario runs in parallel mode, so its ephemeral directory and
+    platform names are isolated by the config's run UUID.  The output of
+    every scenario is written to its own log file, which is replayed once
+    the scenario has finished, followed by a summary of all results.
+
+    :param scenarios: A Scenarios object.
+    :param command_args: dict of command arguments.
+    :param jobs: An int containing the number of worker processes.
+    :returns: None
+    """
+    job_list = [
+        (scenario.config, command_args, _get_job_log_file(scenario))
+        for scenario in scenarios
+    ]
+    msg = 'Running {} scenarios with {} jobs'.format(len(job_list), jobs)
+    LOG.info(msg)
+
+    results = []
+    pool = multiprocessing.Pool(processes=jobs)
+    try:
+        for result in pool.imap_unordered(_execute_scenario_job, job_list):
+            scenario_name, exit_code, duration, log_file, records = result
+            _extend_records(records)
+            msg = "Scenario '{}' output ({})".format(scenario_name, log_file)
+            LOG.info(msg)
+            _print_log_file(log_file)
+            results.append(result)
+        pool.close()
+    except BaseException:
+        pool.terminate()
+        raise
+    finally:
+        pool.join()
+
+    _print_job_summary(results)
+
+    failed = sorted(r[0] for r in results if r[1] != 0)
+    if failed:
+        msg = 'Failed scenario(s): {}'.format(', '.join(failed))
+        util.sysexit_with_message(msg)
+
+
+def _execute_scenario_job(job):
+    """
+    Execute a single scenario inside a worker process and returns a tuple
+    of the scenario name, exit code, duration, log file and the timings and
+    trace records of the scenario.
+
+    :param job: A tuple of the scenario's config, the command arguments and
+     the log file receiving the scenario's output.
+    :returns: tuple
+    """
+    c, command_args, log_file = job
+    scenario = c.scenario
+    exit_code = 0
+    start = time.time()
+    trace.name_process('molecule --jobs worker')
+
+    with util.redirect_output(log_file):
+        try:
+            _execute_scenario_with_cleanup(scenario, command_args)
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else 1
+        except Exception:
+            traceback.print_exc()
+            exit_code = 1
+
+    duration = time.time() - start
+
+    return scenario.name, exit_code, duration, log_file, _pop_records()
+
+
+def _print_log_file(filename):
+    with util.open_file(filename) as stream:
+        print(stream.read())
+
+
+def _get_job_log_file(scenario):
+    directory = molecule.scenario.ephemeral_directory(
+        os.path.join(
+            'molecule_jobs', os.path.basename(scenario.config.project_directory)
+        )
+    )
+
+    return os.path.join(directory, '{}-{}.log'.format(scenario.name, os.getpid()))
+
+
+def _by_name(result):
+    return result[0]
+
+
+def _get_timings_file(scenario):
+    directory = molecule.scenario.ephemeral_directory(
+        os.path.join(
+            scenario.config.cache_directory,
+            os.path.basename(scenario.config.project_directory),
+        )
+    )
+
+    return os.path.join(directory, 'timings.json')
+
+
+def _get_trace_file(scenario):
+    filename = 'trace.json'
+    if scenario.config.is_parallel:
+        # parallel runs of the project must not overwrite each other's trace
+        filename = 'trace-{}.json'.format(os.getpid())
+
+    return os.path.join(os.path.dirname(_get_timings_file(scenario)), filename)
+
+
+def _pop_records():
+    return {'timings': timings.pop(), 'trace': trace.pop()}
+
+
+def _extend_records(records):
+    timings.extend(records['timings'])
+    trace.extend(records['trace'])
+
+
+def _print_job_summary(results):
+    LOG.info('Summary')
+    data = [
+        (
+            scenario_name,
+            'passed' if exit_code == 0 else 'failed',
+            '{:.1f}s'.format(duration),
+        )
+        for scenario_name, exit_code, duration, _, _ in sorted(results, key=_by_name)
+    ]
+    print(tabulate.tabulate(data, ['Scenario', 'Result', 'Duration']))
+
+
+def execute_subcommand(config, subcommand, setup=True):
+    command_module = importlib.import_module('molecule.command.' + subcommand)
     command = getattr(command_module, util.camelize(subcommand))
     # knowledge of the current action is used by some provisioners
     # to ensure they behave correctly during certain sequence steps,
@@ -125,7 +325,15 @@ def execute_subcommand(config, subcommand):
     # and is also used for reporting in execute_cmdline_scenarios
     config.action = subcommand
 
-    return command(config).execute()
+    start = time.time()
+    try:
+        with timings.step(config, subcommand), trace.span(
+            subcommand, 'action', scenario=config.scenario.name
+        ):
+            return command(config, setup=setup).execute()
+    finally:
+        if trace.enabled():
+            trace.tasks(timings.tasks(config, subcommand, start))
 
 
 def execute_scenario(scenario):
@@ -137,8 +345,11 @@ def execute_scenario(scenario):
 
     """
 
-    for action in scenario.sequence:
-        execute_subcommand(scenario.config, action)
+    if scenario.config.command_args.get('overlap') and _can_fork():
+        _execute_sequence_graph(scenario)
+    else:
+        for action in scenario.sequence:
+            execute_subcommand(scenario.config, action)
 
     # pruning only if a 'destroy' step was in the sequence allows for normal
     # debugging by manually stepping through a scenario sequence
@@ -149,6 +360,173 @@ def execute_scenario(scenario):
             scenario._remove_scenario_state_directory()
 
 
+def _execute_sequence_graph(scenario):
+    """
+    Execute the given scenario's sequence, overlapping steps which do not
+    depend on each other, and returns None.
+
+    Steps in ``molecule.scenario.CONCURRENT_ACTIONS`` run in a child process
+    as soon as their prerequisites completed, and their output is printed
+    once they finish.  All other steps run in order in this process.  When
+    a step fails no further steps are started, running steps are waited
+    for, and ``SystemExit`` is raised as if the sequence ran in order.  Any
+    other error terminates the running steps.
+
+    :param scenario: The scenario to execute.
+    :returns: None
+    """
+    c = scenario.config
+    graph = scenario.sequence_graph
+    pending = list(range(len(graph)))
+    running = collections.OrderedDict()
+    done = set()
+    failure = None
+
+    # the provisioner is set up once, all steps skip the per-command setup,
+    # which would rewrite the inventory while concurrent steps read it
+    c.provisioner.write_config()
+    c.provisioner.manage_inventory()
+    instance_config = _read_instance_config(c)
+
+    try:
+        while pending and not failure:
+            for index in list(pending):
+                action, prerequisites = graph[index]
+                if _is_concurrent(action) and prerequisites <= done:
+                    pending.remove(index)
+                    running[index] = _start_concurrent_step(scenario, action)
+
+            chain = [i for i in pending if not _is_concurrent(graph[i][0])]
+            if chain and graph[chain[0]][1] <= done:
+                index = chain[0]
+                pending.remove(index)
+                try:
+                    execute_subcommand(c, graph[index][0], setup=False)
+                    done.add(index)
+                except SystemExit as e:
+                    failure = (graph[index][0], e.code)
+                # the connection options of the hosts come from the instance
+                # config, which the lifecycle steps change
+                current = _read_instance_config(c)
+                if current != instance_config:
+                    instance_config = current
+                    c.provisioner.update_inventory()
+            elif running:
+                index, step = running.popitem(last=False)
+                failure = _wait_for_concurrent_step(index, step, done)
+            else:  # pragma: no cover
+                break
+
+            for index, step in list(running.items()):
+                if not step[1].is_alive():
+                    del running[index]
+                    result = _wait_for_concurrent_step(index, step, done)
+                    failure = failure or result
+
+        while running:
+            index, step = running.popitem(last=False)
+            result = _wait_for_concurrent_step(index, step, done)
+            failure = failure or result
+    finally:
+        # only left when an unexpected error is on its way out
+        for _, process, _ in running.values():
+            process.terminate()
+            process.join()
+
+    if failure:
+        action, code = failure
+        c.action = action
+        util.sysexit(code if isinstance(code, int) and code else 1)
+
+
+def _read_instance_config(c):
+    try:
+        with util.open_file(c.driver.instance_config) as stream:
+            return stream.read()
+    except (IOError, OSError):
+        return None
+
+
+def _is_concurrent(action):
+    return action in molecule.scenario.CONCURRENT_ACTIONS
+
+
+def _can_fork():
+    # pool workers, such as the ones used for ``--jobs``, are daemonic and
+    # may not start child processes of their own
+    return not multiprocessing.current_process().daemon
+
+
+def _start_concurrent_step(scenario, action):
+    """
+    Start the given action in a child process and returns a tuple of the
+    action, process and log file.
+
+    :param scenario: The scenario to execute the action for.
+    :param action: A string containing the action to execute.
+    :returns: tuple
+    """
+    # the child inherits the config, make sure the driver's sanity checks
+    # already settled the state file, so the child does not write to it
+    scenario.config.driver.sanity_checks()
+
+    log_file = os.path.join(scenario.ephemeral_directory, '{}.log'.format(action))
+    msg = "Starting '{}' alongside the sequence".format(action)
+    LOG.info(msg)
+    sys.stdout.flush()
+    sys.stderr.flush()
+    process = multiprocessing.Process(
+        target=_execute_concurrent_step, args=(scenario.config, action, log_file)
+    )
+    process.start()
+
+    return action, process, log_file
+
+
+def _execute_concurrent_step(c, action, log_file):
+    trace.name_process('molecule --overlap {}'.format(action))
+    try:
+        with util.redirect_output(log_file):
+            execute_subcommand(c, action, setup=False)
+    finally:
+        _save_records(_get_step_records_file(log_file))
+
+
+def _get_step_records_file(log_file):
+    return '{}.records.json'.format(os.path.splitext(log_file)[0])
+
+
+def _save_records(filename):
+    with util.open_file(filename, 'w') as stream:
+        json.dump(_pop_records(), stream)
+
+
+def _load_records(filename):
+    if os.path.exists(filename):
+        with util.open_file(filename) as stream:
+            _extend_records(json.load(stream))
+        os.remove(filename)
+
+
+def _wait_for_concurrent_step(index, step, done):
+    """
+    Wait for a concurrent step to finish, print its output and returns a
+    tuple of the action and exit code on failure, otherwise None.
+
+    :param index: An int containing the index of the step.
+    :param step: A tuple as returned by :func:`_start_concurrent_step`.
+    :param done: A set of completed step indexes.
+    :returns: tuple or None
+    """
+    action, process, log_file = step
+    process.join()
+    _print_log_file(log_file)
+    _load_records(_get_step_records_file(log_file))
+    if process.exitcode:
+        return action, process.exitcode
+    done.add(index)
+
+
 def get_configs(args, command_args, ansible_args=()):
     """
     Glob the current directory for Molecule config files, instantiate config
@@ -0,0 +1,61 @@
+#  Copyright (c) 2019 Red Hat, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import os
+
+import click
+
+from molecule import daemon as molecule_daemon
+from molecule import logger
+from molecule import util
+
+LOG = logger.get_logger(__name__)
+
+
+@click.command()
+@click.pass_context
+@click.option(
+    '--stop',
+    is_flag=True,
+    default=False,
+    help='Stop the daemon of the project, instead of starting one.',
+)
+def daemon(ctx, stop):  # pragma: no cover
+    """
+    Serve the commands of the project from a long-lived process.
+
+    While it runs, ``molecule`` commands run in the project are forwarded to
+    the daemon, which keeps Molecule imported and the config of each scenario
+    loaded.  Set ``MOLECULE_DAEMON=false`` to run a command without it.
+    """
+    if not molecule_daemon._supported():
+        util.sysexit_with_message('The daemon needs Unix sockets and Python 3.')
+
+    project_directory = os.getcwd()
+    if stop:
+        if not molecule_daemon.stop(project_directory):
+            LOG.warning('No daemon is running.')
+        return
+
+    server = molecule_daemon.Server(project_directory, ctx.obj.get('args'))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
@@ -18,8 +18,6 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
-import re
-
 import click
 
 from molecule import logger
@@ -78,62 +76,38 @@ def execute(self):
             msg = 'Instances not converged.  Please converge instances first.'
             util.sysexit_with_message(msg)
 
-        output = self._config.provisioner.converge(out=None, err=None)
+        self._config.provisioner.converge(out=None, err=None)
 
-        idempotent = self._is_idempotent(output)
-        if idempotent:
+        tasks = self._non_idempotent_tasks(self._config.provisioner.events())
+        if not tasks:
             msg = 'Idempotence completed successfully.'
             LOG.success(msg)
         else:
             msg = (
                 'Idempotence test failed because of the following tasks:\n' u'{}'
-            ).format('\n'.join(self._non_idempotent_tasks(output)))
+            ).format('\n'.join(tasks))
             util.sysexit_with_message(msg)
 
-    def _is_idempotent(self, output):
-        """
-        Parses the output of the provisioning for changed and returns a bool.
-
-        :param output: A string containing the output of the ansible run.
-        :return: bool
-        """
-
-        # Remove blank lines to make regex matches easier
-        output = re.sub(r'\n\s*\n*', '\n', output)
-
-        # Look for any non-zero changed lines
-        changed = re.search(r'(changed=[1-9][0-9]*)', output)
-
-        if changed:
-            # Not idempotent
-            return False
-
-        return True
-
-    def _non_idempotent_tasks(self, output):
+    def _non_idempotent_tasks(self, events):
         """
-        Parses the output to identify the non idempotent tasks.
+        Collects the tasks which changed a host from the provisioner's events.
 
-        :param (str) output: A string containing the output of the ansible run.
+        :param events: An iterable of the events of the ansible run.
         :return: A list containing the names of the non idempotent tasks.
         """
-        # Remove blank lines to make regex matches easier.
-        output = re.sub(r'\n\s*\n*', '\n', output)
-
-        # Remove ansi escape sequences.
-        output = util.strip_ansi_escape(output)
-
-        # Split the output into a list and go through it.
-        output_lines = output.split('\n')
         res = []
-        task_line = ''
-        for _, line in enumerate(output_lines):
-            if line.startswith('TASK'):
-                task_line = line
-            elif line.startswith('changed'):
-                host_name = re.search(r'\[(.*)\]', line).groups()[0]
-                task_name = re.search(r'\[(.*)\]', task_line).groups()[0]
-                res.append(u'* [{}] => {}'.format(host_name, task_name))
+        finished = False
+        for event in events:
+            if event['event'] == 'task_end' and event['changed']:
+                res.append(u'* [{}] => {}'.format(event['host'], event['task']))
+            elif event['event'] == 'playbook_end':
+                finished = True
+
+        if not finished:
+            msg = 'Unable to read the results of the converge playbook from {}.'.format(
+                self._config.provisioner.events_file
+            )
+            util.sysexit_with_message(msg)
 
         return res
 
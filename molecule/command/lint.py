@@ -18,9 +18,14 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
+import multiprocessing
+import os
+import sys
+
 import click
 
 from molecule import logger
+from molecule import util
 from molecule.command import base
 
 LOG = logger.get_logger(__name__)
@@ -68,18 +73,69 @@ def execute(self):
         :return: None
         """
         self.print_info()
-        linters = [
-            l
-            for l in [
-                self._config.lint,
-                self._config.verifier.lint,
-                self._config.provisioner.lint,
-            ]
-            if l
-        ]
-
-        for l in linters:
-            l.execute()
+        linters = []
+        project_lint = self._config.lint
+        if project_lint and project_lint.linted:
+            project_lint.execute_once()
+        elif project_lint:
+            linters.append(('project', project_lint))
+
+        for name, l in [
+            ('verifier', self._config.verifier.lint),
+            ('provisioner', self._config.provisioner.lint),
+        ]:
+            if l:
+                linters.append((name, l))
+
+        if len(linters) > 1 and base._can_fork():
+            self._execute_concurrently(linters)
+        else:
+            for _, l in linters:
+                l.execute()
+
+        if project_lint:
+            project_lint.linted = True
+
+    def _execute_concurrently(self, linters):
+        """
+        Execute the given linters in child processes and returns None.
+
+        The output of each linter is buffered in its own log file and
+        printed, in order, once the linter finished.  When any linter fails,
+        exits with the exit code of the first failed linter after all of
+        them finished.
+
+        :param linters: A list of tuples of the linter's name and object.
+        :return: None
+        """
+        sys.stdout.flush()
+        sys.stderr.flush()
+        running = []
+        for name, l in linters:
+            log_file = os.path.join(
+                self._config.scenario.ephemeral_directory, 'lint_{}.log'.format(name)
+            )
+            process = multiprocessing.Process(
+                target=_execute_linter, args=(l, log_file)
+            )
+            process.start()
+            running.append((name, process, log_file))
+
+        failed = []
+        for name, process, log_file in running:
+            process.join()
+            base._print_log_file(log_file)
+            if process.exitcode:
+                failed.append((name, process.exitcode))
+
+        if failed:
+            msg = 'Failed linter(s): {}'.format(', '.join(n for n, _ in failed))
+            util.sysexit_with_message(msg, failed[0][1])
+
+
+def _execute_linter(linter, log_file):
+    with util.redirect_output(log_file):
+        linter.execute()
 
 
 @click.command()
@@ -28,6 +28,7 @@
 
 LOG = logger.get_logger(__name__)
 MOLECULE_PARALLEL = os.environ.get('MOLECULE_PARALLEL', False)
+MOLECULE_OVERLAP = os.environ.get('MOLECULE_OVERLAP', False)
 
 
 class Test(base.Base):
@@ -80,6 +81,21 @@ class Test(base.Base):
     .. option:: molecule --parallel test
 
        Run in parallelizable mode.
+
+    .. program:: molecule test --all --jobs 4
+
+    .. option:: molecule test --all --jobs 4
+
+       Run up to four scenarios concurrently.  Implies ``--parallel``.  The
+       project linter runs once before the scenarios start, so a lint failure
+       stops the run before any ``dependency`` step.
+
+    .. program:: molecule test --overlap
+
+    .. option:: molecule test --overlap
+
+       Run steps which do not need instances, such as ``lint`` and
+       ``syntax``, alongside the instance lifecycle.
     """
 
     def execute(self):
@@ -124,7 +140,28 @@ def execute(self):
     default=MOLECULE_PARALLEL,
     help='Enable or disable parallel mode. Default is disabled.',
 )
-def test(ctx, scenario_name, driver_name, __all, destroy, parallel):  # pragma: no cover
+@click.option(
+    '--jobs',
+    '-j',
+    type=click.IntRange(min=1),
+    default=1,
+    envvar='MOLECULE_JOBS',
+    help=(
+        'Number of scenarios to run concurrently, implies parallel mode '
+        'when greater than one. Default is 1.'
+    ),
+)
+@click.option(
+    '--overlap/--no-overlap',
+    default=MOLECULE_OVERLAP,
+    help=(
+        'Run steps which do not need instances alongside the instance '
+        'lifecycle. Default is disabled.'
+    ),
+)
+def test(
+    ctx, scenario_name, driver_name, __all, destroy, parallel, jobs, overlap
+):  # pragma: no cover
     """
     Test (dependency, lint, cleanup, destroy, syntax, create, prepare,
           converge, idempotence, side_effect, verify, cleanup, destroy).
@@ -132,11 +169,17 @@ def test(ctx, scenario_name, driver_name, __all, destroy, parallel):  # pragma:
 
     args = ctx.obj.get('args')
     subcommand = base._get_subcommand(__name__)
+
+    if jobs > 1:
+        parallel = True
+
     command_args = {
         'parallel': parallel,
         'destroy': destroy,
         'subcommand': subcommand,
         'driver_name': driver_name,
+        'jobs': jobs,
+        'overlap': overlap,
     }
 
     if __all:
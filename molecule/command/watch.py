@@ -0,0 +1,205 @@
+#  Copyright (c) 2019 Red Hat, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import os
+
+import click
+
+import molecule.scenarios
+from molecule import config
+from molecule import logger
+from molecule import watcher
+from molecule.command import base
+
+LOG = logger.get_logger(__name__)
+
+# The actions run for changed files, in the order they run.
+ACTIONS = ('prepare', 'converge', 'verify')
+
+
+class Watch(base.Base):
+    """
+    .. program:: molecule watch
+
+    .. option:: molecule watch
+
+        Target the default scenario.
+
+    .. program:: molecule watch --scenario-name foo
+
+    .. option:: molecule watch --scenario-name foo
+
+        Targeting a specific scenario.
+
+    .. program:: molecule watch --poll
+
+    .. option:: molecule watch --poll
+
+        Compare the modification times of the files, instead of using
+        inotify, such as on network file systems.
+
+    .. program:: molecule watch -- -vvv --tags foo,bar
+
+    .. option:: molecule watch -- -vvv --tags foo,bar
+
+        Providing additional command line arguments to the `ansible-playbook`
+        command.  Use this option with care, as there is no sanitation or
+        validation of input.  Options passed on the CLI override options
+        provided in provisioner's `options` section of `molecule.yml`.
+    """
+
+    def execute(self):
+        """
+        Execute the actions necessary to converge the instances, then runs the
+        actions the changed files need until interrupted, and returns None.
+
+        :return: None
+        """
+        self.print_info()
+        c = self._config
+        # instances created and converged before are reused
+        if not (_created(c) and c.state.converged):
+            self._run(c.scenario.converge_sequence + ['verify'])
+
+        w = watcher.Watcher(
+            [c.project_directory, c.scenario.directory, c.verifier.directory],
+            poll=c.command_args.get('poll', False),
+        )
+        try:
+            while True:
+                msg = 'Watching {} for changes.'.format(', '.join(w.directories))
+                LOG.info(msg)
+                changed = w.wait()
+                self._config = _reload(self._config)
+                actions = get_actions(self._config, changed)
+                if actions:
+                    self._run(actions)
+        finally:
+            w.close()
+
+    def _run(self, actions):
+        c = self._config
+        if not _created(c):
+            # the instances were destroyed in the meantime
+            verify = [a for a in actions if a == 'verify']
+            actions = c.scenario.converge_sequence + verify
+
+        # a changed prepare playbook runs again on prepared instances
+        c.command_args['force'] = 'prepare' in actions
+        try:
+            for action in actions:
+                base.execute_subcommand(c, action)
+        except SystemExit:
+            LOG.warn('Waiting for changes to run the actions again.')
+        finally:
+            c.command_args.pop('force')
+
+
+def get_actions(c, changed):
+    """
+    Determine the actions needed for the given changed files and returns a
+    list, in the order the actions run.
+
+    Changes to the verifier's tests only need ``verify``, changes to the
+    prepare playbook only ``prepare``.  Any other change, such as to the
+    tasks, templates or ``molecule.yml``, needs ``converge`` and ``verify``.
+    The create, destroy and cleanup playbooks do not change the instances
+    created already, and the files Molecule writes are left out.
+
+    :param c: An instance of a Molecule config.
+    :param changed: A list of paths of changed files.
+    :return: list
+    """
+    playbooks = c.provisioner.playbooks
+    unused = [playbooks.create, playbooks.destroy, playbooks.cleanup]
+
+    actions = set()
+    for path in changed:
+        if path in unused or _is_below(path, c.scenario.ephemeral_directory):
+            continue
+        if path == playbooks.prepare:
+            actions.add('prepare')
+        elif path == playbooks.verify or _is_below(path, c.verifier.directory):
+            actions.add('verify')
+        else:
+            actions.update(['converge', 'verify'])
+
+    return [action for action in ACTIONS if action in actions]
+
+
+def _created(c):
+    # instances delegated to something else than Molecule are never created
+    if c.driver.delegated and not c.driver.managed:
+        return True
+
+    return c.state.created
+
+
+def _is_below(path, directory):
+    return path.startswith(os.path.join(directory, ''))
+
+
+def _reload(c):
+    # ``molecule.yml`` may have changed, the config cache makes loading it
+    # again cheap when it did not
+    return config.Config(
+        molecule_file=c.molecule_file,
+        args=c.args,
+        command_args=c.command_args,
+        ansible_args=c.ansible_args,
+    )
+
+
+@click.command()
+@click.pass_context
+@click.option(
+    '--scenario-name',
+    '-s',
+    default=base.MOLECULE_DEFAULT_SCENARIO_NAME,
+    help='Name of the scenario to target. ({})'.format(
+        base.MOLECULE_DEFAULT_SCENARIO_NAME
+    ),
+)
+@click.option(
+    '--poll/--no-poll',
+    default=False,
+    help=(
+        'Enable or disable comparing the modification times of the files, '
+        'instead of using inotify. Default is disabled.'
+    ),
+)
+@click.argument('ansible_args', nargs=-1, type=click.UNPROCESSED)
+def watch(ctx, scenario_name, poll, ansible_args):  # pragma: no cover
+    """
+    Converge and verify the instances whenever the role or the scenario
+    changes.
+    """
+    args = ctx.obj.get('args')
+    subcommand = base._get_subcommand(__name__)
+    command_args = {'subcommand': subcommand, 'poll': poll}
+
+    scenarios = molecule.scenarios.Scenarios(
+        base.get_configs(args, command_args, ansible_args), scenario_name
+    )
+    try:
+        for scenario in scenarios:
+            Watch(scenario.config).execute()
+    except KeyboardInterrupt:
+        pass
@@ -22,14 +22,16 @@
 import os
 
 import anyconfig
-from ansible.module_utils.parsing.convert_bool import boolean
 import six
 
+from molecule import api
+from molecule import config_cache
 from molecule import interpolation
 from molecule import logger
 from molecule import platforms
 from molecule import scenario
 from molecule import state
+from molecule import trace
 from molecule import util
 from molecule.api import molecule_drivers
 from molecule.dependency import ansible_galaxy
@@ -38,6 +40,10 @@
 from molecule.lint import yamllint
 from molecule.model import schema_v2
 from molecule.provisioner import ansible
+from molecule.settings import MOLECULE_CONFIG_CACHE
+from molecule.settings import MOLECULE_DEBUG
+from molecule.settings import MOLECULE_LINT_CACHE
+from molecule.settings import MOLECULE_TIMINGS
 from molecule.verifier import ansible as ansible_verifier
 from molecule.verifier import goss
 from molecule.verifier import inspec
@@ -50,7 +56,6 @@
 
 
 LOG = logger.get_logger(__name__)
-MOLECULE_DEBUG = boolean(os.environ.get('MOLECULE_DEBUG', 'False'))
 MOLECULE_DIRECTORY = 'molecule'
 MOLECULE_FILE = 'molecule.yml'
 MERGE_STRATEGY = anyconfig.MS_DICTS
@@ -60,8 +65,10 @@
 # https://stackoverflow.com/questions/16017397/injecting-function-call-after-init-with-decorator  # noqa
 class NewInitCaller(type):
     def __call__(cls, *args, **kwargs):
-        obj = type.__call__(cls, *args, **kwargs)
-        obj.after_init()
+        with trace.span('{}.__init__'.format(cls.__name__), 'config'):
+            obj = type.__call__(cls, *args, **kwargs)
+        with trace.span('{}.after_init'.format(cls.__name__), 'config'):
+            obj.after_init()
         return obj
 
 
@@ -104,9 +111,24 @@ def __init__(self, molecule_file, args={}, command_args={}, ansible_args=()):
         self._run_uuid = str(uuid4())
 
     def after_init(self):
-        self.config = self._reget_config()
+        env = self._get_env()
+        if self._cache is not None and self._cache.config is not None:
+            config = self._cache.get(env)
+            if config is not None:
+                self.config = config
+                return
+
+            # the entry is stale, its templates were never read
+            template_env = os.environ.copy()
+            template_env.update(self._env_from_file)
+            self._templates = self._get_templates(self._read_files(), template_env)
+
+        config = self.config
+        self.config = self._reget_config(env)
         if self.molecule_file:
             self._validate()
+            if self._cache is not None:
+                self._cache.save(config, env, self.config)
 
     @property
     def is_parallel(self):
@@ -116,6 +138,18 @@ def is_parallel(self):
     def debug(self):
         return self.args.get('debug', MOLECULE_DEBUG)
 
+    @property
+    def lint_cache(self):
+        return self.args.get('lint_cache', MOLECULE_LINT_CACHE)
+
+    @property
+    def config_cache(self):
+        return self.args.get('config_cache', MOLECULE_CONFIG_CACHE)
+
+    @property
+    def timings(self):
+        return self.args.get('timings', MOLECULE_TIMINGS)
+
     @property
     def env_file(self):
         return util.abs_path(self.args.get('env_file'))
@@ -159,9 +193,9 @@ def dependency(self):
     @lru_cache()
     def driver(self):
         driver_name = self._get_driver_name()
-        driver = None
-
-        driver = molecule_drivers(as_dict=True)[driver_name].load(self)
+        # only the selected driver is imported, a broken third-party driver
+        # does not get in the way of the others
+        driver = api.load_driver(driver_name).load(self)
         driver.name = driver_name
 
         return driver
@@ -172,25 +206,40 @@ def drivers(self):
 
     @property
     def env(self):
+        # the names and paths are read from the config, so loading a config
+        # does not build the subsystems a command does not use
+        c = self.config
+        scenario_directory = self.scenario.directory
+        ephemeral_directory = self.scenario.ephemeral_directory
+        state_file = os.path.join(ephemeral_directory, 'state.yml')
+
         return {
             'MOLECULE_DEBUG': str(self.debug),
             'MOLECULE_FILE': self.molecule_file,
             'MOLECULE_ENV_FILE': self.env_file,
-            'MOLECULE_STATE_FILE': self.state.state_file,
-            'MOLECULE_INVENTORY_FILE': self.provisioner.inventory_file,
-            'MOLECULE_EPHEMERAL_DIRECTORY': self.scenario.ephemeral_directory,
-            'MOLECULE_SCENARIO_DIRECTORY': self.scenario.directory,
+            'MOLECULE_STATE_FILE': state_file,
+            'MOLECULE_INVENTORY_FILE': os.path.join(
+                self.scenario.inventory_directory, 'ansible_inventory.yml'
+            ),
+            'MOLECULE_EPHEMERAL_DIRECTORY': ephemeral_directory,
+            'MOLECULE_SCENARIO_DIRECTORY': scenario_directory,
             'MOLECULE_PROJECT_DIRECTORY': self.project_directory,
-            'MOLECULE_INSTANCE_CONFIG': self.driver.instance_config,
-            'MOLECULE_DEPENDENCY_NAME': self.dependency.name,
-            'MOLECULE_DRIVER_NAME': self.driver.name,
-            'MOLECULE_LINT_NAME': self.lint.name,
-            'MOLECULE_PROVISIONER_NAME': self.provisioner.name,
-            'MOLECULE_PROVISIONER_LINT_NAME': self.provisioner.lint.name,
-            'MOLECULE_SCENARIO_NAME': self.scenario.name,
-            'MOLECULE_VERIFIER_NAME': self.verifier.name,
-            'MOLECULE_VERIFIER_LINT_NAME': self.verifier.lint.name,
-            'MOLECULE_VERIFIER_TEST_DIRECTORY': self.verifier.directory,
+            'MOLECULE_INSTANCE_CONFIG': os.path.join(
+                ephemeral_directory, 'instance_config.yml'
+            ),
+            'MOLECULE_DEPENDENCY_NAME': c['dependency']['name'],
+            'MOLECULE_DRIVER_NAME': self._select_driver_name(
+                state.read(state_file).get('driver')
+            ),
+            'MOLECULE_LINT_NAME': c['lint']['name'],
+            'MOLECULE_PROVISIONER_NAME': c['provisioner']['name'],
+            'MOLECULE_PROVISIONER_LINT_NAME': c['provisioner']['lint']['name'],
+            'MOLECULE_SCENARIO_NAME': c['scenario']['name'],
+            'MOLECULE_VERIFIER_NAME': c['verifier']['name'],
+            'MOLECULE_VERIFIER_LINT_NAME': c['verifier']['lint']['name'],
+            'MOLECULE_VERIFIER_TEST_DIRECTORY': os.path.join(
+                scenario_directory, c['verifier']['directory']
+            ),
         }
 
     @property
@@ -241,7 +290,9 @@ def verifiers(self):
         return molecule_verifiers()
 
     def _get_driver_name(self):
-        driver_from_state_file = self.state.driver
+        return self._select_driver_name(self.state.driver)
+
+    def _select_driver_name(self, driver_from_state_file):
         driver_from_cli = self.command_args.get('driver_name')
 
         if driver_from_state_file:
@@ -262,27 +313,53 @@ def _get_driver_name(self):
 
     def _get_config(self):
         """
-        Perform a prioritized recursive merge of config files, and returns
-        a new dict.  Prior to merging the config files are interpolated with
-        environment variables.
+        Read, preflight and interpolate the config files, once per config,
+        and returns a new dict merged the way :meth:`_combine` describes, in
+        which the ``MOLECULE_`` variables are left as they are.
+
+        When the config cache holds an entry for the files and environment,
+        the config of the entry is returned instead.
 
         :return: dict
         """
-        return self._combine(keep_string=MOLECULE_KEEP_STRING)
+        self._env_from_file = set_env_from_file({}, self.env_file)
+        env = os.environ.copy()
+        env.update(self._env_from_file)
+        files = self._read_files()
+
+        self._cache = None
+        if self.config_cache and self.molecule_file:
+            self._cache = config_cache.ConfigCache(
+                files, env, MOLECULE_KEEP_STRING, self.env_file
+            )
+            if self._cache.config is not None:
+                return self._cache.config
+
+        self._templates = self._get_templates(files, env)
+
+        return self._combine(env=env, keep_string=MOLECULE_KEEP_STRING)
 
-    def _reget_config(self):
+    def _reget_config(self, env=None):
         """
         Perform the same prioritized recursive merge from `get_config`, this
         time, interpolating the ``keep_string`` left behind in the original
-        ``get_config`` call.  This is probably __very__ bad.
+        ``get_config`` call, which needs the environment of this config.
 
+        :param env: An optional dict containing the environment returned by
+         :meth:`_get_env`.
         :return: dict
         """
-        env = util.merge_dicts(os.environ.copy(), self.env)
-        env = set_env_from_file(env, self.env_file)
+        if env is None:
+            env = self._get_env()
 
         return self._combine(env=env)
 
+    def _get_env(self):
+        env = util.merge_dicts(os.environ.copy(), self.env)
+        env.update(self._env_from_file)
+
+        return env
+
     def _combine(self, env=os.environ, keep_string=None):
         """
         Perform a prioritized recursive merge of config files, and returns
@@ -294,37 +371,85 @@ def _combine(self, env=os.environ, keep_string=None):
         3. Loads the scenario's ``molecule file`` and merges ontop of previous
            merge.
 
+        The files were read and parsed by :meth:`_get_templates`, only their
+        ``MOLECULE_`` variables are left to interpolate.
+
         :return: dict
         """
         defaults = self._get_defaults()
+        for template in self._templates:
+            defaults = util.merge_dicts(
+                defaults, self._substitute(template, env, keep_string)
+            )
+
+        return defaults
+
+    def _read_files(self):
+        """
+        Read the config files, in the order they are merged, and returns a
+        list of tuples containing the name and the text of each file.
+
+        :return: list
+        """
+        filenames = []
         base_config = self.args.get('base_config')
         if base_config and os.path.exists(base_config):
-            with util.open_file(base_config) as stream:
-                s = stream.read()
-                self._preflight(s)
-                interpolated_config = self._interpolate(s, env, keep_string)
-                defaults = util.merge_dicts(
-                    defaults, util.safe_load(interpolated_config)
-                )
-
+            filenames.append(base_config)
         if self.molecule_file:
-            with util.open_file(self.molecule_file) as stream:
-                s = stream.read()
-                self._preflight(s)
-                interpolated_config = self._interpolate(s, env, keep_string)
-                defaults = util.merge_dicts(
-                    defaults, util.safe_load(interpolated_config)
-                )
+            filenames.append(self.molecule_file)
 
-        return defaults
+        files = []
+        for filename in filenames:
+            with util.open_file(filename) as stream:
+                files.append((filename, stream.read()))
+
+        return files
+
+    def _get_templates(self, files, env):
+        """
+        Preflight and interpolate each config file, except for the
+        ``MOLECULE_`` variables which depend on the config itself, and returns
+        a list of the parsed files.
+
+        :param files: A list of tuples returned by :meth:`_read_files`.
+        :param env: A dict containing the environment to interpolate with.
+        :return: list
+        """
+        templates = []
+        for _, s in files:
+            self._preflight(s, env)
+            template = self._substitute(s, env, MOLECULE_KEEP_STRING, defer=True)
+            templates.append(
+                util.safe_load(template, loader=interpolation.TemplateLoader)
+            )
+
+        return templates
 
     def _interpolate(self, stream, env, keep_string):
         env = set_env_from_file(env, self.env_file)
 
+        return self._substitute(stream, env, keep_string)
+
+    def _substitute(self, data, env, keep_string=None, defer=False):
+        """
+        Interpolate a config file's text, or its parsed data, and returns the
+        same type.
+
+        :param data: A string containing the text of a config file, or its
+         parsed data.
+        :param env: A dict containing the environment to interpolate with.
+        :param keep_string: An optional string prefixing the variables which
+         are not interpolated.
+        :param defer: An optional bool to keep the interpolated text a
+         template, see :meth:`.Interpolator.interpolate`.
+        :return: str, or the type of the parsed data
+        """
         i = interpolation.Interpolator(interpolation.TemplateWithDefaults, env)
 
         try:
-            return i.interpolate(stream, keep_string)
+            if isinstance(data, six.string_types):
+                return i.interpolate(data, keep_string, defer=defer)
+            return i.interpolate_data(data, keep_string)
         except interpolation.InvalidInterpolation as e:
             msg = "parsing config file '{}'.\n\n" '{}\n{}'.format(
                 self.molecule_file, e.place, e.string
@@ -357,6 +482,7 @@ def _get_defaults(self):
             'platforms': [],
             'provisioner': {
                 'name': 'ansible',
+                'executor': 'subprocess',
                 'config_options': {},
                 'ansible_args': [],
                 'connection_options': {},
@@ -430,9 +556,9 @@ def _get_defaults(self):
             },
         }
 
-    def _preflight(self, data):
-        env = os.environ.copy()
-        env = set_env_from_file(env, self.env_file)
+    def _preflight(self, data, env=None):
+        if env is None:
+            env = set_env_from_file(os.environ.copy(), self.env_file)
         errors = schema_v2.pre_validate(data, env, MOLECULE_KEEP_STRING)
 
         if errors:
@@ -443,7 +569,8 @@ def _validate(self):
         msg = 'Validating schema {}.'.format(self.molecule_file)
         LOG.info(msg)
 
-        errors = schema_v2.validate(self.config)
+        with trace.span('Config._validate', 'config', file=self.molecule_file):
+            errors = schema_v2.validate(self.config)
         if errors:
             msg = "Failed to validate.\n\n{}".format(errors)
             util.sysexit_with_message(msg)
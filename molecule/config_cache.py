@@ -0,0 +1,154 @@
+#  Copyright (c) 2019 Red Hat, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import hashlib
+import json
+import os
+import re
+
+import molecule
+import molecule.scenario
+from molecule import util
+
+# The names of ``$VARIABLE``, ``${VARIABLE}`` and of the variables used as
+# defaults, such as ``${VARIABLE:-$DEFAULT}``.  Escaped dollars match too,
+# which only adds a variable to the key.
+_VARIABLE = re.compile(r'\$\{?([_a-z][_a-z0-9]*)', re.IGNORECASE)
+
+
+class ConfigCache(object):
+    """
+    The merged, interpolated and validated config of a scenario, persisted in
+    Molecule's cache directory.
+
+    The entry of a scenario is used when the config files, the env file, the
+    values of the variables referenced by the config files and the version of
+    Molecule are unchanged.  The values of the referenced ``MOLECULE_``
+    variables depend on the config itself, they are compared by :meth:`get`
+    once the config is known.
+    """
+
+    def __init__(self, files, env, keep_string, env_file=None):
+        """
+        Loads the entry of the given config files and returns None.
+
+        :param files: A list of tuples containing the name and the text of
+         each config file, in the order they are merged.
+        :param env: A dict containing the environment the config files are
+         interpolated with.
+        :param keep_string: A string prefixing the variables interpolated
+         with the environment of the config itself.
+        :param env_file: An optional string containing the path of the file
+         variables are read from.
+        :return: None
+        """
+        names = set()
+        for _, text in files:
+            names.update(_VARIABLE.findall(text))
+        self._names = sorted(n for n in names if n.startswith(keep_string))
+        variables = {n: env.get(n) for n in names if not n.startswith(keep_string)}
+        data = [
+            molecule.__version__,
+            [[filename, _sha256(text)] for filename, text in files],
+            variables,
+        ]
+        if env_file and os.path.isfile(env_file):
+            data.append([env_file, _digest(env_file)])
+        self._key = _sha256(json.dumps(data, sort_keys=True, default=str))
+
+        directory = molecule.scenario.ephemeral_directory('molecule_config')
+        name = _sha256(json.dumps([filename for filename, _ in files]))
+        self._filename = os.path.join(directory, '{}.json'.format(name))
+        self._entry = self._load()
+
+    @property
+    def config(self):
+        """
+        The config of the entry, as merged before interpolating the
+        ``MOLECULE_`` variables, or None when there is no entry.
+
+        :return: dict, or None
+        """
+        return self._entry.get('config')
+
+    def get(self, env):
+        """
+        Look up the validated config of the entry and returns a dict, or None
+        when the referenced ``MOLECULE_`` variables have other values.
+
+        :param env: A dict containing the environment of the config.
+        :return: dict, or None
+        """
+        if self._entry.get('env') != self._variables(env):
+            return None
+
+        return self._entry.get('validated')
+
+    def save(self, config, env, validated):
+        """
+        Atomically write the entry to disk and returns None.  Configs which
+        do not survive being serialized as JSON unchanged are not cached.
+
+        :param config: A dict containing the config, as merged before
+         interpolating the ``MOLECULE_`` variables.
+        :param env: A dict containing the environment of the config.
+        :param validated: A dict containing the validated config.
+        :return: None
+        """
+        entry = {
+            'key': self._key,
+            'config': config,
+            'env': self._variables(env),
+            'validated': validated,
+        }
+        try:
+            data = json.dumps(entry)
+        except (TypeError, ValueError):
+            return
+        if json.loads(data) != entry:
+            return
+
+        util.write_file_atomically(self._filename, data)
+
+    def _variables(self, env):
+        return {n: env.get(n) for n in self._names}
+
+    def _load(self):
+        try:
+            with util.open_file(self._filename) as stream:
+                entry = json.load(stream)
+        except (IOError, ValueError):
+            return {}
+        if not isinstance(entry, dict) or entry.get('key') != self._key:
+            return {}
+
+        return entry
+
+
+def _digest(filename):
+    with open(filename, 'rb') as f:
+        return _sha256(f.read())
+
+
+def _sha256(data):
+    if not isinstance(data, bytes):
+        data = data.encode('utf-8')
+
+    return hashlib.sha256(data).hexdigest()
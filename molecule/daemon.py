@@ -0,0 +1,492 @@
+#  Copyright (c) 2019 Red Hat, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+from __future__ import print_function
+
+import array
+import errno
+import glob
+import hashlib
+import json
+import os
+import signal
+import socket
+import sys
+import tempfile
+import traceback
+
+# A running daemon keeps Molecule imported, with the config cache of the
+# scenarios of its project filled and the schemas and drivers they use loaded.
+# It forks a process per command, which inherits all of that and runs on the
+# standard streams of the client.  The client is kept
+# thin, it only imports what is needed to hand a command over.
+
+# The commands forwarded to a running daemon, which work on the scenarios of
+# the project.  ``login`` replaces its process with a shell.
+COMMANDS = (
+    'check',
+    'cleanup',
+    'converge',
+    'create',
+    'dependency',
+    'destroy',
+    'idempotence',
+    'lint',
+    'list',
+    'matrix',
+    'prepare',
+    'side-effect',
+    'syntax',
+    'test',
+    'verify',
+)
+
+# The options of ``molecule`` itself taking a value.
+_OPTIONS_WITH_VALUE = ('-c', '--base-config', '-e', '--env-file')
+
+# Disables forwarding commands to a running daemon.
+_DISABLE = 'MOLECULE_DAEMON'
+
+# The seconds a client has to send its request, once connected.
+_REQUEST_TIMEOUT = 5
+
+# The longest path a Unix socket can be bound to, the smallest ``sun_path``
+# of the supported platforms less its terminating NUL.
+_SOCKET_PATH_MAX = 103
+
+
+def socket_path(project_directory):
+    """
+    Determine the path of the socket of the daemon of the given project and
+    returns a string.  Each installation of Molecule has its own daemon.
+
+    The socket is kept in Molecule's cache directory, unless its path would
+    be too long to bind to, then in a directory of the user in the system's
+    temporary directory.
+
+    :param project_directory: A string containing the path of the project.
+    :return: str
+    """
+    # ``molecule.scenario.ephemeral_directory``, without importing it
+    directory = os.environ.get('MOLECULE_EPHEMERAL_DIRECTORY')
+    if not directory:
+        directory = os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache'))
+    key = json.dumps(
+        [
+            sys.executable,
+            os.path.dirname(os.path.abspath(__file__)),
+            os.path.abspath(project_directory),
+        ]
+    )
+    name = '{}.sock'.format(hashlib.sha256(key.encode('utf-8')).hexdigest()[:16])
+    path = os.path.abspath(os.path.join(directory, 'molecule_daemon', name))
+    if len(path.encode('utf-8')) > _SOCKET_PATH_MAX:
+        directory = 'molecule_daemon-{}'.format(os.getuid())
+        path = os.path.join(tempfile.gettempdir(), directory, name)
+
+    return path
+
+
+def forward(argv):
+    """
+    Run the given command in the daemon of the current directory and returns
+    its exit code, or None when the command is not forwarded.
+
+    :param argv: A list of the arguments passed to ``molecule``.
+    :return: int, or None
+    """
+    if not _supported() or _command(argv) not in COMMANDS:
+        return None
+    if os.environ.get(_DISABLE, '').lower() in ('0', 'false', 'no', 'off'):
+        return None
+
+    path = socket_path(os.getcwd())
+    if not os.path.exists(path):
+        return None
+
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(path)
+        _send_request(
+            client,
+            {'args': list(argv), 'cwd': os.getcwd(), 'env': dict(os.environ)},
+            [0, 1, 2],
+        )
+        replies = client.makefile('r')
+        reply = _read_reply(replies)
+    except (IOError, OSError, ValueError):
+        client.close()
+        return None
+    if reply is None or 'pid' not in reply:
+        client.close()
+        return None
+
+    # the command runs in the process group of the daemon, pass on interrupts
+    while True:
+        try:
+            reply = _read_reply(replies)
+            break
+        except KeyboardInterrupt:
+            _kill(reply['pid'], signal.SIGINT)
+        except (IOError, OSError, ValueError):
+            reply = None
+            break
+    client.close()
+    if reply is None:
+        return 1
+
+    return reply.get('exit_code', 1)
+
+
+def stop(project_directory):
+    """
+    Ask the daemon of the given project to exit and returns a bool, False
+    when no daemon runs.
+
+    :param project_directory: A string containing the path of the project.
+    :return: bool
+    """
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(socket_path(project_directory))
+        _send_request(client, {'stop': True})
+        return _read_reply(client.makefile('r')) is not None
+    except (IOError, OSError, ValueError):
+        return False
+    finally:
+        client.close()
+
+
+class Server(object):
+    """
+    A daemon serving the commands of a project over a Unix socket.
+
+    The parent process imports the commands and loads the config of each
+    scenario, which fills the config cache and the caches of the compiled
+    schemas and of the drivers.  The configs are loaded again when the files
+    they are read from change.  A command runs in a forked process, on the
+    standard streams and in the environment of the client, and builds its
+    configs from those caches, as they depend on the command and on the
+    state of the scenarios.
+    """
+
+    def __init__(self, project_directory, args=None):
+        """
+        Initialize a new daemon and returns None.
+
+        :param project_directory: A string containing the path of the project.
+        :param args: An optional dict of options, arguments and commands from
+         the CLI, the configs are loaded with.
+        :return: None
+        """
+        self._project_directory = os.path.abspath(project_directory)
+        self._args = args or {}
+        self._path = socket_path(self._project_directory)
+        # the environment is only read once by the modules of Molecule
+        self._env = _molecule_env(os.environ)
+        self._watched = None
+        self._socket = None
+
+    def serve_forever(self):
+        """
+        Serve commands until the daemon is stopped, or the installed
+        distributions change, and returns None.
+
+        :return: None
+        """
+        from molecule import api
+        from molecule import logger
+        from molecule import util
+
+        log = logger.get_logger(__name__)
+        if len(self._path.encode('utf-8')) > _SOCKET_PATH_MAX:
+            msg = 'The path of the socket is too long: {}'.format(self._path)
+            util.sysexit_with_message(msg)
+        directory = os.path.dirname(self._path)
+        try:
+            os.makedirs(directory, 0o700)
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
+        # the temporary directory is shared with the other users
+        if os.stat(directory).st_uid != os.getuid():
+            msg = 'The directory of the socket is owned by another user: {}'
+            util.sysexit_with_message(msg.format(directory))
+        if stop(self._project_directory):
+            log.warning('Replaced the daemon already running.')
+        if os.path.exists(self._path):
+            os.unlink(self._path)
+
+        self._preload()
+        fingerprint = api._fingerprint()
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self._socket.bind(self._path)
+            self._socket.listen(16)
+            # wake up regularly to reap the commands and watch the files
+            self._socket.settimeout(1)
+            log.success('Listening on {}'.format(self._path))
+            while True:
+                _reap()
+                if api._fingerprint() != fingerprint:
+                    msg = 'Installed distributions changed, exiting.'
+                    log.warning(msg)
+                    break
+                self._refresh()
+                try:
+                    conn, _ = self._socket.accept()
+                except socket.timeout:
+                    continue
+                # a client which connected is not allowed to stall the daemon
+                conn.settimeout(_REQUEST_TIMEOUT)
+                if not self._handle(conn, log):
+                    break
+        finally:
+            self._socket.close()
+            if os.path.exists(self._path):
+                os.unlink(self._path)
+
+    def run(self, args):
+        """
+        Run the given command in the current process and returns its exit
+        code.
+
+        :param args: A list of the arguments passed to ``molecule``.
+        :return: int
+        """
+        from molecule import shell
+
+        try:
+            shell.main(args=args, prog_name='molecule')
+        except SystemExit as e:
+            return _exit_code(e.code)
+
+        return 0
+
+    def _handle(self, conn, log):
+        try:
+            request, fds = _recv_request(conn)
+        except (IOError, OSError, ValueError):
+            conn.close()
+            return True
+
+        if request.get('stop'):
+            _send_reply(conn, {'stopped': True})
+            conn.close()
+            return False
+
+        env = _molecule_env(request['env'])
+        if env != self._env:
+            names = sorted(
+                k for k in set(env) | set(self._env) if env.get(k) != self._env.get(k)
+            )
+            msg = 'Declined a command, {} differs from the daemon.'
+            log.warning(msg.format(', '.join(names)))
+            _send_reply(conn, {'declined': True})
+        else:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            pid = os.fork()
+            if pid == 0:
+                exit_code = 1
+                try:
+                    self._socket.close()
+                    exit_code = self._run_child(conn, request, fds)
+                except Exception:
+                    traceback.print_exc()
+                finally:
+                    # do not unwind into the loop of the daemon
+                    os._exit(exit_code)
+
+        for fd in fds:
+            os.close(fd)
+        conn.close()
+
+        return True
+
+    def _run_child(self, conn, request, fds):
+        conn.settimeout(None)
+        for target, fd in enumerate(fds):
+            os.dup2(fd, target)
+            os.close(fd)
+        os.chdir(request['cwd'])
+        os.environ.clear()
+        os.environ.update(request['env'])
+        _reset_streams()
+
+        _send_reply(conn, {'pid': os.getpid()})
+        exit_code = self.run(request['args'])
+        _cleanup()
+        _send_reply(conn, {'exit_code': exit_code})
+
+        return exit_code
+
+    def _preload(self):
+        from molecule import shell
+
+        for name in COMMANDS:
+            shell.main.get_command(None, name)
+        self._refresh()
+
+    def _refresh(self):
+        from molecule import config
+        from molecule import shell
+        from molecule import util
+        from molecule.command import base
+
+        molecule_files = sorted(glob.glob(base.MOLECULE_GLOB))
+        filenames = molecule_files + [
+            self._args.get('base_config', shell.LOCAL_CONFIG),
+            self._args.get('env_file', shell.ENV_FILE),
+        ]
+        watched = [(filename, _mtime(filename)) for filename in filenames]
+        if watched == self._watched:
+            return
+        self._watched = watched
+
+        for molecule_file in molecule_files:
+            try:
+                config.Config(
+                    molecule_file=util.abs_path(molecule_file), args=self._args
+                )
+            except SystemExit:
+                # the error is reported once a command uses the scenario
+                pass
+
+
+def _cleanup():
+    # the process of a command leaves with ``os._exit``, which skips the exit
+    # functions of the interpreter, do their work before reporting the exit
+    # code
+    ansible_worker = sys.modules.get('molecule.provisioner.ansible_worker')
+    if ansible_worker is not None:
+        ansible_worker.shutdown()
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+
+def _command(argv):
+    args = iter(argv)
+    for arg in args:
+        if arg in _OPTIONS_WITH_VALUE:
+            next(args, None)
+        elif not arg.startswith('-'):
+            return arg
+
+
+def _exit_code(code):
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+
+    # ``sys.exit`` prints messages
+    print(code, file=sys.stderr)
+    return 1
+
+
+def _kill(pid, signum):
+    try:
+        os.kill(pid, signum)
+    except OSError:
+        pass
+
+
+def _molecule_env(env):
+    return {k: v for k, v in env.items() if k.startswith('MOLECULE_') and k != _DISABLE}
+
+
+def _mtime(filename):
+    try:
+        return os.stat(filename).st_mtime
+    except OSError:
+        return None
+
+
+def _reap():
+    while True:
+        try:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+        except OSError as e:
+            if e.errno == errno.ECHILD:
+                return
+            raise
+        if pid == 0:
+            return
+
+
+def _read_reply(stream):
+    line = stream.readline()
+    if not line:
+        return None
+
+    return json.loads(line)
+
+
+def _recv_request(conn):
+    fds = array.array('i')
+    data, ancdata, _, _ = conn.recvmsg(65536, socket.CMSG_LEN(3 * fds.itemsize))
+    for level, kind, cmsg_data in ancdata:
+        if level == socket.SOL_SOCKET and kind == socket.SCM_RIGHTS:
+            fds.frombytes(cmsg_data[: len(cmsg_data) - len(cmsg_data) % fds.itemsize])
+    while not data.endswith(b'\n'):
+        chunk = conn.recv(65536)
+        if not chunk:
+            break
+        data += chunk
+
+    return json.loads(data.decode('utf-8')), list(fds)
+
+
+def _reset_streams():
+    # the colors are decided for the streams of the client, and the handlers
+    # of the loggers follow the streams ``colorama`` wraps
+    import logging
+
+    import colorama
+
+    from molecule.logger import should_do_markup
+
+    streams = [sys.stdout, sys.stderr]
+    colorama.deinit()
+    colorama.init(autoreset=True, strip=not should_do_markup())
+    streams = dict(zip(streams, [sys.stdout, sys.stderr]))
+    for logger in list(logging.Logger.manager.loggerDict.values()):
+        for handler in getattr(logger, 'handlers', []):
+            stream = getattr(handler, 'stream', None)
+            if stream in streams:
+                handler.stream = streams[stream]
+
+
+def _send_reply(conn, reply):
+    conn.sendall((json.dumps(reply) + '\n').encode('utf-8'))
+
+
+def _send_request(client, request, fds=()):
+    data = (json.dumps(request) + '\n').encode('utf-8')
+    ancdata = []
+    if fds:
+        ancdata = [(socket.SOL_SOCKET, socket.SCM_RIGHTS, array.array('i', fds))]
+    sent = client.sendmsg([data], ancdata)
+    client.sendall(data[sent:])
+
+
+def _supported():
+    return hasattr(socket, 'AF_UNIX') and hasattr(socket.socket, 'sendmsg')
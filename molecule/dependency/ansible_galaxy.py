@@ -18,10 +18,17 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
+import collections
+import hashlib
+import json
 import os
+import shutil
+import tempfile
 
 import sh
+import yaml
 
+import molecule.scenario
 from molecule import logger
 from molecule import util
 from molecule.dependency import base
@@ -69,6 +76,15 @@ class AnsibleGalaxy(base.Base):
           env:
             FOO: bar
 
+    Roles listed in the requirements file are installed once into a cache
+    shared by every scenario and run, keyed by each entry's ``name``, ``src``,
+    ``scm`` and ``version``, and symlinked into the scenario's ``roles-path``.
+    The entries missing from the cache are installed by a single
+    ``ansible-galaxy`` run.  The install is skipped entirely while the
+    requirements file and options are unchanged since the last successful
+    install, and the cached roles are still in place.  Requirements files using
+    ``include`` are installed as a whole, without the cache.
+
     .. _`Ansible Galaxy`: https://docs.ansible.com/ansible/latest/\
                           reference_appendices/galaxy.html
     """
@@ -118,18 +134,7 @@ def bake(self):
 
         :return: None
         """
-        options = self.options
-        verbose_flag = util.verbose_flag(options)
-
-        self._sh_command = getattr(sh, self.command)
-        self._sh_command = self._sh_command.bake(
-            'install',
-            options,
-            *verbose_flag,
-            _env=self.env,
-            _out=LOG.out,
-            _err=LOG.error
-        )
+        self._sh_command = self._bake(self.options)
 
     def execute(self):
         if not self.enabled:
@@ -146,7 +151,40 @@ def execute(self):
             self.bake()
 
         self._setup()
-        self.execute_with_retries()
+
+        fingerprint = self._fingerprint()
+        if fingerprint == self._installed_fingerprint() and self._links_exist():
+            msg = 'Skipping, requirements unchanged since the last install.'
+            LOG.warn(msg)
+            return
+
+        requirements = self._requirements()
+        if requirements is None:
+            self.execute_with_retries()
+        else:
+            for path in self._install_cached(requirements):
+                self._link_roles(path)
+
+        util.write_file(self._fingerprint_file(), fingerprint)
+
+    def _bake(self, options):
+        """
+        Bake an ``ansible-galaxy install`` command with the given options and
+        returns it.
+
+        :param options: A dict containing the options to pass.
+        :return: sh.Command
+        """
+        verbose_flag = util.verbose_flag(options)
+
+        return getattr(sh, self.command).bake(
+            'install',
+            options,
+            *verbose_flag,
+            _env=self.env,
+            _out=LOG.out,
+            _err=LOG.error
+        )
 
     def _setup(self):
         """
@@ -154,14 +192,239 @@ def _setup(self):
 
         :return: None
         """
-        role_directory = os.path.join(
-            self._config.scenario.directory, self.options['roles-path']
-        )
+        role_directory = self._roles_path()
         if not os.path.isdir(role_directory):
             os.makedirs(role_directory)
 
     def _role_file(self):
         return self.options.get('role-file')
 
+    def _roles_path(self):
+        return os.path.join(self._config.scenario.directory, self.options['roles-path'])
+
     def _has_requirements_file(self):
         return os.path.isfile(self._role_file())
+
+    def _requirements(self):
+        """
+        Parse the role-file and returns a list of requirements which can be
+        installed from the cache, or None when the role-file has to be handed
+        to ``ansible-galaxy`` as a whole.
+
+        :return: list, None
+        """
+        requirements = util.safe_load_file(self._role_file())
+        if not isinstance(requirements, list):
+            return
+        for requirement in requirements:
+            if isinstance(requirement, dict) and 'include' in requirement:
+                return
+
+        return requirements
+
+    def _fingerprint(self):
+        """
+        Fingerprint the role-file and the options it is installed with and
+        returns a string.
+
+        :return: str
+        """
+        with util.open_file(self._role_file()) as stream:
+            content = stream.read()
+        data = json.dumps([content, self.options], sort_keys=True)
+
+        return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+    def _fingerprint_file(self):
+        return os.path.join(self._roles_path(), '.molecule_requirements')
+
+    def _installed_fingerprint(self):
+        if os.path.isfile(self._fingerprint_file()):
+            with util.open_file(self._fingerprint_file()) as stream:
+                return stream.read().splitlines()[-1]
+
+    def _links_exist(self):
+        """
+        Determine if the roles linked into the roles-path still exist, as the
+        cache may have been cleaned since, and returns a bool.
+
+        :return: bool
+        """
+        roles_path = self._roles_path()
+        for name in os.listdir(roles_path):
+            link = os.path.join(roles_path, name)
+            if os.path.islink(link) and not os.path.exists(link):
+                return False
+
+        return True
+
+    def _cache_directory(self):
+        return molecule.scenario.ephemeral_directory('molecule_galaxy')
+
+    def _cache_key(self, requirement):
+        """
+        Build the cache key of a single role-file entry and returns a string.
+
+        :param requirement: A dict or string containing a role-file entry.
+        :return: str
+        """
+        if isinstance(requirement, dict):
+            keys = ['name', 'scm', 'src', 'version']
+            requirement = {k: requirement.get(k) for k in keys}
+        data = json.dumps(requirement, sort_keys=True)
+
+        return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+    def _install_cached(self, requirements):
+        """
+        Install the role-file entries missing from the cache with a single
+        ``ansible-galaxy`` run, and returns a list of the directories holding
+        the roles of each entry.
+
+        The entries are installed into a staging directory, and the roles of
+        each entry are copied into a directory of its own renamed into place,
+        so concurrent scenarios never see a partially installed entry.
+
+        :param requirements: A list of dicts or strings containing the
+         role-file entries.
+        :return: list
+        """
+        cache_directory = self._cache_directory()
+        paths = [
+            os.path.join(cache_directory, self._cache_key(r)) for r in requirements
+        ]
+        missing = collections.OrderedDict()
+        for requirement, path in zip(requirements, paths):
+            if not os.path.isdir(path):
+                missing.setdefault(path, requirement)
+        if not missing:
+            return paths
+
+        staging = tempfile.mkdtemp(dir=cache_directory)
+        try:
+            role_file = os.path.join(staging, 'requirements.yml')
+            roles_path = os.path.join(staging, 'roles')
+            util.write_file(role_file, util.safe_dump(list(missing.values())))
+            options = util.merge_dicts(
+                self.options, {'role-file': role_file, 'roles-path': roles_path}
+            )
+            self._sh_command = self._bake(options)
+            self.execute_with_retries()
+
+            roles = _split_roles(roles_path, list(missing.values()))
+            for path, names in zip(missing, roles):
+                _cache_roles(roles_path, names, path)
+        finally:
+            shutil.rmtree(staging)
+
+        return paths
+
+    def _link_roles(self, path):
+        """
+        Symlink the cached roles found in path into the roles-path and returns
+        None.
+
+        :param path: A string containing the cached entry's directory.
+        :return: None
+        """
+        for name in os.listdir(path):
+            source = os.path.join(path, name)
+            link = os.path.join(self._roles_path(), name)
+            if os.path.islink(link):
+                os.unlink(link)
+            elif os.path.isdir(link):
+                if not self.options.get('force'):
+                    continue
+                shutil.rmtree(link)
+            os.symlink(source, link)
+
+
+def _cache_roles(roles_path, names, path):
+    """
+    Copy the given installed roles into the cache directory of an entry
+    and returns None.
+
+    :param roles_path: A string containing the directory the roles were
+     installed into.
+    :param names: A list of the names of the entry's roles.
+    :param path: A string containing the entry's cache directory.
+    :return: None
+    """
+    staging = tempfile.mkdtemp(dir=os.path.dirname(path))
+    try:
+        for name in names:
+            shutil.copytree(
+                os.path.join(roles_path, name),
+                os.path.join(staging, name),
+                symlinks=True,
+            )
+        try:
+            os.rename(staging, path)
+        except OSError:
+            # NOTE: Another scenario cached the same entry meanwhile.
+            if not os.path.isdir(path):
+                raise
+    finally:
+        if os.path.isdir(staging):
+            shutil.rmtree(staging)
+
+
+def _split_roles(roles_path, requirements):
+    """
+    Attribute the roles installed into the given directory to the role-file
+    entries they were installed for, and returns a list of lists of the role
+    names of each entry.
+
+    An entry is given its role and the roles its role depends on.  The roles
+    which can not be attributed, such as the ones of an entry whose name is
+    not known, are given to every entry.
+
+    :param roles_path: A string containing the directory the roles were
+     installed into.
+    :param requirements: A list of dicts or strings containing the role-file
+     entries.
+    :return: list
+    """
+    installed = set(os.listdir(roles_path)) if os.path.isdir(roles_path) else set()
+    roles = []
+    for requirement in requirements:
+        names = set()
+        pending = [_role_name(requirement)]
+        while pending:
+            name = pending.pop()
+            if name in installed and name not in names:
+                names.add(name)
+                pending.extend(_role_dependencies(os.path.join(roles_path, name)))
+        roles.append(names)
+
+    unattributed = installed.difference(*roles)
+
+    return [sorted(names | unattributed) for names in roles]
+
+
+def _role_name(requirement):
+    # the name ``ansible-galaxy`` installs a role-file entry, or a role
+    # dependency, as
+    try:
+        from ansible.playbook.role.requirement import RoleRequirement
+
+        return RoleRequirement.role_yaml_parse(requirement).get('name')
+    except Exception:
+        return None
+
+
+def _role_dependencies(role_directory):
+    for name in ['main.yml', 'main.yaml']:
+        filename = os.path.join(role_directory, 'meta', name)
+        if os.path.isfile(filename):
+            try:
+                with util.open_file(filename) as stream:
+                    meta = yaml.safe_load(stream)
+            except yaml.YAMLError:
+                return []
+            if not isinstance(meta, dict):
+                return []
+
+            return [_role_name(d) for d in meta.get('dependencies') or []]
+
+    return []
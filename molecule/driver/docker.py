@@ -23,6 +23,7 @@
 import os
 
 from molecule import logger
+from molecule import util
 from molecule.driver import base
 from molecule.util import sysexit_with_message
 
@@ -50,6 +51,7 @@ class Docker(base.Base):
             image: image_name:tag
             dockerfile: Dockerfile.j2
             pull: True|False
+            force: True|False
             pre_build_image: True|False
             registry:
               url: registry.example.com
@@ -136,6 +138,14 @@ class Docker(base.Base):
 
         $ pip install molecule[docker]
 
+    Images built from ``dockerfile`` are labelled with a fingerprint of the
+    rendered Dockerfile, its ``buildargs`` and the base image.  The build is
+    skipped when an image with a matching fingerprint already exists locally,
+    unless ``force`` is set, which defaults to false.  The base image is only
+    pulled when it is missing locally, unless ``pull`` is set.  The ``create``
+    output reports each build cache hit or miss, and ``molecule --debug list``
+    shows the status of the last ``create``.
+
     When pulling from a private registry, it is the user's discretion to decide
     whether to use hard-code strings or environment variables for passing
     credentials to molecule.
@@ -191,12 +201,31 @@ def default_safe_files(self):
     def default_ssh_connection_options(self):
         return []
 
+    @property
+    def image_cache_file(self):
+        return os.path.join(
+            self._config.scenario.ephemeral_directory, 'image_cache.yml'
+        )
+
     def login_options(self, instance_name):
         return {'instance': instance_name}
 
     def ansible_connection_options(self, instance_name):
         return {'ansible_connection': 'docker'}
 
+    def status(self):
+        """
+        Collects the instances state, prints the image build cache status of
+        the last ``create`` when debugging, and returns a list.
+
+        :returns: list
+        """
+        if self._config.debug and os.path.isfile(self.image_cache_file):
+            with util.open_file(self.image_cache_file) as stream:
+                util.print_debug('IMAGE BUILD CACHE', stream.read())
+
+        return super(Docker, self).status()
+
     def sanity_checks(self):
         """Implement Docker driver sanity checks."""
 
@@ -17,6 +17,9 @@
 
 import string
 
+import six
+import yaml
+
 
 class InvalidInterpolation(Exception):
     def __init__(self, string, place):
@@ -69,25 +72,123 @@ def __init__(self, templater, mapping):
         self.templater = templater
         self.mapping = mapping
 
-    def interpolate(self, string, keep_string=None):
+    def interpolate(self, string, keep_string=None, defer=False):
+        """
+        Interpolate the variables of the given string and returns a string.
+
+        :param string: A string containing the template.
+        :param keep_string: An optional string prefixing the variables which
+         are not interpolated.
+        :param defer: An optional bool to keep the result a template of its
+         own, where the kept variables and escaped dollars are left as written
+         and the dollars of substituted values are escaped, so interpolating
+         it again equals interpolating the given string with all variables.
+        :return: str
+        """
         try:
-            return self.templater(string).substitute(self.mapping, keep_string)
+            return self.templater(string).substitute(
+                self.mapping, keep_string, defer=defer
+            )
         except ValueError as e:
             raise InvalidInterpolation(string, e)
 
+    def interpolate_data(self, data, keep_string=None):
+        """
+        Interpolate the variables of the strings in the given parsed YAML
+        document, keys included, and returns a new document.
+
+        A value consisting of a single variable is typed the way YAML types a
+        plain scalar, as if the variable was interpolated before parsing.
+        Quoted values, parsed as a :class:`QuotedString` by :func:`load`, are
+        left strings.
+
+        :param data: A dict, list or scalar of a parsed YAML document.
+        :param keep_string: An optional string prefixing the variables which
+         are not interpolated.
+        :return: A new dict, list or scalar.
+        """
+        if isinstance(data, dict):
+            return {
+                self.interpolate_data(k, keep_string): self.interpolate_data(
+                    v, keep_string
+                )
+                for k, v in data.items()
+            }
+        if isinstance(data, list):
+            return [self.interpolate_data(v, keep_string) for v in data]
+        if not isinstance(data, six.string_types) or '$' not in data:
+            return data
+        if isinstance(data, QuotedString):
+            return self.interpolate(six.text_type(data), keep_string)
+
+        result = self.interpolate(data, keep_string)
+        if result != data and self._is_variable(data):
+            return _resolve_scalar(result)
+
+        return result
+
+    def _is_variable(self, string):
+        match = self.templater.pattern.match(string)
+
+        return bool(
+            match
+            and match.end() == len(string)
+            and (match.group('named') or match.group('braced'))
+        )
+
+
+class QuotedString(six.text_type):
+    """
+    A string parsed from a quoted or block scalar, which stays a string once
+    its variables are interpolated.
+    """
+
+
+class TemplateLoader(yaml.SafeLoader):
+    """
+    A YAML loader parsing the quoted or block scalars containing a variable
+    as a :class:`QuotedString`.
+    """
+
+    def construct_yaml_str(self, node):
+        value = super(TemplateLoader, self).construct_yaml_str(node)
+        if node.style and '$' in value:
+            return QuotedString(value)
+
+        return value
+
+
+TemplateLoader.add_constructor(
+    'tag:yaml.org,2002:str', TemplateLoader.construct_yaml_str
+)
+
 
 class TemplateWithDefaults(string.Template):
     idpattern = r'[_a-z][_a-z0-9]*(?::?-[^}]+)?'
 
     # Modified from python2.7/string.py
-    def substitute(self, mapping, keep_string):
+    def substitute(self, mapping, keep_string, defer=False):
         # Helper function for .sub()
         def convert(mo):
+            value = _convert(mo)
+            named = mo.group('named') or mo.group('braced')
+            if defer and named is not None and not _kept(named):
+                # the value of a variable is not a template
+                return value.replace(self.delimiter, self.delimiter * 2)
+
+            return value
+
+        def _kept(named):
+            return keep_string and named.startswith(keep_string)
+
+        def _convert(mo):
             # Check the most common path first.
             named = mo.group('named') or mo.group('braced')
             if named is not None:
                 # TODO(retr0h): This needs to be better handled.
-                if keep_string and named.startswith(keep_string):
+                if _kept(named):
+                    if defer:
+                        return mo.group(0)
                     return '$%s' % named
                 if ':-' in named:
                     var, _, default = named.partition(':-')
@@ -104,8 +205,18 @@ def convert(mo):
                 val = mapping.get(named, '')
                 return '%s' % (val,)
             if mo.group('escaped') is not None:
+                if defer:
+                    return mo.group(0)
                 return self.delimiter
             if mo.group('invalid') is not None:
                 self._invalid(mo)
 
         return self.pattern.sub(convert, self.template)
+
+
+def _resolve_scalar(value):
+    tag = yaml.resolver.Resolver().resolve(yaml.ScalarNode, value, (True, False))
+    if tag == 'tag:yaml.org,2002:str':
+        return value
+
+    return yaml.safe_load(value)
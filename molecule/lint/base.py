@@ -19,9 +19,16 @@
 #  DEALINGS IN THE SOFTWARE.
 
 import abc
+import json
 
+from molecule import logger
 from molecule import util
 
+LOG = logger.get_logger(__name__)
+
+# Fingerprints of the project lints which passed during this invocation.
+_LINTED = set()
+
 
 class Base(object):
     __metaclass__ = abc.ABCMeta
@@ -62,6 +69,57 @@ def execute(self):  # pragma: no cover
         """
         pass
 
+    def execute_once(self):
+        """
+        Executes ``cmd`` unless a lint with the same fingerprint already
+        passed during this invocation and returns None.
+
+        :return: None
+        """
+        if self.linted:
+            msg = 'Skipping, project already linted.'
+            LOG.warn(msg)
+            return
+
+        self.execute()
+        self.linted = True
+
+    @property
+    def linted(self):
+        """
+        Whether a lint with the same fingerprint already passed during this
+        invocation and returns a bool.
+
+        :return: bool
+        """
+        return self.fingerprint in _LINTED
+
+    @linted.setter
+    def linted(self, value):
+        if value:
+            _LINTED.add(self.fingerprint)
+        else:
+            _LINTED.discard(self.fingerprint)
+
+    @property
+    def fingerprint(self):
+        """
+        Identity of the lint's inputs, which are shared by every scenario of
+        the project, and returns a string.
+
+        :return: str
+        """
+        return json.dumps(
+            [
+                self._config.project_directory,
+                self.name,
+                self.enabled,
+                self.options,
+                self._config.config['lint']['env'],
+            ],
+            sort_keys=True,
+        )
+
     @property
     def name(self):
         """
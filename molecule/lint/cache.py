@@ -0,0 +1,224 @@
+#  Copyright (c) 2019 Red Hat, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+
+import hashlib
+import json
+import os
+
+import sh
+
+import molecule.scenario
+from molecule import logger
+from molecule import util
+
+LOG = logger.get_logger(__name__)
+
+
+class LintCache(object):
+    """
+    Results of a linter per file, persisted in Molecule's cache directory.
+
+    Results are keyed by the file's path and checked against its content.  A
+    separate cache is kept per linter name, version, options, configuration
+    files and scope, so changing any of those starts from an empty cache.
+    Saving merges the results into the cache on disk, which replaces the
+    results of the files of this run and drops those of removed files.
+    """
+
+    def __init__(self, name, version, options, config_files=(), scope=()):
+        """
+        Loads the cache of the given linter and returns None.
+
+        :param name: A string containing the name of the linter.
+        :param version: The version of the linter, as returned by
+         :func:`version`.
+        :param options: A dict containing the effective options of the linter.
+        :param config_files: An optional list of configuration files read by
+         the linter.
+        :param scope: An optional list of strings identifying what is linted,
+         such as the project directory and the scenario name.
+        :return: None
+        """
+        data = [name, version, options, list(scope)]
+        for filename in config_files:
+            if os.path.isfile(filename):
+                data.append(_digest(filename))
+        key = _sha256(json.dumps(data, sort_keys=True))
+        directory = molecule.scenario.ephemeral_directory('molecule_lint')
+
+        self._filename = os.path.join(directory, '{}-{}.json'.format(name, key))
+        self._results = self._load()
+        self._updated = {}
+
+    def partition(self, files):
+        """
+        Split the given files into the cached results and the files which
+        need to be linted and returns a tuple.
+
+        :param files: A list of files to lint.
+        :return: tuple
+        """
+        cached = {}
+        changed = []
+        for filename in files:
+            entry = self._results.get(filename)
+            if entry and entry['digest'] == _digest(filename):
+                cached[filename] = entry['result']
+            else:
+                changed.append(filename)
+
+        return cached, changed
+
+    def update(self, filename, result):
+        entry = {'digest': _digest(filename), 'result': result}
+        self._results[filename] = entry
+        self._updated[filename] = entry
+
+    def save(self):
+        """
+        Merge the results updated since the cache was loaded into the cache
+        on disk, drop the results of files which no longer exist, atomically
+        write it when it changed, and returns None.
+
+        Re-reading the cache right before writing it keeps the results saved
+        meanwhile by another run sharing it.
+
+        :return: None
+        """
+        saved = self._load()
+        results = dict(saved)
+        results.update(self._updated)
+        results = {k: v for k, v in results.items() if os.path.isfile(k)}
+        self._results = results
+        self._updated = {}
+        if results == saved:
+            return
+
+        util.write_file_atomically(self._filename, json.dumps(results))
+
+    def _load(self):
+        try:
+            with util.open_file(self._filename) as stream:
+                return json.load(stream)
+        except (IOError, ValueError):
+            return {}
+
+
+def execute(cache, command, files, parse, debug=False):
+    """
+    Lint the files which are not cached with the given command, replay the
+    results of all files in order, and returns the exit code.
+
+    :param cache: A LintCache object.
+    :param command: A ``sh.Command`` object, baked with the linter's options
+     and an output format reporting one diagnostic per line, prefixed with
+     the file's name.
+    :param files: A list of files to lint.
+    :param parse: A function receiving a file's diagnostics and returning
+     its exit code.
+    :param debug: An optional bool to toggle debug output.
+    :return: int
+    """
+    results, changed = cache.partition(files)
+    msg = 'Linting {} changed file(s), {} cached.'.format(len(changed), len(results))
+    LOG.info(msg)
+
+    if changed:
+        output = []
+        command = command.bake(
+            changed, _out=lambda line: output.append(line.rstrip('\n'))
+        )
+        try:
+            util.run_command(command, debug=debug)
+            exit_code = 0
+        except sh.ErrorReturnCode as e:
+            exit_code = e.exit_code
+
+        changed_results = {}
+        for filename in changed:
+            prefix = '{}:'.format(filename)
+            lines = [line for line in output if line.startswith(prefix)]
+            changed_results[filename] = {'code': parse(lines), 'output': lines}
+
+        # NOTE: A failure which can not be attributed to any file, such as a
+        # broken linter configuration, is reported as is and not cached.
+        if exit_code and not any(r['code'] for r in changed_results.values()):
+            for line in output:
+                LOG.out(line)
+
+            return exit_code
+
+        for filename, result in changed_results.items():
+            cache.update(filename, result)
+        results.update(changed_results)
+    cache.save()
+
+    code = 0
+    for filename in files:
+        for line in results[filename]['output']:
+            LOG.out(line)
+        code = code or results[filename]['code']
+
+    return code
+
+
+def version(name):
+    """
+    Identify the installed version of the given linter, without running it,
+    and returns a list.
+
+    The version of the distribution installed alongside Molecule is combined
+    with the path and the modification time of the executable on ``PATH``,
+    which is the one run, and is written again when it is reinstalled.
+
+    :param name: A string containing the name of the linter's distribution
+     and executable.
+    :return: list
+    """
+    try:
+        from importlib import metadata
+    except ImportError:
+        import importlib_metadata as metadata
+
+    try:
+        distribution_version = metadata.version(name)
+    except metadata.PackageNotFoundError:
+        distribution_version = None
+
+    executable = sh.which(name)
+    try:
+        mtime = os.stat(executable).st_mtime
+    except (TypeError, OSError):
+        mtime = None
+
+    return [distribution_version, executable, mtime]
+
+
+def _digest(filename):
+    with open(filename, 'rb') as f:
+        return _sha256(f.read())
+
+
+def _sha256(data):
+    if not isinstance(data, bytes):
+        data = data.encode('utf-8')
+
+    return hashlib.sha256(data).hexdigest()
@@ -18,6 +18,7 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
+import json
 import os
 
 import sh
@@ -25,6 +26,7 @@
 from molecule import logger
 from molecule import util
 from molecule.lint import base
+from molecule.lint import cache as lint_cache
 
 LOG = logger.get_logger(__name__)
 
@@ -95,12 +97,21 @@ def __init__(self, config):
         """
         super(Yamllint, self).__init__(config)
         self._yamllint_command = None
-        self._files = self._get_files()
+
+    @util.cached_property
+    def _files(self):
+        return self._get_files()
 
     @property
     def default_options(self):
         return {'s': True}
 
+    @property
+    def fingerprint(self):
+        return json.dumps(
+            [super(Yamllint, self).fingerprint, self._files], sort_keys=True
+        )
+
     @property
     def default_env(self):
         return util.merge_dicts(os.environ.copy(), self._config.env)
@@ -129,6 +140,14 @@ def execute(self):
         )
         LOG.info(msg)
 
+        if self._config.lint_cache:
+            exit_code = self._execute_incremental()
+            if exit_code:
+                util.sysexit(exit_code)
+            msg = 'Lint completed successfully.'
+            LOG.success(msg)
+            return
+
         try:
             util.run_command(self._yamllint_command, debug=self._config.debug)
             msg = 'Lint completed successfully.'
@@ -136,6 +155,38 @@ def execute(self):
         except sh.ErrorReturnCode as e:
             util.sysexit(e.exit_code)
 
+    def _execute_incremental(self):
+        """
+        Lint the files changed since their results were cached, replay the
+        cached results of the others, and returns the exit code.
+
+        :return: int
+        """
+        options = util.merge_dicts(self.options, {'format': 'parsable'})
+        config_files = ['.yamllint', '.yamllint.yaml', '.yamllint.yml']
+        if options.get('config-file'):
+            config_files.append(options['config-file'])
+        cache = lint_cache.LintCache(
+            self.name,
+            lint_cache.version('yamllint'),
+            options,
+            config_files,
+            [self._config.project_directory],
+        )
+        command = sh.yamllint.bake(options, _env=self.env, _err=LOG.error)
+        strict = options.get('s') or options.get('strict')
+
+        def _parse(lines):
+            if any('[error]' in line for line in lines):
+                return 1
+            if strict and lines:
+                return 2
+            return 0
+
+        return lint_cache.execute(
+            cache, command, self._files, _parse, debug=self._config.debug
+        )
+
     def _get_files(self):
         """
         Walk the project directory for tests and returns a list.
@@ -0,0 +1,363 @@
+#  Copyright (c) 2019 Red Hat, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+"""
+Compile a Cerberus schema into a function deciding if a document is valid.
+
+Cerberus interprets a schema anew for every document, building a child
+validator per mapping, sequence and item along the way, which makes
+validating configs with many platforms slow.  A compiled schema only answers
+whether Cerberus would report no errors, it answers ``False`` whenever it
+cannot tell, and the document is then validated by Cerberus, which reports
+the errors exactly as it always did.
+"""
+
+import collections
+import re
+
+import six
+
+try:
+    from collections.abc import Iterable, Mapping, Sequence
+except ImportError:
+    from collections import Iterable, Mapping, Sequence
+
+# The rules the compiler knows, any other rule of a schema makes it fall back
+# to Cerberus for every document.
+RULES = frozenset(
+    [
+        'allow_unknown',
+        'allowed',
+        'coerce',
+        'disallowed',
+        'keysrules',
+        'meta',
+        'molecule_env_var',
+        'nullable',
+        'readonly',
+        'regex',
+        'required',
+        'schema',
+        'type',
+        'unique',
+        'valuesrules',
+    ]
+)
+
+# The rules Cerberus still checks for a null value which is nullable.
+_NULL_CHECKED = ('disallowed', 'molecule_env_var', 'readonly', 'unique')
+
+# See ``Validator._validate_molecule_env_var`` of ``schema_v2``.
+_MOLECULE_ENV_VAR = re.compile(r'^[{$]+MOLECULE[_a-z0-9A-Z]+[}]*$')
+
+
+class UnsupportedSchema(Exception):
+    """ A schema uses a rule, or a form of a rule, the compiler does not know. """
+
+
+def compile_schema(schema, validator):
+    """
+    Compile the given schema and returns a function receiving a document,
+    which returns True when the validator reports no errors for it, and False
+    when it may report errors.
+
+    :param schema: A dict containing the Cerberus schema.
+    :param validator: A Cerberus ``Validator`` object providing the types and
+     the coercers of the rules.
+    :return: function
+    :raises: :class:`UnsupportedSchema` when the schema cannot be compiled.
+    """
+    check = _Compiler(validator).mapping(schema, validator.allow_unknown, ())
+
+    def is_valid(document):
+        if not isinstance(document, Mapping):
+            return False
+
+        try:
+            return check(document, _Context(document))
+        except Exception:
+            # whatever Cerberus makes of the document, it is its call
+            return False
+
+    return is_valid
+
+
+class _Context(object):
+    def __init__(self, root):
+        self.root = root
+        self.unique = {}
+
+
+class _Compiler(object):
+    def __init__(self, validator):
+        self._validator = validator
+
+    def mapping(self, schema, allow_unknown, path):
+        """
+        Compile the rules of the fields of a mapping and returns a function.
+
+        :param schema: A dict of the rules of each field.
+        :param allow_unknown: The ``allow_unknown`` setting of the mapping.
+        :param path: A tuple containing the fields leading to the mapping.
+        :return: function
+        """
+        if not isinstance(schema, Mapping):
+            raise UnsupportedSchema(schema)
+        if allow_unknown and not isinstance(allow_unknown, bool):
+            raise UnsupportedSchema(allow_unknown)
+
+        fields = {
+            field: self.field(rules, allow_unknown, path + (field,))
+            for field, rules in schema.items()
+        }
+        required = [
+            field for field, rules in schema.items() if rules.get('required') is True
+        ]
+
+        def check(mapping, context):
+            for field in required:
+                if field not in mapping:
+                    return False
+            for field, value in mapping.items():
+                field_check = fields.get(field)
+                if field_check is None:
+                    if not allow_unknown:
+                        return False
+                elif not field_check(value, context):
+                    return False
+
+            return True
+
+        return check
+
+    def field(self, rules, allow_unknown, path, normalize=True):
+        """
+        Compile the rules of a field and returns a function.
+
+        :param rules: A dict of the rules of the field.
+        :param allow_unknown: The ``allow_unknown`` setting of the mapping of
+         the field.
+        :param path: A tuple containing the fields leading to the field.
+        :param normalize: An optional bool, False when Cerberus does not
+         normalize the value, where coercion is not supported.
+        :return: function
+        """
+        if not isinstance(rules, Mapping):
+            raise UnsupportedSchema(rules)
+        unknown = set(rules) - RULES
+        if unknown:
+            raise UnsupportedSchema(unknown)
+        if 'coerce' in rules and not normalize:
+            raise UnsupportedSchema(rules)
+
+        coerce = self._coerce(rules['coerce']) if 'coerce' in rules else None
+        # a null value is only valid when no remaining rule could object
+        null_valid = rules.get('nullable', False) and not any(
+            rules.get(rule) for rule in _NULL_CHECKED
+        )
+        checks = [
+            check
+            for check in (
+                self._readonly(rules),
+                self._type(rules),
+                self._allowed(rules),
+                self._regex(rules),
+                self._molecule_env_var(rules),
+                self._unique(rules, path),
+                self._schema(rules, allow_unknown, path, normalize),
+                self._keysrules(rules, path),
+                self._valuesrules(rules, path),
+            )
+            if check is not None
+        ]
+
+        def check(value, context):
+            if coerce is not None:
+                value = coerce(value)
+            if value is None:
+                return null_valid
+            for c in checks:
+                if not c(value, context):
+                    return False
+
+            return True
+
+        return check
+
+    def _coerce(self, processor):
+        if isinstance(processor, six.string_types):
+            return getattr(self._validator, '_normalize_coerce_' + processor)
+        if callable(processor):
+            return processor
+        if isinstance(processor, Sequence):
+            processors = [self._coerce(p) for p in processor]
+
+            def coerce(value):
+                for p in processors:
+                    value = p(value)
+
+                return value
+
+            return coerce
+
+        raise UnsupportedSchema(processor)
+
+    def _readonly(self, rules):
+        if rules.get('readonly') or rules.get('disallowed'):
+            return lambda value, context: False
+
+    def _type(self, rules):
+        data_type = rules.get('type')
+        if not data_type:
+            return None
+        types = (data_type,) if isinstance(data_type, six.string_types) else data_type
+        definitions = []
+        for t in types:
+            definition = self._validator.types_mapping.get(t)
+            if definition is None:
+                raise UnsupportedSchema(t)
+            definitions.append((definition.included_types, definition.excluded_types))
+
+        if len(definitions) == 1:
+            (included, excluded), = definitions
+
+            def check(value, context):
+                return isinstance(value, included) and not isinstance(value, excluded)
+
+        else:
+
+            def check(value, context):
+                return any(
+                    isinstance(value, included) and not isinstance(value, excluded)
+                    for included, excluded in definitions
+                )
+
+        return check
+
+    def _allowed(self, rules):
+        if 'allowed' not in rules:
+            return None
+        allowed = rules['allowed']
+
+        def check(value, context):
+            if isinstance(value, six.string_types) or not isinstance(value, Iterable):
+                return value in allowed
+
+            return all(x in allowed for x in value)
+
+        return check
+
+    def _regex(self, rules):
+        pattern = rules.get('regex')
+        if pattern is None:
+            return None
+        if not pattern.endswith('$'):
+            pattern += '$'
+        regex = re.compile(pattern)
+
+        def check(value, context):
+            if not isinstance(value, six.string_types):
+                return True
+
+            return bool(regex.match(value))
+
+        return check
+
+    def _molecule_env_var(self, rules):
+        if not rules.get('molecule_env_var'):
+            return None
+
+        def check(value, context):
+            return isinstance(value, six.string_types) and not (
+                _MOLECULE_ENV_VAR.match(value)
+            )
+
+        return check
+
+    def _unique(self, rules, path):
+        if not rules.get('unique'):
+            return None
+        root_key, field = path[0], path[-1]
+
+        def check(value, context):
+            # count the values once per document, instead of once per item
+            key = (root_key, field)
+            if key not in context.unique:
+                data = (doc[field] for doc in context.root[root_key])
+                counts = collections.Counter(data)
+                context.unique[key] = all(c == 1 for c in counts.values())
+
+            return context.unique[key]
+
+        return check
+
+    def _schema(self, rules, allow_unknown, path, normalize):
+        schema = rules.get('schema')
+        if schema is None:
+            return None
+        # Cerberus decides on the form of the schema by the value, compile the
+        # forms the values take, the other one might not even be a schema
+        mapping_allow_unknown = rules.get('allow_unknown', allow_unknown)
+        compiled = {}
+
+        def compiled_form(form):
+            if form not in compiled:
+                if form == 'items':
+                    compiled[form] = self.field(schema, allow_unknown, path, normalize)
+                else:
+                    compiled[form] = self.mapping(schema, mapping_allow_unknown, path)
+
+            return compiled[form]
+
+        def check(value, context):
+            if isinstance(value, Sequence) and not isinstance(value, six.string_types):
+                items = compiled_form('items')
+                return all(items(item, context) for item in value)
+            if isinstance(value, Mapping):
+                return compiled_form('mapping')(value, context)
+
+            return True
+
+        return check
+
+    def _keysrules(self, rules, path):
+        if 'keysrules' not in rules:
+            return None
+        keys = self.field(rules['keysrules'], False, path, normalize=False)
+
+        def check(value, context):
+            if not isinstance(value, Mapping):
+                return True
+
+            return all(keys(k, context) for k in value)
+
+        return check
+
+    def _valuesrules(self, rules, path):
+        if 'valuesrules' not in rules:
+            return None
+        values = self.field(rules['valuesrules'], False, path, normalize=False)
+
+        def check(value, context):
+            if not isinstance(value, Mapping):
+                return True
+
+            return all(values(v, context) for v in value.values())
+
+        return check
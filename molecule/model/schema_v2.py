@@ -25,9 +25,16 @@
 
 import cerberus
 import cerberus.errors
+import six
 
 from molecule import interpolation, util
 from molecule.api import molecule_drivers
+from molecule.model import compiler
+
+try:
+    from functools import lru_cache
+except ImportError:
+    from backports.functools_lru_cache import lru_cache
 
 
 def coerce_env(env, keep_string, v):
@@ -201,6 +208,7 @@ def pre_validate_base_schema(env, keep_string):
         'schema': {
             'name': {'type': 'string'},
             'log': {'type': 'boolean'},
+            'executor': {'type': 'string', 'allowed': ['subprocess', 'worker']},
             'config_options': {
                 'type': 'dict',
                 'schema': {
@@ -368,6 +376,7 @@ def pre_validate_base_schema(env, keep_string):
                 'image': {'type': 'string'},
                 'dockerfile': {'type': 'string'},
                 'pull': {'type': 'boolean'},
+                'force': {'type': 'boolean'},
                 'pre_build_image': {'type': 'boolean'},
                 'registry': {
                     'type': 'dict',
@@ -678,50 +687,101 @@ def _validate_molecule_env_var(self, molecule_env_var, field, value):
 
 def pre_validate(stream, env, keep_string):
     data = util.safe_load(stream)
-
-    v = Validator(allow_unknown=True)
-    v.validate(data, pre_validate_base_schema(env, keep_string))
+    v, is_valid = _get_pre_validator(tuple(sorted(env.items())), keep_string)
+    if is_valid is not None and is_valid(data):
+        return {}
+    v.validate(data)
 
     return v.errors
 
 
 def validate(c):
+    """
+    Validate the given config with the schema of its dependency, driver and
+    verifier, and returns a dict of the errors.
+
+    The schema is compiled once per combination, and Cerberus only validates
+    configs the compiled schema does not prove valid, which reports the
+    errors.
+
+    :param c: A dict containing the config.
+    :return: dict
+    """
+    v, is_valid = _get_validator(
+        _name(c['dependency']), _name(c['driver']), _name(c['verifier'])
+    )
+    if is_valid is not None and is_valid(c):
+        return {}
+    v.validate(c)
+
+    return v.errors
+
+
+@lru_cache()
+def _get_validator(dependency_name, driver_name, verifier_name):
+    schema = _get_schema(dependency_name, driver_name, verifier_name)
+    v = Validator(schema, allow_unknown=True)
+    try:
+        is_valid = compiler.compile_schema(schema, v)
+    except compiler.UnsupportedSchema:
+        is_valid = None
+
+    return v, is_valid
+
+
+@lru_cache()
+def _get_pre_validator(env_items, keep_string):
+    schema = pre_validate_base_schema(dict(env_items), keep_string)
+    v = Validator(schema, allow_unknown=True)
+    try:
+        is_valid = compiler.compile_schema(schema, v)
+    except compiler.UnsupportedSchema:
+        is_valid = None
+
+    return v, is_valid
+
+
+def _name(section):
+    name = section['name']
+    # other names are not hashable, nor select a schema
+    if isinstance(name, six.string_types):
+        return name
+
+
+def _get_schema(dependency_name, driver_name, verifier_name):
     schema = copy.deepcopy(base_schema)
 
     util.merge_dicts(schema, base_schema)
 
     # Dependency
-    if c['dependency']['name'] == 'shell':
+    if dependency_name == 'shell':
         util.merge_dicts(schema, dependency_command_nullable_schema)
 
     # Driver
-    if c['driver']['name'] == 'docker':
+    if driver_name == 'docker':
         util.merge_dicts(schema, platforms_docker_schema)
-    elif c['driver']['name'] == 'podman':
+    elif driver_name == 'podman':
         util.merge_dicts(schema, platforms_podman_schema)
-    elif c['driver']['name'] == 'vagrant':
+    elif driver_name == 'vagrant':
         util.merge_dicts(schema, driver_vagrant_provider_section_schema)
         util.merge_dicts(schema, platforms_vagrant_schema)
-    elif c['driver']['name'] == 'lxd':
+    elif driver_name == 'lxd':
         util.merge_dicts(schema, platforms_lxd_schema)
-    elif c['driver']['name'] == 'linode':
+    elif driver_name == 'linode':
         util.merge_dicts(schema, platforms_linode_schema)
-    elif c['driver']['name'] == 'hetznercloud':
+    elif driver_name == 'hetznercloud':
         util.merge_dicts(schema, platforms_hetznercloud_schema)
 
     # Verifier
-    if c['verifier']['name'] == 'goss':
+    if verifier_name == 'goss':
         util.merge_dicts(schema, verifier_options_readonly_schema)
         util.merge_dicts(schema, verifier_goss_mutually_exclusive_schema)
-    elif c['verifier']['name'] == 'inspec':
+    elif verifier_name == 'inspec':
         util.merge_dicts(schema, verifier_options_readonly_schema)
         util.merge_dicts(schema, verifier_inspec_mutually_exclusive_schema)
-    elif c['verifier']['name'] == 'testinfra':
+    elif verifier_name == 'testinfra':
         util.merge_dicts(schema, verifier_testinfra_mutually_exclusive_schema)
-    elif c['verifier']['name'] == 'ansible':
+    elif verifier_name == 'ansible':
         util.merge_dicts(schema, verifier_ansible_mutually_exclusive_schema)
 
-    v = Validator(allow_unknown=True)
-    v.validate(c, schema)
-
-    return v.errors
+    return schema
@@ -0,0 +1,99 @@
+#  Copyright (c) 2019 Red Hat, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import cProfile
+import os
+import pstats
+import sys
+import time
+
+from multiprocessing import util as multiprocessing_util
+
+from molecule import logger
+from molecule import scenario
+
+LOG = logger.get_logger(__name__)
+
+TOP = int(os.environ.get('MOLECULE_PROFILE_TOP', '25'))
+
+_PROFILER = None
+
+
+def start():
+    """
+    Start profiling Molecule in the current process and returns None.
+
+    :return: None
+    """
+    global _PROFILER
+    _PROFILER = cProfile.Profile()
+    # processes forked for ``--jobs``, ``--overlap`` or the Ansible worker
+    # are not profiled, they only report to the parent through their results
+    multiprocessing_util.register_after_fork(_PROFILER, _forget)
+    _PROFILER.enable()
+
+
+def stop(top=TOP):
+    """
+    Stop profiling, write the collected statistics to the cache directory and
+    print the entries with the highest cumulative time, and returns None.
+
+    :param top: An int containing the number of entries printed.
+    :return: None
+    """
+    global _PROFILER
+    if _PROFILER is None:
+        return
+
+    _PROFILER.disable()
+    filename = _get_profile_file()
+    _PROFILER.dump_stats(filename)
+    _PROFILER = None
+
+    report(filename, top)
+
+
+def report(filename, top=TOP, stream=None):
+    """
+    Print the entries of the given statistics with the highest cumulative
+    time and returns None.
+
+    :param filename: A string containing the path of a ``.pstats`` file.
+    :param top: An int containing the number of entries printed.
+    :param stream: An optional file object to print to, standard output by
+     default.
+    :return: None
+    """
+    stats = pstats.Stats(filename, stream=stream or sys.stdout)
+    stats.sort_stats('cumulative').print_stats(top)
+    LOG.info('Profile written to {}'.format(filename))
+
+
+def _forget(profiler):
+    global _PROFILER
+    profiler.disable()
+    _PROFILER = None
+
+
+def _get_profile_file():
+    # one file per invocation, so runs can be compared with each other
+    name = 'profile-{}-{}.pstats'.format(time.strftime('%Y%m%dT%H%M%S'), os.getpid())
+
+    return os.path.join(scenario.ephemeral_directory('molecule'), name)
@@ -20,6 +20,7 @@
 
 import copy
 import collections
+import json
 import os
 import shutil
 
@@ -29,6 +30,7 @@
     from backports.functools_lru_cache import lru_cache
 
 from molecule import logger
+from molecule import trace
 from molecule import util
 from molecule.provisioner import base
 from molecule.provisioner import ansible_playbook
@@ -69,6 +71,23 @@ class Ansible(base.Base):
 
         Options do not affect the create and destroy actions.
 
+    Playbooks are executed by spawning ``ansible-playbook``.  The ``worker``
+    executor runs them through Ansible's Python API instead, in a long-lived
+    process started on first use, which saves importing Ansible and loading
+    its plugins again for every action of a sequence.
+
+    .. code-block:: yaml
+
+        provisioner:
+          name: ansible
+          executor: worker
+
+    .. note::
+
+        A worker is tied to the provisioner's environment and only runs one
+        playbook at a time.  Molecule falls back to ``ansible-playbook`` when
+        it cannot start a worker, such as within ``--jobs``.
+
     .. note::
 
         Molecule will remove any options matching '^[v]+$', and pass ``-vvv``
@@ -212,6 +231,8 @@ class Ansible(base.Base):
           $ephemeral_directory/library/:$project_directory/library/
         ANSIBLE_FILTER_PLUGINS:
           $ephemeral_directory/plugins/filters/:$project_directory/filter/plugins/
+        ANSIBLE_CALLBACK_PLUGINS:
+          $ephemeral_directory/plugins/callbacks/:$project_directory/plugins/callbacks/
 
     Environment variables can be passed to the provisioner.  Variables in this
     section which match the names above will be appened to the above defaults,
@@ -459,6 +480,23 @@ def default_env(self):
                         ),
                     ]
                 ),
+                'ANSIBLE_CALLBACK_PLUGINS': ':'.join(
+                    [
+                        self._get_callback_plugin_directory(),
+                        util.abs_path(
+                            os.path.join(
+                                self._config.scenario.ephemeral_directory,
+                                'plugins',
+                                'callbacks',
+                            )
+                        ),
+                        util.abs_path(
+                            os.path.join(
+                                self._config.project_directory, 'plugins', 'callbacks'
+                            )
+                        ),
+                    ]
+                ),
             },
         )
         env = util.merge_dicts(env, self._config.env)
@@ -473,6 +511,10 @@ def name(self):
     def ansible_args(self):
         return self._config.config['provisioner']['ansible_args']
 
+    @property
+    def executor(self):
+        return self._config.config['provisioner'].get('executor', 'subprocess')
+
     @property
     def config_options(self):
         return util.merge_dicts(
@@ -503,6 +545,7 @@ def env(self):
         roles_path = default_env['ANSIBLE_ROLES_PATH']
         library_path = default_env['ANSIBLE_LIBRARY']
         filter_plugins_path = default_env['ANSIBLE_FILTER_PLUGINS']
+        callback_plugins_path = default_env['ANSIBLE_CALLBACK_PLUGINS']
 
         try:
             path = self._absolute_path_for(env, 'ANSIBLE_ROLES_PATH')
@@ -522,9 +565,16 @@ def env(self):
         except KeyError:
             pass
 
+        try:
+            path = self._absolute_path_for(env, 'ANSIBLE_CALLBACK_PLUGINS')
+            callback_plugins_path = '{}:{}'.format(callback_plugins_path, path)
+        except KeyError:
+            pass
+
         env['ANSIBLE_ROLES_PATH'] = roles_path
         env['ANSIBLE_LIBRARY'] = library_path
         env['ANSIBLE_FILTER_PLUGINS'] = filter_plugins_path
+        env['ANSIBLE_CALLBACK_PLUGINS'] = callback_plugins_path
 
         return util.merge_dicts(default_env, env)
 
@@ -579,7 +629,7 @@ def inventory(self):
                     'molecule_file': "{{ lookup('env', 'MOLECULE_FILE') }}",
                     'molecule_ephemeral_directory': "{{ lookup('env', 'MOLECULE_EPHEMERAL_DIRECTORY') }}",
                     'molecule_scenario_directory': "{{ lookup('env', 'MOLECULE_SCENARIO_DIRECTORY') }}",
-                    'molecule_yml': "{{ lookup('file', molecule_file) | molecule_from_yaml }}",
+                    'molecule_yml': "{{ (molecule_ephemeral_directory ~ '/molecule_yml.json') | molecule_from_json }}",
                     'molecule_instance_config': "{{ lookup('env', 'MOLECULE_INSTANCE_CONFIG') }}",
                     'molecule_no_log': "{{ lookup('env', 'MOLECULE_NO_LOG') or not "
                     "molecule_yml.provisioner.log|default(False) | bool }}",
@@ -609,6 +659,24 @@ def inventory_directory(self):
     def inventory_file(self):
         return os.path.join(self.inventory_directory, 'ansible_inventory.yml')
 
+    @property
+    def molecule_yml_file(self):
+        return os.path.join(
+            self._config.scenario.ephemeral_directory, 'molecule_yml.json'
+        )
+
+    @property
+    def events_file(self):
+        # the callback plugin writes to the file the environment names, from
+        # the working directory of the playbook
+        filename = self.env.get('MOLECULE_EVENTS_FILE')
+        if filename:
+            return self.abs_path(filename)
+
+        return os.path.join(
+            self._config.scenario.ephemeral_directory, 'ansible_events.jsonl'
+        )
+
     @property
     def config_file(self):
         return os.path.join(self._config.scenario.ephemeral_directory, 'ansible.cfg')
@@ -737,7 +805,8 @@ def verify(self):
 
     def write_config(self):
         """
-        Writes the provisioner's config file to disk and returns None.
+        Writes the provisioner's config file, and the rendered Molecule file
+        served to playbooks as ``molecule_yml``, to disk and returns None.
 
         :return: None
         """
@@ -745,6 +814,7 @@ def write_config(self):
             self._get_config_template(), config_options=self.config_options
         )
         util.write_file(self.config_file, template)
+        self._write_molecule_yml()
 
     def manage_inventory(self):
         """
@@ -752,16 +822,67 @@ def manage_inventory(self):
 
         :returns: None
         """
-        self._write_inventory()
-        self._remove_vars()
-        if not self.links:
-            self._add_or_update_vars()
-        else:
-            self._link_or_update_vars()
+        with trace.span('Ansible.manage_inventory', 'inventory'):
+            self._write_inventory()
+            self._remove_vars()
+            if not self.links:
+                self._add_or_update_vars()
+            else:
+                self._link_or_update_vars()
+
+    def update_inventory(self):
+        """
+        Atomically replaces the inventory file, leaving the vars alone, and
+        returns None.  Playbooks reading the inventory meanwhile see either
+        the previous or the new file.
+
+        :returns: None
+        """
+        with trace.span('Ansible.update_inventory', 'inventory'):
+            self._verify_inventory()
+            content = util.molecule_prepender(util.safe_dump(self.inventory))
+            util.write_file_atomically(self.inventory_file, content)
+
+    def events(self):
+        """
+        Reads the events the bundled ``molecule_events`` callback plugin wrote
+        during the last playbook run one at a time, and returns a generator of
+        dicts.
+
+        :return: generator
+        """
+        if not os.path.exists(self.events_file):
+            return
+
+        with util.open_file(self.events_file) as stream:
+            for line in stream:
+                # the playbook may still be running, skip a partial line
+                if line.endswith('\n'):
+                    yield json.loads(line)
 
     def abs_path(self, path):
         return util.abs_path(os.path.join(self._config.scenario.directory, path))
 
+    def _write_molecule_yml(self):
+        """
+        Interpolate the Molecule file with the environment playbooks run
+        with, and write it to disk as JSON, so the ``molecule_from_json``
+        filter reads it once instead of parsing the Molecule file on each use.
+
+        :return: None
+        """
+        with util.open_file(self._config.molecule_file) as stream:
+            data = util.safe_load(
+                self._config._interpolate(stream.read(), self.env, None)
+            )
+
+        state = self._config.state
+        if 'platforms' in data and state.is_parallel:
+            data['platforms'] = util._parallelize_platforms(data, state.run_uuid)
+
+        with util.open_file(self.molecule_yml_file, 'w') as stream:
+            json.dump(data, stream)
+
     def _add_or_update_vars(self):
         """
         Creates host and/or group vars and returns None.
@@ -897,5 +1018,8 @@ def _get_libraries_directory(self):
     def _get_filter_plugin_directory(self):
         return util.abs_path(os.path.join(self._get_plugin_directory(), 'filters'))
 
+    def _get_callback_plugin_directory(self):
+        return util.abs_path(os.path.join(self._get_plugin_directory(), 'callbacks'))
+
     def _absolute_path_for(self, env, key):
         return ':'.join([self.abs_path(p) for p in env[key].split(':')])
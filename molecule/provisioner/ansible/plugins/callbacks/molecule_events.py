@@ -0,0 +1,158 @@
+#  Copyright (c) 2019 Red Hat, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+
+import json
+import os
+import time
+
+from ansible.plugins.callback import CallbackBase
+
+DOCUMENTATION = """
+    callback: molecule_events
+    type: aggregate
+    short_description: Write task results as JSON events for Molecule
+    description:
+      - Writes one JSON document per line for the start of the playbook and
+        of every task, for the result of every task on every host, and for
+        the final stats of the playbook.  Lines are flushed as they are
+        written, so the file can be consumed while the playbook runs.
+      - Does nothing outside of a Molecule run.
+    options:
+      events_file:
+        description: Path of the file receiving the events, relative to the
+          scenario's directory.  Defaults to ansible_events.jsonl in the
+          scenario's ephemeral directory.
+        env:
+          - name: MOLECULE_EVENTS_FILE
+"""
+
+
+def events_file():
+    """
+    Determine the file receiving the events and returns a string, or None
+    when not running under Molecule.
+
+    :return: str
+    """
+    filename = os.environ.get('MOLECULE_EVENTS_FILE')
+    if filename:
+        return filename
+
+    ephemeral_directory = os.environ.get('MOLECULE_EPHEMERAL_DIRECTORY')
+    if ephemeral_directory:
+        return os.path.join(ephemeral_directory, 'ansible_events.jsonl')
+
+
+class CallbackModule(CallbackBase):
+    CALLBACK_VERSION = 2.0
+    CALLBACK_TYPE = 'aggregate'
+    CALLBACK_NAME = 'molecule_events'
+    CALLBACK_NEEDS_WHITELIST = False
+
+    def __init__(self, *args, **kwargs):
+        super(CallbackModule, self).__init__(*args, **kwargs)
+        self._filename = events_file()
+        self._stream = None
+        self._play = None
+        self._task_start = {}
+        self._host_start = {}
+
+    def v2_playbook_on_start(self, playbook):
+        if self._filename:
+            self._stream = open(self._filename, 'w')
+        self._emit('playbook_start', playbook=playbook._file_name)
+
+    def v2_playbook_on_play_start(self, play):
+        self._play = play.get_name().strip()
+
+    def v2_playbook_on_task_start(self, task, is_conditional):
+        self._start_task(task)
+
+    def v2_playbook_on_handler_task_start(self, task):
+        self._start_task(task)
+
+    def v2_runner_on_start(self, host, task):
+        self._host_start[(host.get_name(), task._uuid)] = time.time()
+
+    def v2_runner_on_ok(self, result):
+        self._end_task(result)
+
+    def v2_runner_on_failed(self, result, ignore_errors=False):
+        self._end_task(result, failed=True, ignored=ignore_errors)
+
+    def v2_runner_on_skipped(self, result):
+        self._end_task(result, skipped=True)
+
+    def v2_runner_on_unreachable(self, result):
+        self._end_task(result, failed=True, unreachable=True)
+
+    def v2_playbook_on_stats(self, stats):
+        hosts = sorted(stats.processed.keys())
+        summary = {host: stats.summarize(host) for host in hosts}
+        self._emit('playbook_end', stats=summary)
+        if self._stream:
+            self._stream.close()
+            self._stream = None
+
+    def _start_task(self, task):
+        start = time.time()
+        self._task_start[task._uuid] = start
+        self._emit(
+            'task_start',
+            play=self._play,
+            task=task.get_name().strip(),
+            id=task._uuid,
+            time=start,
+        )
+
+    def _end_task(
+        self, result, failed=False, skipped=False, unreachable=False, ignored=False
+    ):
+        host = result._host.get_name()
+        task = result._task
+        end = time.time()
+        start = self._host_start.pop(
+            (host, task._uuid), self._task_start.get(task._uuid, end)
+        )
+        self._emit(
+            'task_end',
+            play=self._play,
+            task=task.get_name().strip(),
+            id=task._uuid,
+            host=host,
+            start=start,
+            end=end,
+            duration=end - start,
+            changed=bool(result._result.get('changed', False)),
+            failed=failed,
+            skipped=skipped,
+            unreachable=unreachable,
+            ignored=ignored,
+        )
+
+    def _emit(self, event, **kwargs):
+        if not self._stream:
+            return
+
+        kwargs['event'] = event
+        kwargs.setdefault('time', time.time())
+        self._stream.write(json.dumps(kwargs, sort_keys=True) + '\n')
+        self._stream.flush()
@@ -18,12 +18,20 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
+import copy
+import hashlib
+import json
 import os
 
+from ansible.errors import AnsibleFilterError
+
 from molecule import config
 from molecule import interpolation
 from molecule import util
 
+# The files read by ``from_json``, with their modification time and size.
+_JSON_FILES = {}
+
 
 def from_yaml(data):
     """
@@ -48,6 +56,36 @@ def from_yaml(data):
     return loaded_data
 
 
+def from_json(filename):
+    """
+    Load the given JSON file, unless already loaded and unchanged, and return
+    its data.
+
+    Currently, this is used to read the `molecule.yml` Molecule rendered to
+    the ephemeral directory before running the playbook.  Unlike the result
+    of a lookup, the data is not marked unsafe, so Ansible templates it.
+
+    :return: dict
+    """
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        msg = (
+            "Unable to find '{}', it is written by Molecule before running "
+            'a playbook.'
+        ).format(filename)
+        raise AnsibleFilterError(msg)
+
+    key = (stat.st_mtime, stat.st_size)
+    cached = _JSON_FILES.get(filename)
+    if cached is None or cached[0] != key:
+        with open(filename) as stream:
+            cached = (key, json.load(stream))
+        _JSON_FILES[filename] = cached
+
+    return copy.deepcopy(cached[1])
+
+
 def to_yaml(data):
     return str(util.safe_dump(data))
 
@@ -67,6 +105,35 @@ def get_docker_networks(data):
     return network_list
 
 
+def image_fingerprint(dockerfile, buildargs=None, base_image_id=None):
+    """
+    Fingerprint the inputs of a Docker image build and return a string.
+
+    The fingerprint covers the rendered Dockerfile, the build arguments and
+    the id of the base image, so a change to any of them yields a new
+    fingerprint.
+
+    :return: str
+    """
+    data = json.dumps(
+        [dockerfile, buildargs or {}, base_image_id or ''], sort_keys=True
+    )
+
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+def image_label(image, label):
+    """
+    Return the value of the given label of an inspected Docker image, or an
+    empty string when the image or label does not exist.
+
+    :return: str
+    """
+    labels = (image or {}).get('Config', {}).get('Labels') or {}
+
+    return labels.get(label, '')
+
+
 def _parallelize_config(data):
     if 'platforms' not in data:
         return data
@@ -82,7 +149,10 @@ class FilterModule(object):
     def filters(self):
         return {
             'molecule_from_yaml': from_yaml,
+            'molecule_from_json': from_json,
             'molecule_to_yaml': to_yaml,
             'molecule_header': header,
             'molecule_get_docker_networks': get_docker_networks,
+            'molecule_image_fingerprint': image_fingerprint,
+            'molecule_image_label': image_label,
         }
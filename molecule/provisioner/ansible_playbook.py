@@ -18,10 +18,16 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
+from __future__ import print_function
+
+import os
+
 import sh
 
 from molecule import logger
+from molecule import trace
 from molecule import util
+from molecule.provisioner import ansible_worker
 
 LOG = logger.get_logger(__name__)
 
@@ -86,13 +92,29 @@ def execute(self):
         """
         Executes ``ansible-playbook`` and returns a string.
 
+        The output of runs without ``out`` and ``err`` functions is written to
+        a log file of the run in the ephemeral directory, rather than kept in
+        memory, and only reported when the run fails.  Such runs return an empty string,
+        use the provisioner's events to inspect the results.
+
         :return: str
         """
         if self._ansible_command is None:
             self.bake()
 
+        # the events of a previous run must not be mistaken for the ones of
+        # this run, a syntax check does not emit any, and may run alongside
+        # other playbooks
+        events_file = self._config.provisioner.events_file
+        if not self._cli.get('syntax-check') and os.path.isfile(events_file):
+            os.remove(events_file)
+
         try:
             self._config.driver.sanity_checks()
+            if self._use_worker():
+                return self._execute_in_worker()
+            if self._quiet:
+                return self._execute_quietly()
             cmd = util.run_command(self._ansible_command, debug=self._config.debug)
             return cmd.stdout.decode('utf-8')
         except sh.ErrorReturnCode as e:
@@ -120,3 +142,77 @@ def add_env_arg(self, name, value):
         :return: None
         """
         self._env[name] = value
+
+    @property
+    def _quiet(self):
+        return self._out is None and self._err is None
+
+    @property
+    def _log_file(self):
+        # playbooks of a scenario may run alongside each other, from forked
+        # processes, each run gets a file of its own
+        name = os.path.splitext(os.path.basename(self._playbook or ''))[0]
+        filename = 'ansible-playbook-{}-{}.log'.format(name, os.getpid())
+
+        return os.path.join(self._config.scenario.ephemeral_directory, filename)
+
+    def _use_worker(self):
+        return (
+            self._config.provisioner.executor == 'worker' and ansible_worker.can_start()
+        )
+
+    def _execute_quietly(self):
+        """
+        Executes the baked command writing its output to the log file and
+        returns an empty string.
+
+        :return: str
+        """
+        try:
+            with util.open_file(self._log_file, 'w') as stream:
+                cmd = self._ansible_command.bake(_out=stream, _err=stream)
+                try:
+                    util.run_command(cmd, debug=self._config.debug)
+                    return ''
+                except sh.ErrorReturnCode as e:
+                    exit_code = e.exit_code
+
+            self._exit_with_log_file(exit_code)
+        finally:
+            self._remove_log_file()
+
+    def _execute_in_worker(self):
+        """
+        Executes the baked command in a long-lived Ansible worker and returns
+        an empty string.
+
+        :return: str
+        """
+        if self._config.debug:
+            util.print_environment_vars(self._env)
+            util.print_debug('COMMAND', str(self._ansible_command))
+            print()
+
+        try:
+            with trace.span('ansible-playbook', 'worker'):
+                exit_code = ansible_worker.run(
+                    self._ansible_command, self._log_file, out=self._out
+                )
+            if exit_code:
+                if self._quiet:
+                    self._exit_with_log_file(exit_code)
+                util.sysexit_with_message('', exit_code)
+        finally:
+            self._remove_log_file()
+
+        return ''
+
+    def _exit_with_log_file(self, exit_code):
+        with util.open_file(self._log_file) as stream:
+            util.sysexit_with_message(stream.read(), exit_code)
+
+    def _remove_log_file(self):
+        try:
+            os.remove(self._log_file)
+        except OSError:
+            pass
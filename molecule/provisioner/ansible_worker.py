@@ -0,0 +1,273 @@
+#  Copyright (c) 2019 Red Hat, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+from __future__ import print_function
+
+import json
+import multiprocessing
+import os
+import sys
+import traceback
+
+from distutils.version import LooseVersion
+from multiprocessing import util as multiprocessing_util
+
+from molecule import logger
+from molecule import util
+
+LOG = logger.get_logger(__name__)
+
+# Starting ``ansible-playbook`` pays for the interpreter start up, importing
+# Ansible and loading its plugins on every action of a sequence.  A worker is
+# forked once and keeps all of that around, each playbook only re-reads the
+# inventory and the playbook itself.  Ansible reads its configuration from the
+# environment when first imported, so a worker serves a single environment.
+_WORKERS = {}
+
+
+def can_start():
+    """
+    Determine if a worker can be started from the current process and returns
+    a bool.
+
+    :return: bool
+    """
+    # pool workers, such as the ones used for ``--jobs``, are daemonic and
+    # may not start child processes of their own
+    return not multiprocessing.current_process().daemon
+
+
+def run(cmd, log_file, out=None):
+    """
+    Execute the given ``ansible-playbook`` command in the worker for its
+    environment, starting one when needed, and returns the exit code.
+
+    :param cmd: A baked ``sh.Command`` object of ``ansible-playbook``.
+    :param log_file: A string containing the path of the file collecting the
+     output of the playbook.
+    :param out: An optional function to process each line of output.
+    :return: int
+    """
+    # WARN: Uses internal ``sh`` data structures to dig the arguments, the
+    # environment and the working directory out of the ``sh.command`` object.
+    args = [_to_text(arg) for arg in cmd._partial_baked_args]
+    env = dict(cmd._partial_call_args.get('env') or os.environ)
+    # ``sh`` runs commands on a TTY, keep the colors it gets Ansible to use
+    if sys.stdout.isatty():
+        env.setdefault('ANSIBLE_FORCE_COLOR', 'true')
+    cwd = cmd._partial_call_args.get('cwd') or os.getcwd()
+
+    return _get_worker(env).run(args, cwd, log_file, out=out)
+
+
+def shutdown():
+    """
+    Stop all running workers and returns None.
+
+    :return: None
+    """
+    for key in list(_WORKERS):
+        _WORKERS.pop(key).stop()
+
+
+def _get_worker(env):
+    key = json.dumps(env, sort_keys=True)
+    worker = _WORKERS.get(key)
+    if worker is None or not worker.alive:
+        # an environment is only used by a single scenario at a time, do not
+        # keep the workers of previous ones around
+        shutdown()
+        worker = Worker(env)
+        _WORKERS[key] = worker
+
+    return worker
+
+
+class Worker(object):
+    def __init__(self, env):
+        """
+        Fork a process executing playbooks in the given environment and
+        returns None.
+
+        :param env: A dict containing the environment of the worker.
+        :return: None
+        """
+        sys.stdout.flush()
+        sys.stderr.flush()
+        self._conn, child_conn = multiprocessing.Pipe()
+        self._process = multiprocessing.Process(target=_serve, args=(child_conn, env))
+        # Ansible forks processes of its own, which daemonic ones cannot
+        self._process.daemon = False
+        self._process.start()
+        child_conn.close()
+
+    @property
+    def alive(self):
+        return self._process.is_alive()
+
+    def run(self, args, cwd, log_file, out=None):
+        """
+        Execute ``ansible-playbook`` with the given arguments and returns the
+        exit code.
+
+        :param args: A list of arguments passed to ``ansible-playbook``.
+        :param cwd: A string containing the working directory of the run.
+        :param log_file: A string containing the path of the file collecting
+         the output of the playbook.
+        :param out: An optional function to process each line of output.
+        :return: int
+        """
+        # create the file before following it
+        with util.open_file(log_file, 'w'):
+            pass
+        self._conn.send((args, cwd, log_file))
+        if out:
+            self._follow(log_file, out)
+
+        try:
+            return self._conn.recv()
+        except EOFError:
+            self._process.join()
+            exit_code = self._process.exitcode or 1
+            msg = 'The Ansible worker exited unexpectedly ({}).\n'.format(exit_code)
+            with util.open_file(log_file, 'a') as stream:
+                stream.write(msg)
+            if out:
+                out(msg)
+
+            return exit_code
+
+    def _follow(self, log_file, out):
+        # pass complete lines, like ``sh`` does, until the run finishes
+        with util.open_file(log_file) as stream:
+            pending = ''
+            while True:
+                done = self._conn.poll(0.1)
+                pending += stream.read()
+                lines = pending.split('\n')
+                pending = lines.pop()
+                for line in lines:
+                    out(line + '\n')
+                if done:
+                    break
+            if pending:
+                out(pending)
+
+    def stop(self):
+        """
+        Ask the worker to exit, and returns None.
+
+        :return: None
+        """
+        if self.alive:
+            try:
+                self._conn.send(None)
+            except (IOError, OSError):
+                pass
+            self._process.join(5)
+            if self._process.is_alive():
+                self._process.terminate()
+        self._conn.close()
+
+
+def _serve(conn, env):
+    os.environ.clear()
+    os.environ.update(env)
+
+    while True:
+        try:
+            request = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+        if request is None:
+            break
+
+        args, cwd, log_file = request
+        with util.redirect_output(log_file):
+            exit_code = _run_playbook(args, cwd)
+        conn.send(exit_code)
+
+
+def _run_playbook(args, cwd):
+    """
+    Run ``ansible-playbook`` in the current process and returns its exit
+    code, mapping errors the same way the ``ansible-playbook`` script does.
+
+    :param args: A list of arguments passed to ``ansible-playbook``.
+    :param cwd: A string containing the working directory of the run.
+    :return: int
+    """
+    from ansible import errors
+    from ansible import release
+    from ansible.cli.playbook import PlaybookCLI
+
+    os.chdir(cwd)
+    _reset_cli_args()
+    try:
+        cli = PlaybookCLI(['ansible-playbook'] + list(args))
+        # starting with 2.8 ``run`` parses the arguments itself
+        if LooseVersion(release.__version__) < LooseVersion('2.8'):
+            cli.parse()
+        return cli.run() or 0
+    except errors.AnsibleOptionsError as e:
+        _error(e)
+        return 5
+    except errors.AnsibleParserError as e:
+        _error(e)
+        return 4
+    except errors.AnsibleError as e:
+        _error(e)
+        return 1
+    except KeyboardInterrupt:
+        _error('User interrupted execution')
+        return 99
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else 1
+    except Exception as e:
+        _error('Unexpected Exception, this is probably a bug: {}'.format(e))
+        traceback.print_exc()
+        return 250
+
+
+def _reset_cli_args():
+    try:
+        from ansible.utils.context_objects import GlobalCLIArgs
+    except ImportError:
+        return
+
+    # WARN: Starting with 2.8 the parsed arguments are kept in a singleton,
+    # forget the ones of the previous playbook.
+    GlobalCLIArgs._Singleton__instance = None
+
+
+def _to_text(arg):
+    if isinstance(arg, bytes):
+        return arg.decode('utf-8')
+
+    return arg
+
+
+def _error(msg):
+    print('ERROR! {}'.format(msg), file=sys.stderr)
+
+
+# stop the workers before ``multiprocessing`` waits for its non-daemonic
+# children at exit
+multiprocessing_util.Finalize(None, shutdown, exitpriority=10)
@@ -32,6 +32,13 @@
 from molecule import util
 
 LOG = logger.get_logger(__name__)
+# Sequence actions which do not need instances, mapped to the actions which
+# must have completed before they may start.  When steps are overlapped,
+# these run alongside the instance lifecycle.
+CONCURRENT_ACTIONS = {'lint': ['dependency'], 'syntax': ['dependency']}
+# Instance lifecycle actions which do not need the results of concurrent
+# actions started before them.  Any other action waits for all earlier steps.
+OVERLAPPABLE_ACTIONS = ['cleanup', 'destroy', 'create', 'prepare']
 
 
 class Scenario(object):
@@ -242,6 +249,16 @@ def sequence(self):
             # TODO(retr0h): May change this handling in the future.
             return []
 
+    @property
+    def sequence_graph(self):
+        """
+        Compile the scenario's sequence into a graph of steps and returns a
+        list.
+
+        :return: list
+        """
+        return sequence_graph(self.sequence)
+
     def _setup(self):
         """
          Prepare the scenario for Molecule and returns None.
@@ -252,6 +269,41 @@ def _setup(self):
             os.makedirs(self.inventory_directory)
 
 
+def sequence_graph(sequence):
+    """
+    Compile a sequence into a list of ``(action, prerequisites)`` tuples, where
+    ``prerequisites`` is the set of indexes of the steps which must complete
+    before the action may start.
+
+    Actions listed in ``CONCURRENT_ACTIONS`` only wait for the most recent
+    occurrence of their declared prerequisites.  Any other action waits for
+    the previous non-concurrent action, and unless it is listed in
+    ``OVERLAPPABLE_ACTIONS``, for every step before it.
+
+    :param sequence: A list of actions.
+    :return: list
+    """
+    graph = []
+    latest = {}
+    previous = None
+    for index, action in enumerate(sequence):
+        if action in CONCURRENT_ACTIONS:
+            prerequisites = set(
+                latest[a] for a in CONCURRENT_ACTIONS[action] if a in latest
+            )
+        elif action in OVERLAPPABLE_ACTIONS:
+            prerequisites = set() if previous is None else set([previous])
+        else:
+            prerequisites = set(range(index))
+
+        if action not in CONCURRENT_ACTIONS:
+            previous = index
+        latest[action] = index
+        graph.append((action, prerequisites))
+
+    return graph
+
+
 def ephemeral_directory(path=None):
     """
     Returns temporary directory to be used by molecule. Molecule users should
@@ -0,0 +1,36 @@
+#  Copyright (c) 2019 Red Hat, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+"""
+Settings read from ``MOLECULE_`` environment variables.
+
+They are kept apart from :mod:`molecule.config`, so the CLI reads the
+defaults of its options without importing every subsystem of Molecule.
+"""
+
+import os
+
+from ansible.module_utils.parsing.convert_bool import boolean
+
+MOLECULE_DEBUG = boolean(os.environ.get('MOLECULE_DEBUG', 'False'))
+MOLECULE_LINT_CACHE = boolean(os.environ.get('MOLECULE_LINT_CACHE', 'False'))
+MOLECULE_CONFIG_CACHE = boolean(os.environ.get('MOLECULE_CONFIG_CACHE', 'True'))
+MOLECULE_TIMINGS = boolean(os.environ.get('MOLECULE_TIMINGS', 'False'))
+MOLECULE_TRACE = boolean(os.environ.get('MOLECULE_TRACE', 'False'))
+MOLECULE_PROFILE = boolean(os.environ.get('MOLECULE_PROFILE', 'False'))
@@ -18,25 +18,74 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
+import importlib
 import os
 
 import click
-import click_completion
 import colorama
 
 import molecule
-from molecule import command
-from molecule.config import MOLECULE_DEBUG
+import molecule.trace
 from molecule.logger import should_do_markup
+from molecule.settings import MOLECULE_CONFIG_CACHE
+from molecule.settings import MOLECULE_DEBUG
+from molecule.settings import MOLECULE_LINT_CACHE
+from molecule.settings import MOLECULE_PROFILE
+from molecule.settings import MOLECULE_TIMINGS
+from molecule.settings import MOLECULE_TRACE
 
-click_completion.init()
+# the completion of click_completion is only needed when the shell asks for it
+if os.environ.get('_MOLECULE_COMPLETE'):
+    import click_completion
+
+    click_completion.init()
 colorama.init(autoreset=True, strip=not should_do_markup())
 
 LOCAL_CONFIG = os.path.expanduser('~/.config/molecule/config.yml')
 ENV_FILE = '.env.yml'
 
+# The subcommands and the modules defining them, which are imported when the
+# subcommand runs, instead of importing all of Molecule to start any of them.
+COMMANDS = {
+    'check': 'molecule.command.check',
+    'cleanup': 'molecule.command.cleanup',
+    'converge': 'molecule.command.converge',
+    'create': 'molecule.command.create',
+    'daemon': 'molecule.command.daemon',
+    'dependency': 'molecule.command.dependency',
+    'destroy': 'molecule.command.destroy',
+    'drivers': 'molecule.command.drivers',
+    'idempotence': 'molecule.command.idempotence',
+    'init': 'molecule.command.init.init',
+    'lint': 'molecule.command.lint',
+    'list': 'molecule.command.list',
+    'login': 'molecule.command.login',
+    'matrix': 'molecule.command.matrix',
+    'prepare': 'molecule.command.prepare',
+    'side-effect': 'molecule.command.side_effect',
+    'syntax': 'molecule.command.syntax',
+    'test': 'molecule.command.test',
+    'verify': 'molecule.command.verify',
+    'watch': 'molecule.command.watch',
+}
+
+
+class LazyGroup(click.Group):
+    """ A group importing the module of a subcommand when it is used. """
+
+    def list_commands(self, ctx):
+        return sorted(set(self.commands) | set(COMMANDS))
+
+    def get_command(self, ctx, name):
+        if name not in self.commands and name in COMMANDS:
+            module = importlib.import_module(COMMANDS[name])
+            attribute = name.replace('-', '_')
+            self.add_command(getattr(module, attribute), name)
+
+        return super(LazyGroup, self).get_command(ctx, name)
 
-@click.group()
+
+@click.group(cls=LazyGroup)
 @click.option(
     '--debug/--no-debug',
     default=MOLECULE_DEBUG,
@@ -58,9 +107,53 @@
     default=ENV_FILE,
     help=('The file to read variables from when rendering molecule.yml. ' '(.env.yml)'),
 )
+@click.option(
+    '--lint-cache/--no-lint-cache',
+    default=MOLECULE_LINT_CACHE,
+    help=(
+        'Enable or disable caching lint results per file, so only changed '
+        'files are linted. Default is disabled.'
+    ),
+)
+@click.option(
+    '--config-cache/--no-config-cache',
+    default=MOLECULE_CONFIG_CACHE,
+    help=(
+        'Enable or disable caching the validated config of each scenario, '
+        'which is used while the config files and the variables they '
+        'reference are unchanged. Default is enabled.'
+    ),
+)
+@click.option(
+    '--timings/--no-timings',
+    default=MOLECULE_TIMINGS,
+    help=(
+        'Enable or disable reporting the slowest steps and Ansible tasks at '
+        'the end of the run. Default is disabled.'
+    ),
+)
+@click.option(
+    '--trace/--no-trace',
+    default=MOLECULE_TRACE,
+    help=(
+        'Enable or disable writing a Chrome trace of the run, which trace '
+        'viewers such as Perfetto load. Default is disabled.'
+    ),
+)
+@click.option(
+    '--profile/--no-profile',
+    default=MOLECULE_PROFILE,
+    help=(
+        'Enable or disable profiling Molecule with cProfile, writing the '
+        'statistics to the cache directory and printing the top entries by '
+        'cumulative time. Default is disabled.'
+    ),
+)
 @click.version_option(version=molecule.__version__)
 @click.pass_context
-def main(ctx, debug, base_config, env_file):  # pragma: no cover
+def main(
+    ctx, debug, base_config, env_file, lint_cache, config_cache, timings, trace, profile
+):  # pragma: no cover
     """
     \b
      _____     _             _
@@ -79,23 +172,14 @@ def main(ctx, debug, base_config, env_file):  # pragma: no cover
     ctx.obj['args']['debug'] = debug
     ctx.obj['args']['base_config'] = base_config
     ctx.obj['args']['env_file'] = env_file
+    ctx.obj['args']['lint_cache'] = lint_cache
+    ctx.obj['args']['config_cache'] = config_cache
+    ctx.obj['args']['timings'] = timings
+    ctx.obj['args']['trace'] = trace
+    if trace:
+        molecule.trace.enable()
+    if profile:
+        from molecule import profiling
 
-
-main.add_command(command.cleanup.cleanup)
-main.add_command(command.check.check)
-main.add_command(command.converge.converge)
-main.add_command(command.create.create)
-main.add_command(command.dependency.dependency)
-main.add_command(command.destroy.destroy)
-main.add_command(command.drivers.drivers)
-main.add_command(command.idempotence.idempotence)
-main.add_command(command.init.init)
-main.add_command(command.lint.lint)
-main.add_command(command.list.list)
-main.add_command(command.login.login)
-main.add_command(command.matrix.matrix)
-main.add_command(command.prepare.prepare)
-main.add_command(command.side_effect.side_effect)
-main.add_command(command.syntax.syntax)
-main.add_command(command.test.test)
-main.add_command(command.verify.verify)
+        profiling.start()
+        ctx.call_on_close(profiling.stop)
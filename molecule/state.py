@@ -18,9 +18,12 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
+import contextlib
+import json
 import os
 
 from molecule import logger
+from molecule import trace
 from molecule import util
 
 LOG = logger.get_logger(__name__)
@@ -49,7 +52,10 @@ class State(object):
     throughout a given Molecule config.  The initial state is serialized to
     disk if the file does not exist, otherwise is deserialized from the
     existing state file.  Changes made to the object are immediately
-    serialized.
+    serialized, unless they are made within a :meth:`transaction`.
+
+    The state file is written as JSON, which YAML parsers read as well, and is
+    replaced at once, so it is never left partially written.
 
     State is not a top level option in Molecule's config.  It's purpose is for
     bookkeeping, and each :class:`.Config` object has a reference to a State_
@@ -70,16 +76,46 @@ def __init__(self, config):
         """
         self._config = config
         self._state_file = self._get_state_file()
-        self._data = self._get_data()
-        self._write_state_file()
+        self._transactions = 0
+        if os.path.isfile(self.state_file):
+            self._data = self._load_file()
+        else:
+            self._data = self._default_data()
+            self._write_state_file()
 
     def marshal(func):
         def wrapper(self, *args, **kwargs):
             func(self, *args, **kwargs)
-            self._write_state_file()
+            if not self._transactions:
+                self._write_state_file()
 
         return wrapper
 
+    @contextlib.contextmanager
+    def transaction(self):
+        """
+        Batch the changes made within the context, which are written once it
+        exits, and returns None.  Transactions may be nested, the outermost
+        one writes the changes.
+
+        ::
+
+            with state.transaction():
+                state.change_state('created', True)
+                state.change_state('prepared', True)
+
+        :return: None
+        """
+        self._transactions += 1
+        try:
+            yield
+        finally:
+            self._transactions -= 1
+            # the changes made before an error are kept, as without a
+            # transaction
+            if not self._transactions:
+                self._write_state_file()
+
     @property
     def state_file(self):
         return self._state_file
@@ -132,11 +168,6 @@ def change_state(self, key, value):
             raise InvalidState
         self._data[key] = value
 
-    def _get_data(self):
-        if os.path.isfile(self.state_file):
-            return self._load_file()
-        return self._default_data()
-
     def _default_data(self):
         return {
             'converged': False,
@@ -149,10 +180,42 @@ def _default_data(self):
         }
 
     def _load_file(self):
-        return util.safe_load_file(self.state_file)
+        return read(self.state_file)
 
     def _write_state_file(self):
-        util.write_file(self.state_file, util.safe_dump(self._data))
+        with trace.span('State._write_state_file', 'state'):
+            content = json.dumps(self._data, indent=2, sort_keys=True) + '\n'
+            util.write_file_atomically(
+                self.state_file, util.molecule_prepender(content)
+            )
 
     def _get_state_file(self):
         return os.path.join(self._config.scenario.ephemeral_directory, 'state.yml')
+
+
+def read(state_file):
+    """
+    Read the given state file, without building a :class:`.State`, which
+    writes the file when missing, and returns a dict.
+
+    :param state_file: A string containing the path of the state file.
+    :return: dict
+    """
+    if not os.path.isfile(state_file):
+        return {}
+
+    with util.open_file(state_file) as stream:
+        content = stream.read()
+    try:
+        return json.loads(_strip_comments(content))
+    except ValueError:
+        # written as YAML by earlier versions of Molecule
+        return util.safe_load(content)
+
+
+def _strip_comments(content):
+    lines = content.splitlines(True)
+    while lines and (lines[0].startswith('#') or not lines[0].strip()):
+        lines.pop(0)
+
+    return ''.join(lines)
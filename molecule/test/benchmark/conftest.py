@@ -0,0 +1,130 @@
+#  Copyright (c) 2019 Red Hat, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import os
+
+import pytest
+
+from molecule import config
+from molecule import util
+
+# Benchmarks run on synthetic projects, per scenario work is measured with a
+# growing number of platforms and per project work with a growing number of
+# scenarios of a single platform, which keeps the largest cases of the suite
+# within a minute.
+PLATFORMS = [1, 10, 100, 1000]
+SCENARIOS = [1, 10, 100, 500]
+SCENARIO_PLATFORMS = 1
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(monkeypatch, tmpdir):
+    # keep the ephemeral directories of the synthetic scenarios out of the
+    # user's cache
+    monkeypatch.setenv('XDG_CACHE_HOME', tmpdir.join('cache').strpath)
+    monkeypatch.delenv('MOLECULE_EPHEMERAL_DIRECTORY', raising=False)
+    monkeypatch.delenv('MOLECULE_PROJECT_DIRECTORY', raising=False)
+    # measure reading the configs, the cache is benchmarked on its own
+    monkeypatch.setattr(config, 'MOLECULE_CONFIG_CACHE', False)
+
+
+def molecule_data(scenario_name, platforms):
+    """
+    Build the data of a ``molecule.yml`` with the given number of platforms,
+    using environment variables with defaults as a typical project does, and
+    returns a dict.
+
+    :param scenario_name: A string containing the name of the scenario.
+    :param platforms: An int containing the number of platforms.
+    :return: dict
+    """
+    return {
+        'dependency': {'name': 'galaxy'},
+        'driver': {'name': 'docker'},
+        'lint': {'name': 'yamllint'},
+        'platforms': [
+            {
+                'name': 'instance-{}'.format(i),
+                'image': '${MOLECULE_DISTRO:-centos}:7',
+                'groups': ['group-{}'.format(i % 10), 'all-instances'],
+                'children': ['child-{}'.format(i % 3)],
+                'env': {'SCENARIO': '${MOLECULE_SCENARIO_NAME}'},
+            }
+            for i in range(platforms)
+        ],
+        'provisioner': {
+            'name': 'ansible',
+            'inventory': {
+                'group_vars': {'all-instances': {'foo': 'bar'}},
+                'host_vars': {'instance-0': {'baz': '${BAZ:-qux}'}},
+            },
+        },
+        'scenario': {'name': scenario_name},
+        'verifier': {'name': 'testinfra'},
+    }
+
+
+@pytest.fixture
+def project(temp_dir):
+    """
+    Return a function writing a synthetic project with the given number of
+    scenarios and platforms each into the current directory, which returns
+    the list of Molecule files.
+    """
+
+    def _project(scenarios=1, platforms=1):
+        molecule_files = []
+        for i in range(scenarios):
+            name = 'default' if i == 0 else 'scenario-{}'.format(i)
+            directory = os.path.join(config.molecule_directory(temp_dir.strpath), name)
+            os.makedirs(directory)
+            molecule_file = config.molecule_file(directory)
+            data = molecule_data(name, platforms)
+            util.write_file(molecule_file, util.safe_dump(data))
+            molecule_files.append(molecule_file)
+
+        return molecule_files
+
+    return _project
+
+
+@pytest.fixture
+def config_factory(project):
+    """
+    Return a function writing a synthetic scenario with the given number of
+    platforms, which returns its :class:`.Config`.
+    """
+
+    def _config_factory(platforms=1):
+        molecule_file, = project(platforms=platforms)
+
+        return config.Config(molecule_file, command_args={'subcommand': 'test'})
+
+    return _config_factory
+
+
+@pytest.fixture
+def patched_logger_info(mocker):
+    return mocker.patch('logging.Logger.info')
+
+
+@pytest.fixture
+def patched_logger_out(mocker):
+    return mocker.patch('molecule.logger.CustomLogger.out')
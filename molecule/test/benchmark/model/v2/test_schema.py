@@ -0,0 +1,55 @@
+#  Copyright (c) 2019 Red Hat, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import pytest
+
+from molecule.model import schema_v2
+from molecule.test.benchmark.conftest import PLATFORMS
+
+
+@pytest.mark.parametrize('platforms', PLATFORMS)
+def test_validate(benchmark, config_factory, platforms):
+    c = config_factory(platforms=platforms)
+
+    errors = benchmark(schema_v2.validate, c.config)
+
+    assert {} == errors
+
+
+@pytest.mark.parametrize('platforms', PLATFORMS)
+def test_pre_validate(benchmark, config_factory, platforms):
+    c = config_factory(platforms=platforms)
+    with open(c.molecule_file) as stream:
+        data = stream.read()
+
+    errors = benchmark(schema_v2.pre_validate, data, {}, 'MOLECULE_')
+
+    assert {} == errors
+
+
+@pytest.mark.parametrize('platforms', PLATFORMS)
+def test_validate_with_errors(benchmark, config_factory, platforms):
+    c = config_factory(platforms=platforms)
+    # an error is reported by Cerberus, after the compiled schema gave up
+    c.config['platforms'][-1]['groups'] = 'all-instances'
+
+    errors = benchmark(schema_v2.validate, c.config)
+
+    assert 'platforms' in errors
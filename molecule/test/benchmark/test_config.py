@@ -0,0 +1,80 @@
+#  Copyright (c) 2019 Red Hat, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import pytest
+
+from molecule import config
+from molecule.command import base
+from molecule.test.benchmark.conftest import PLATFORMS
+from molecule.test.benchmark.conftest import SCENARIOS
+from molecule.test.benchmark.conftest import SCENARIO_PLATFORMS
+
+
+@pytest.mark.parametrize('platforms', PLATFORMS)
+def test_config(benchmark, project, platforms):
+    molecule_file, = project(platforms=platforms)
+
+    c = benchmark(config.Config, molecule_file, command_args={'subcommand': 'test'})
+
+    assert platforms == len(c.platforms.instances)
+
+
+@pytest.mark.parametrize('platforms', PLATFORMS)
+def test_config_cached(benchmark, project, platforms):
+    molecule_file, = project(platforms=platforms)
+    args = {'config_cache': True}
+    config.Config(molecule_file, args=args, command_args={'subcommand': 'test'})
+
+    c = benchmark(
+        config.Config, molecule_file, args=args, command_args={'subcommand': 'test'}
+    )
+
+    assert platforms == len(c.platforms.instances)
+
+
+@pytest.mark.parametrize('platforms', PLATFORMS)
+def test_get_config(benchmark, config_factory, platforms):
+    c = config_factory(platforms=platforms)
+
+    result = benchmark(c._get_config)
+
+    assert platforms == len(result['platforms'])
+
+
+@pytest.mark.parametrize('platforms', PLATFORMS)
+def test_reget_config(benchmark, config_factory, platforms):
+    c = config_factory(platforms=platforms)
+
+    result = benchmark(c._reget_config)
+
+    assert platforms == len(result['platforms'])
+
+
+@pytest.mark.parametrize('scenarios', SCENARIOS)
+def test_get_configs(benchmark, project, scenarios):
+    project(scenarios=scenarios, platforms=SCENARIO_PLATFORMS)
+
+    configs = benchmark.pedantic(
+        base.get_configs, args=({}, {'subcommand': 'test'}), rounds=3
+    )
+
+    benchmark.extra_info['mean_per_scenario'] = benchmark.stats.stats.mean / scenarios
+
+    assert scenarios == len(configs)
@@ -0,0 +1,201 @@
+#  Copyright (c) 2019 Red Hat, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import json
+import os
+import sys
+
+import pytest
+import sh
+import tabulate
+
+from molecule import config
+from molecule import scenario
+from molecule import util
+from molecule.test.benchmark.conftest import molecule_data
+
+# the stand-in ``ansible-playbook`` and the ``null`` driver
+E2E_DIRECTORY = os.path.join(os.path.dirname(__file__), 'e2e')
+PLAYBOOK = [{'hosts': 'all', 'gather_facts': False, 'tasks': []}]
+PLAYBOOKS = ['create.yml', 'destroy.yml', 'playbook.yml', 'prepare.yml', 'verify.yml']
+CATEGORIES = ['subprocess', 'inventory', 'state']
+
+
+def _write_scenario(directory, name, platforms):
+    data = molecule_data(name, platforms)
+    data['driver'] = {'name': 'null'}
+    data['lint'] = {'name': 'yamllint', 'enabled': False}
+    data['provisioner']['lint'] = {'name': 'ansible-lint', 'enabled': False}
+    data['verifier'] = {
+        'name': 'ansible',
+        'lint': {'name': 'ansible-lint', 'enabled': False},
+    }
+
+    os.makedirs(directory)
+    util.write_file(config.molecule_file(directory), util.safe_dump(data))
+    for playbook in PLAYBOOKS:
+        util.write_file(os.path.join(directory, playbook), util.safe_dump(PLAYBOOK))
+
+
+@pytest.fixture
+def e2e_project(temp_dir):
+    """
+    Return a function writing a project of the given number of scenarios and
+    platforms each, using the ``null`` driver, which returns the command
+    running ``molecule test`` on it with the stand-in ``ansible-playbook``.
+    """
+
+    def _e2e_project(scenarios=1, platforms=1):
+        molecule_directory = config.molecule_directory(temp_dir.strpath)
+        for i in range(scenarios):
+            name = 'default' if i == 0 else 'scenario-{}'.format(i)
+            _write_scenario(os.path.join(molecule_directory, name), name, platforms)
+
+        env = os.environ.copy()
+        env['PATH'] = os.pathsep.join(
+            [os.path.join(E2E_DIRECTORY, 'bin'), env.get('PATH', '')]
+        )
+        env['PYTHONPATH'] = os.pathsep.join(
+            [os.path.join(E2E_DIRECTORY, 'null_driver'), env.get('PYTHONPATH', '')]
+        )
+        env['ANSIBLE_PLAYBOOK_CALLS'] = temp_dir.join('ansible-playbook.calls').strpath
+
+        return sh.Command(sys.executable).bake(
+            '-m',
+            'molecule',
+            '--trace',
+            'test',
+            '--all',
+            _env=env,
+            _cwd=temp_dir.strpath,
+        )
+
+    return _e2e_project
+
+
+def _trace_file(project_directory):
+    # the trace of ``molecule test``, see ``command.base._get_trace_file``
+    directory = os.path.join('molecule', os.path.basename(project_directory))
+
+    return os.path.join(scenario.ephemeral_directory(directory), 'trace.json')
+
+
+def _within(event, span):
+    return (
+        event['pid'] == span['pid']
+        and span['ts'] <= event['ts']
+        and event['ts'] + event['dur'] <= span['ts'] + span['dur']
+    )
+
+
+def _overhead(events, wall):
+    """
+    Break the given trace of a ``molecule test`` down into the time spent per
+    action, and returns a dict of seconds.
+
+    :param events: A list of trace events.
+    :param wall: A float containing the wall time of the run in seconds.
+    :return: dict
+    """
+    spans = [e for e in events if e['ph'] == 'X']
+    configs = [
+        s
+        for s in spans
+        if s['cat'] == 'config'
+        and s['name'] in ('Config.__init__', 'Config.after_init')
+    ]
+
+    actions = {}
+    for action in (s for s in spans if s['cat'] == 'action'):
+        totals = actions.setdefault(
+            action['name'],
+            dict({'total': 0, 'molecule': 0}, **{c: 0 for c in CATEGORIES}),
+        )
+        totals['total'] += action['dur'] / 1e6
+        for category in CATEGORIES:
+            totals[category] += sum(
+                s['dur'] / 1e6
+                for s in spans
+                if s['cat'] == category and _within(s, action)
+            )
+        totals['molecule'] = totals['total'] - totals['subprocess']
+
+    config_load = sum(s['dur'] for s in configs) / 1e6
+    in_actions = sum(a['total'] for a in actions.values())
+
+    return {
+        'wall': wall,
+        'config': config_load,
+        'actions': actions,
+        # interpreter start up, imports, the CLI and the test matrix
+        'other': wall - config_load - in_actions,
+    }
+
+
+def _print_overhead(overhead):
+    rows = [
+        [name] + ['{:.3f}'.format(a[c]) for c in ['total', 'molecule'] + CATEGORIES]
+        for name, a in sorted(overhead['actions'].items())
+    ]
+    print('')
+    print(
+        tabulate.tabulate(
+            rows, headers=['action', 'total', 'molecule'] + CATEGORIES, tablefmt='plain'
+        )
+    )
+    print(
+        'wall {wall:.3f}s, config load {config:.3f}s, other {other:.3f}s'.format(
+            **overhead
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    'scenarios, platforms', [(1, 1), (1, 10), (10, 1)], ids=['1x1', '1x10', '10x1']
+)
+def test_molecule_test(benchmark, capsys, e2e_project, scenarios, platforms):
+    cmd = e2e_project(scenarios=scenarios, platforms=platforms)
+    runs = []
+
+    def _run():
+        with util.open_file(
+            cmd._partial_call_args['env']['ANSIBLE_PLAYBOOK_CALLS'], 'w'
+        ):
+            pass
+        start = benchmark._timer()
+        cmd()
+        wall = benchmark._timer() - start
+        with util.open_file(_trace_file(cmd._partial_call_args['cwd'])) as stream:
+            runs.append(_overhead(json.load(stream)['traceEvents'], wall))
+
+    benchmark.pedantic(_run, rounds=3)
+
+    # keep the breakdown of the fastest run along with the results
+    overhead = min(runs, key=lambda r: r['wall'])
+    benchmark.extra_info['overhead'] = overhead
+    with capsys.disabled():
+        _print_overhead(overhead)
+
+    with util.open_file(
+        cmd._partial_call_args['env']['ANSIBLE_PLAYBOOK_CALLS']
+    ) as stream:
+        calls = stream.readlines()
+    # syntax, create, prepare, converge, idempotence, verify and twice destroy
+    assert 8 * scenarios == len(calls)
@@ -0,0 +1,39 @@
+#  Copyright (c) 2019 Red Hat, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import os
+
+import pytest
+
+from molecule import interpolation
+from molecule.test.benchmark.conftest import PLATFORMS
+
+
+@pytest.mark.parametrize('platforms', PLATFORMS)
+def test_interpolate(benchmark, project, platforms):
+    molecule_file, = project(platforms=platforms)
+    with open(molecule_file) as stream:
+        data = stream.read()
+    i = interpolation.Interpolator(interpolation.TemplateWithDefaults, os.environ)
+
+    result = benchmark(i.interpolate, data, 'MOLECULE_')
+
+    assert 'centos:7' in result
+    assert 'SCENARIO: $MOLECULE_SCENARIO_NAME' in result
@@ -0,0 +1,52 @@
+#  Copyright (c) 2019 Red Hat, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import os
+
+import pytest
+
+from molecule.test.benchmark.conftest import PLATFORMS
+
+
+def _populate(c, platforms):
+    # the files a converge leaves behind, a few per instance
+    ephemeral_directory = c.scenario.ephemeral_directory
+    for i in range(platforms):
+        directory = os.path.join(ephemeral_directory, 'instance-{}'.format(i))
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        for name in ('Dockerfile', 'ssh_key', 'facts.json'):
+            with open(os.path.join(directory, name), 'w') as stream:
+                stream.write(name)
+
+
+@pytest.mark.parametrize('platforms', PLATFORMS)
+def test_prune(benchmark, config_factory, patched_logger_info, platforms):
+    c = config_factory(platforms=platforms)
+    c.provisioner.manage_inventory()
+
+    benchmark.pedantic(
+        c.scenario.prune, setup=lambda: _populate(c, platforms), rounds=10
+    )
+
+    assert os.path.isfile(c.state.state_file)
+    assert not os.path.exists(
+        os.path.join(c.scenario.ephemeral_directory, 'instance-0')
+    )
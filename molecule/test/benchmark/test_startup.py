@@ -0,0 +1,38 @@
+#  Copyright (c) 2019 Red Hat, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import sys
+
+import pytest
+import sh
+
+# The budgets of starting ``molecule`` for the commands wrappers run the
+# most, in seconds, see the "Benchmarks" section of ``docs/testing.rst``.
+BUDGETS = {'--version': 0.25, 'drivers': 0.5, 'list': 1.0}
+
+
+@pytest.mark.parametrize('command', sorted(BUDGETS))
+def test_startup(benchmark, project, command):
+    project(scenarios=10)
+    molecule = sh.Command(sys.executable).bake('-m', 'molecule', command)
+
+    benchmark.pedantic(molecule, rounds=10, warmup_rounds=1)
+
+    assert benchmark.stats.stats.mean < BUDGETS[command]
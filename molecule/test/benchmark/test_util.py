@@ -0,0 +1,48 @@
+#  Copyright (c) 2019 Red Hat, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import os
+
+import pytest
+
+from molecule import util
+
+# host_vars files written by ``manage_inventory``
+FILES = [1, 10, 100, 1000]
+
+
+def _write_files(directory, files, content):
+    for i in range(files):
+        util.write_file(os.path.join(directory, 'instance-{}'.format(i)), content)
+
+
+@pytest.mark.parametrize('files', FILES)
+def test_write_file_unchanged(benchmark, tmpdir, files):
+    content = util.safe_dump({'ansible_user': 'root', 'foo': 'bar'})
+    _write_files(tmpdir.strpath, files, content)
+
+    benchmark(_write_files, tmpdir.strpath, files, content)
+
+
+@pytest.mark.parametrize('files', FILES)
+def test_write_file_changed(benchmark, tmpdir, files):
+    contents = iter(range(10 ** 9))
+
+    benchmark(lambda: _write_files(tmpdir.strpath, files, str(next(contents))))
@@ -22,7 +22,11 @@
 
 import pytest
 
+import molecule.lint.base
+import molecule.scenario
+import molecule.scenarios
 from molecule import config
+from molecule import timings
 from molecule import util
 from molecule.command import base
 
@@ -186,6 +190,252 @@ def test_execute_cmdline_scenarios_nodestroy(
     assert not _patched_sysexit.called
 
 
+@pytest.fixture
+def _patched_execute_scenarios_concurrently(mocker):
+    return mocker.patch('molecule.command.base._execute_scenarios_concurrently')
+
+
+@pytest.fixture
+def _patched_lint_project(mocker):
+    return mocker.patch('molecule.command.base._lint_project')
+
+
+def test_execute_cmdline_scenarios_with_jobs(
+    config_instance,
+    molecule_data,
+    _patched_print_matrix,
+    _patched_lint_project,
+    _patched_execute_scenario,
+    _patched_execute_scenarios_concurrently,
+):
+    path = os.path.join(pytest.helpers.molecule_directory(), 'other')
+    os.makedirs(path)
+    molecule_data['scenario']['name'] = 'other'
+    pytest.helpers.write_molecule_file(
+        pytest.helpers.get_molecule_file(path), molecule_data
+    )
+    command_args = {'destroy': 'always', 'subcommand': 'test', 'jobs': 2}
+    base.execute_cmdline_scenarios(None, {}, command_args)
+
+    args, _ = _patched_execute_scenarios_concurrently.call_args
+    assert 2 == len(args[0].all)
+    assert 2 == args[2]
+    assert not _patched_execute_scenario.called
+
+
+def test_execute_cmdline_scenarios_with_jobs_lints_project_once(
+    mocker,
+    config_instance,
+    molecule_data,
+    patched_yamllint,
+    _patched_print_matrix,
+    _patched_execute_scenarios_concurrently,
+):
+    mocker.patch.object(molecule.lint.base, '_LINTED', set())
+    path = os.path.join(pytest.helpers.molecule_directory(), 'other')
+    os.makedirs(path)
+    molecule_data['scenario']['name'] = 'other'
+    pytest.helpers.write_molecule_file(
+        pytest.helpers.get_molecule_file(path), molecule_data
+    )
+    command_args = {'destroy': 'always', 'subcommand': 'test', 'jobs': 2}
+    base.execute_cmdline_scenarios(None, {}, command_args)
+
+    patched_yamllint.assert_called_once_with()
+    assert _patched_execute_scenarios_concurrently.called
+
+
+def test_execute_cmdline_scenarios_lints_project_in_sequence(
+    config_instance,
+    molecule_data,
+    _patched_print_matrix,
+    _patched_execute_scenario,
+    _patched_lint_project,
+):
+    path = os.path.join(pytest.helpers.molecule_directory(), 'other')
+    os.makedirs(path)
+    molecule_data['scenario']['name'] = 'other'
+    pytest.helpers.write_molecule_file(
+        pytest.helpers.get_molecule_file(path), molecule_data
+    )
+    command_args = {'destroy': 'always', 'subcommand': 'test'}
+    base.execute_cmdline_scenarios(None, {}, command_args)
+
+    assert not _patched_lint_project.called
+    assert 2 == _patched_execute_scenario.call_count
+
+
+def test_execute_cmdline_scenarios_does_not_lint_single_scenario(
+    config_instance,
+    _patched_print_matrix,
+    _patched_execute_scenario,
+    _patched_lint_project,
+):
+    command_args = {'destroy': 'always', 'subcommand': 'test'}
+    base.execute_cmdline_scenarios('default', {}, command_args)
+
+    assert not _patched_lint_project.called
+
+
+def test_lint_project_skips_scenarios_without_lint(config_instance, patched_yamllint):
+    config_instance.command_args = {'subcommand': 'destroy'}
+    scenarios = molecule.scenarios.Scenarios([config_instance])
+    base._lint_project(scenarios)
+
+    assert not patched_yamllint.called
+
+
+def test_get_job_log_file_is_unique_per_run(config_instance):
+    scenario = molecule.scenarios.Scenarios([config_instance]).all[0]
+    log_file = base._get_job_log_file(scenario)
+
+    assert 'default-{}.log'.format(os.getpid()) == os.path.basename(log_file)
+
+
+def test_execute_cmdline_scenarios_with_jobs_and_single_scenario(
+    config_instance,
+    _patched_print_matrix,
+    _patched_execute_scenario,
+    _patched_execute_scenarios_concurrently,
+):
+    command_args = {'destroy': 'always', 'subcommand': 'test', 'jobs': 2}
+    base.execute_cmdline_scenarios('default', {}, command_args)
+
+    assert not _patched_execute_scenarios_concurrently.called
+    assert 1 == _patched_execute_scenario.call_count
+
+
+def test_execute_scenario_job(temp_dir, config_instance, _patched_execute_scenario):
+    log_file = os.path.join(temp_dir.strpath, 'default.log')
+
+    def _execute_scenario(scenario):
+        os.write(1, 'converging {}'.format(scenario.name).encode('utf-8'))
+
+    _patched_execute_scenario.side_effect = _execute_scenario
+    job = (config_instance, {'subcommand': 'test'}, log_file)
+    result = base._execute_scenario_job(job)
+    name, exit_code, duration, result_log_file, records = result
+
+    assert 'default' == name
+    assert 0 == exit_code
+    assert duration >= 0
+    assert log_file == result_log_file
+    assert {'timings': {'steps': [], 'tasks': []}, 'trace': []} == records
+    with open(log_file) as stream:
+        assert 'converging default' in stream.read()
+
+
+def test_execute_scenario_job_reports_failure(
+    temp_dir, config_instance, _patched_execute_scenario
+):
+    log_file = os.path.join(temp_dir.strpath, 'default.log')
+    _patched_execute_scenario.side_effect = SystemExit(2)
+    job = (config_instance, {'destroy': 'never', 'subcommand': 'test'}, log_file)
+
+    assert 2 == base._execute_scenario_job(job)[1]
+
+
+def test_execute_scenario_job_returns_timings(
+    temp_dir, config_instance, _patched_execute_scenario
+):
+    log_file = os.path.join(temp_dir.strpath, 'default.log')
+    config_instance.args = {'timings': True}
+
+    def _execute_scenario(scenario):
+        with timings.step(scenario.config, 'converge'):
+            pass
+
+    _patched_execute_scenario.side_effect = _execute_scenario
+    job = (config_instance, {'subcommand': 'test'}, log_file)
+    records = base._execute_scenario_job(job)[4]
+
+    assert ['converge'] == [r['action'] for r in records['timings']['steps']]
+    assert {'steps': [], 'tasks': []} == timings.pop()
+
+
+def test_execute_cmdline_scenarios_reports_timings(
+    mocker, config_instance, _patched_print_matrix, _patched_execute_scenario
+):
+    m = mocker.patch('molecule.timings.report')
+    base.execute_cmdline_scenarios('default', {'timings': True}, {'subcommand': 'test'})
+
+    scenario = config_instance.scenario
+    m.assert_called_once_with(base._get_timings_file(scenario))
+
+
+def test_execute_cmdline_scenarios_reports_timings_on_failure(
+    mocker, config_instance, _patched_print_matrix, _patched_execute_scenario
+):
+    m = mocker.patch('molecule.timings.report')
+    _patched_execute_scenario.side_effect = SystemExit(1)
+    with pytest.raises(SystemExit):
+        base.execute_cmdline_scenarios(
+            'default', {'timings': True}, {'subcommand': 'test'}
+        )
+
+    assert m.called
+
+
+def test_execute_cmdline_scenarios_does_not_report_timings_by_default(
+    mocker, config_instance, _patched_print_matrix, _patched_execute_scenario
+):
+    m = mocker.patch('molecule.timings.report')
+    base.execute_cmdline_scenarios('default', {}, {'subcommand': 'test'})
+
+    assert not m.called
+
+
+def test_execute_cmdline_scenarios_writes_trace(
+    mocker, config_instance, _patched_print_matrix, _patched_execute_scenario
+):
+    mocker.patch('molecule.trace.enabled', return_value=True)
+    m = mocker.patch('molecule.trace.write')
+    base.execute_cmdline_scenarios('default', {}, {'subcommand': 'test'})
+
+    m.assert_called_once_with(base._get_trace_file(config_instance.scenario))
+
+
+def test_get_trace_file(config_instance):
+    x = os.path.join(
+        os.path.dirname(base._get_timings_file(config_instance.scenario)), 'trace.json'
+    )
+
+    assert x == base._get_trace_file(config_instance.scenario)
+
+
+def test_get_trace_file_when_parallel(config_instance):
+    config_instance.command_args['parallel'] = True
+    x = 'trace-{}.json'.format(os.getpid())
+
+    assert x == os.path.basename(base._get_trace_file(config_instance.scenario))
+
+
+def test_execute_subcommand_traces_action_and_tasks(mocker, config_instance):
+    mocker.patch('molecule.command.lint.Lint.execute')
+    mocker.patch('molecule.trace.enabled', return_value=True)
+    patched_span = mocker.patch('molecule.trace.span')
+    patched_tasks = mocker.patch('molecule.trace.tasks')
+    mocker.patch('molecule.timings.tasks', return_value=['task'])
+    base.execute_subcommand(config_instance, 'lint')
+
+    patched_span.assert_any_call('lint', 'action', scenario='default')
+    patched_tasks.assert_called_once_with(['task'])
+
+
+def test_get_timings_file(config_instance):
+    x = os.path.join(
+        molecule.scenario.ephemeral_directory(
+            os.path.join(
+                config_instance.cache_directory,
+                os.path.basename(config_instance.project_directory),
+            )
+        ),
+        'timings.json',
+    )
+
+    assert x == base._get_timings_file(config_instance.scenario)
+
+
 def test_execute_subcommand(config_instance):
     # scenario's config.action is mutated in-place for every sequence action,
     # so make sure that is currently set to the executed action
@@ -199,6 +449,7 @@ def test_execute_scenario(mocker, _patched_execute_subcommand):
     # - execute_subcommand should be called once for each sequence item
     # - prune should not be called, since the sequence has no destroy step
     scenario = mocker.Mock()
+    scenario.config.command_args = {}
     scenario.sequence = ('a', 'b', 'c')
 
     base.execute_scenario(scenario)
@@ -212,6 +463,7 @@ def test_execute_scenario_destroy(mocker, _patched_execute_subcommand):
     # - execute_subcommand should be called once for each sequence item
     # - prune should be called, since the sequence has a destroy step
     scenario = mocker.Mock()
+    scenario.config.command_args = {}
     scenario.sequence = ('a', 'b', 'destroy', 'c')
 
     base.execute_scenario(scenario)
@@ -220,6 +472,181 @@ def test_execute_scenario_destroy(mocker, _patched_execute_subcommand):
     assert scenario.prune.called
 
 
+def test_execute_scenario_with_overlap(
+    mocker, config_instance, _patched_execute_subcommand
+):
+    m = mocker.patch('molecule.command.base._execute_sequence_graph')
+    config_instance.command_args['overlap'] = True
+
+    base.execute_scenario(config_instance.scenario)
+
+    m.assert_called_once_with(config_instance.scenario)
+    assert not _patched_execute_subcommand.called
+
+
+@pytest.fixture
+def _patched_start_concurrent_step(mocker):
+    def _start_concurrent_step(scenario, action):
+        process = mocker.Mock(exitcode=2 if action == 'lint' else 0)
+        process.is_alive.return_value = False
+        return action, process, 'log-file'
+
+    mocker.patch('molecule.command.base._print_log_file')
+    m = mocker.patch('molecule.command.base._start_concurrent_step')
+    m.side_effect = _start_concurrent_step
+
+    return m
+
+
+def test_execute_sequence_graph(
+    mocker,
+    config_instance,
+    _patched_manage_inventory,
+    _patched_execute_subcommand,
+    _patched_start_concurrent_step,
+):
+    scenario = mocker.Mock(config=config_instance)
+    scenario.sequence_graph = molecule.scenario.sequence_graph(
+        ['dependency', 'syntax', 'create', 'converge']
+    )
+
+    base._execute_sequence_graph(scenario)
+
+    x = [
+        mocker.call(config_instance, 'dependency', setup=False),
+        mocker.call(config_instance, 'create', setup=False),
+        mocker.call(config_instance, 'converge', setup=False),
+    ]
+    assert x == _patched_execute_subcommand.mock_calls
+    _patched_start_concurrent_step.assert_called_once_with(scenario, 'syntax')
+    _patched_manage_inventory.assert_called_once_with()
+
+
+def test_execute_sequence_graph_updates_inventory_on_instance_changes(
+    mocker,
+    config_instance,
+    _patched_manage_inventory,
+    _patched_execute_subcommand,
+    _patched_start_concurrent_step,
+):
+    patched_update_inventory = mocker.patch(
+        'molecule.provisioner.ansible.Ansible.update_inventory'
+    )
+
+    def _execute_subcommand(c, action, setup=True):
+        if action == 'create':
+            util.write_file(c.driver.instance_config, 'instances')
+
+    _patched_execute_subcommand.side_effect = _execute_subcommand
+    scenario = mocker.Mock(config=config_instance)
+    scenario.sequence_graph = molecule.scenario.sequence_graph(
+        ['dependency', 'syntax', 'create', 'converge']
+    )
+
+    base._execute_sequence_graph(scenario)
+
+    patched_update_inventory.assert_called_once_with()
+
+
+def test_execute_sequence_graph_terminates_steps_on_error(
+    mocker,
+    config_instance,
+    _patched_manage_inventory,
+    _patched_execute_subcommand,
+    _patched_start_concurrent_step,
+):
+    processes = []
+
+    def _start_concurrent_step(scenario, action):
+        process = mocker.Mock(exitcode=None)
+        processes.append(process)
+        return action, process, 'log-file'
+
+    _patched_start_concurrent_step.side_effect = _start_concurrent_step
+    _patched_execute_subcommand.side_effect = [None, KeyboardInterrupt]
+    scenario = mocker.Mock(config=config_instance)
+    scenario.sequence_graph = molecule.scenario.sequence_graph(
+        ['dependency', 'syntax', 'create', 'converge']
+    )
+
+    with pytest.raises(KeyboardInterrupt):
+        base._execute_sequence_graph(scenario)
+
+    processes[0].terminate.assert_called_once_with()
+    processes[0].join.assert_called_once_with()
+
+
+def test_execute_sequence_graph_stops_on_concurrent_failure(
+    mocker,
+    config_instance,
+    _patched_manage_inventory,
+    _patched_execute_subcommand,
+    _patched_start_concurrent_step,
+):
+    scenario = mocker.Mock(config=config_instance)
+    scenario.sequence_graph = molecule.scenario.sequence_graph(
+        ['dependency', 'lint', 'create', 'converge']
+    )
+
+    with pytest.raises(SystemExit) as e:
+        base._execute_sequence_graph(scenario)
+
+    # create overlaps with lint, but converge is never started
+    assert 2 == e.value.code
+    assert 'lint' == config_instance.action
+    x = [
+        mocker.call(config_instance, 'dependency', setup=False),
+        mocker.call(config_instance, 'create', setup=False),
+    ]
+    assert x == _patched_execute_subcommand.mock_calls
+
+
+def test_execute_sequence_graph_stops_on_failure(
+    mocker,
+    config_instance,
+    _patched_manage_inventory,
+    _patched_execute_subcommand,
+    _patched_start_concurrent_step,
+):
+    scenario = mocker.Mock(config=config_instance)
+    scenario.sequence_graph = molecule.scenario.sequence_graph(
+        ['dependency', 'create', 'converge']
+    )
+    _patched_execute_subcommand.side_effect = [None, SystemExit(3)]
+
+    with pytest.raises(SystemExit) as e:
+        base._execute_sequence_graph(scenario)
+
+    assert 3 == e.value.code
+    assert 'create' == config_instance.action
+
+
+def test_execute_concurrent_step(
+    temp_dir, config_instance, _patched_execute_subcommand
+):
+    log_file = os.path.join(temp_dir.strpath, 'lint.log')
+    base._execute_concurrent_step(config_instance, 'lint', log_file)
+
+    _patched_execute_subcommand.assert_called_once_with(
+        config_instance, 'lint', setup=False
+    )
+
+
+def test_execute_concurrent_step_hands_over_timings(temp_dir, mocker, config_instance):
+    mocker.patch('molecule.command.lint.Lint.execute')
+    config_instance.args = {'timings': True}
+    log_file = os.path.join(temp_dir.strpath, 'lint.log')
+    base._execute_concurrent_step(config_instance, 'lint', log_file)
+
+    assert {'steps': [], 'tasks': []} == timings.pop()
+
+    process = mocker.Mock(exitcode=0)
+    base._wait_for_concurrent_step(0, ('lint', process, log_file), set())
+
+    assert ['lint'] == [r['action'] for r in timings.pop()['steps']]
+    assert not os.path.exists(base._get_step_records_file(log_file))
+
+
 def test_get_configs(config_instance):
     molecule_file = config_instance.molecule_file
     data = config_instance.config
@@ -23,9 +23,44 @@
 from molecule.command import idempotence
 
 
+def _task_end(host, task, changed=False):
+    return {
+        'event': 'task_end',
+        'host': host,
+        'task': task,
+        'changed': changed,
+        'failed': False,
+        'skipped': False,
+    }
+
+
+_IDEMPOTENT_EVENTS = [
+    {'event': 'playbook_start', 'playbook': 'playbook.yml'},
+    {'event': 'task_start', 'task': 'Gathering Facts'},
+    _task_end('check-command-01', 'Gathering Facts'),
+    {'event': 'task_start', 'task': 'Idempotence test'},
+    _task_end('check-command-01', 'Idempotence test'),
+    {'event': 'playbook_end', 'stats': {}},
+]
+
+_NON_IDEMPOTENT_EVENTS = [
+    {'event': 'playbook_start', 'playbook': 'playbook.yml'},
+    {'event': 'task_start', 'task': 'Gathering Facts'},
+    _task_end('check-command-01', 'Gathering Facts'),
+    _task_end('check-command-02', 'Gathering Facts'),
+    {'event': 'task_start', 'task': 'Idempotence test'},
+    _task_end('check-command-01', 'Idempotence test', changed=True),
+    _task_end('check-command-02', 'Idempotence test', changed=True),
+    {'event': 'playbook_end', 'stats': {}},
+]
+
+
 @pytest.fixture
-def _patched_is_idempotent(mocker):
-    return mocker.patch('molecule.command.idempotence.Idempotence._is_idempotent')
+def _patched_events(mocker):
+    m = mocker.patch('molecule.provisioner.ansible.Ansible.events')
+    m.return_value = iter(_IDEMPOTENT_EVENTS)
+
+    return m
 
 
 # NOTE(retr0h): The use of the `patched_config_validate` fixture, disables
@@ -42,7 +77,7 @@ def test_execute(
     mocker,
     patched_logger_info,
     patched_ansible_converge,
-    _patched_is_idempotent,
+    _patched_events,
     patched_logger_success,
     _instance,
 ):
@@ -53,7 +88,7 @@ def test_execute(
 
     patched_ansible_converge.assert_called_once_with(out=None, err=None)
 
-    _patched_is_idempotent.assert_called_once_with('patched-ansible-converge-stdout')
+    _patched_events.assert_called_once_with()
 
     msg = 'Idempotence completed successfully.'
     patched_logger_success.assert_called_once_with(msg)
@@ -76,75 +111,47 @@ def test_execute_raises_when_fails_idempotence(
     mocker,
     patched_logger_critical,
     patched_ansible_converge,
-    _patched_is_idempotent,
+    _patched_events,
     _instance,
 ):
-    _patched_is_idempotent.return_value = False
+    _patched_events.return_value = iter(_NON_IDEMPOTENT_EVENTS)
     with pytest.raises(SystemExit) as e:
         _instance.execute()
 
     assert 1 == e.value.code
 
-    msg = 'Idempotence test failed because of the following tasks:\n'
+    msg = (
+        'Idempotence test failed because of the following tasks:\n'
+        '* [check-command-01] => Idempotence test\n'
+        '* [check-command-02] => Idempotence test'
+    )
     patched_logger_critical.assert_called_once_with(msg)
 
 
-def test_is_idempotent(_instance):
-    output = """
-PLAY RECAP ***********************************************************
-check-command-01: ok=3    changed=0    unreachable=0    failed=0
-    """
-
-    assert _instance._is_idempotent(output)
-
-
-def test_is_idempotent_not_idempotent(_instance):
-    output = """
-PLAY RECAP ***********************************************************
-check-command-01: ok=2    changed=1    unreachable=0    failed=0
-check-command-02: ok=2    changed=1    unreachable=0    failed=0
-    """
-
-    assert not _instance._is_idempotent(output)
-
-
 def test_non_idempotent_tasks_idempotent(_instance):
-    output = """
-PLAY [all] ***********************************************************
-
-GATHERING FACTS ******************************************************
-ok: [check-command-01]
-
-TASK: [Idempotence test] *********************************************
-ok: [check-command-01]
-
-PLAY RECAP ***********************************************************
-check-command-01: ok=3    changed=0    unreachable=0    failed=0
-"""
-    result = _instance._non_idempotent_tasks(output)
+    result = _instance._non_idempotent_tasks(_IDEMPOTENT_EVENTS)
 
     assert result == []
 
 
 def test_non_idempotent_tasks_not_idempotent(_instance):
-    output = """
-PLAY [all] ***********************************************************
-
-GATHERING FACTS ******************************************************
-ok: [check-command-01]
-ok: [check-command-02]
-
-TASK: [Idempotence test] *********************************************
-changed: [check-command-01]
-changed: [check-command-02]
-
-PLAY RECAP ***********************************************************
-check-command-01: ok=2    changed=1    unreachable=0    failed=0
-check-command-02: ok=2    changed=1    unreachable=0    failed=0
-"""
-    result = _instance._non_idempotent_tasks(output)
+    result = _instance._non_idempotent_tasks(_NON_IDEMPOTENT_EVENTS)
 
     assert result == [
         '* [check-command-01] => Idempotence test',
         '* [check-command-02] => Idempotence test',
     ]
+
+
+def test_non_idempotent_tasks_exits_without_the_end_of_the_playbook(
+    patched_logger_critical, _instance
+):
+    with pytest.raises(SystemExit) as e:
+        _instance._non_idempotent_tasks(_IDEMPOTENT_EVENTS[:-1])
+
+    assert 1 == e.value.code
+
+    msg = 'Unable to read the results of the converge playbook from {}.'.format(
+        _instance._config.provisioner.events_file
+    )
+    patched_logger_critical.assert_called_once_with(msg)
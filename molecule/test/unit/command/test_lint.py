@@ -18,8 +18,11 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
+import os
+
 import pytest
 
+import molecule.lint.base
 from molecule.command import lint
 
 
@@ -28,6 +31,24 @@ def _patched_ansible_lint(mocker):
     return mocker.patch('molecule.provisioner.lint.ansible_lint.AnsibleLint.execute')
 
 
+@pytest.fixture
+def _patched_can_fork(mocker):
+    m = mocker.patch('molecule.command.base._can_fork')
+    m.return_value = False
+
+    return m
+
+
+@pytest.fixture
+def _patched_execute_concurrently(mocker):
+    return mocker.patch('molecule.command.lint.Lint._execute_concurrently')
+
+
+@pytest.fixture
+def _patched_linted(mocker):
+    return mocker.patch.object(molecule.lint.base, '_LINTED', set())
+
+
 # NOTE(retr0h): The use of the `patched_config_validate` fixture, disables
 # config.Config._validate from executing.  Thus preventing odd side-effects
 # throughout patched.assert_called unit tests.
@@ -38,6 +59,8 @@ def test_execute(
     patched_flake8,
     patched_config_validate,
     _patched_ansible_lint,
+    _patched_can_fork,
+    _patched_linted,
     config_instance,
 ):
     l = lint.Lint(config_instance)
@@ -49,3 +72,80 @@ def test_execute(
     patched_yamllint.assert_called_once_with()
     patched_flake8.assert_called_once_with()
     _patched_ansible_lint.assert_called_once_with()
+
+
+def test_execute_runs_linters_concurrently(
+    patched_config_validate,
+    _patched_execute_concurrently,
+    _patched_linted,
+    config_instance,
+):
+    l = lint.Lint(config_instance)
+    l.execute()
+
+    linters = _patched_execute_concurrently.call_args[0][0]
+    x = [
+        ('project', config_instance.lint),
+        ('verifier', config_instance.verifier.lint),
+        ('provisioner', config_instance.provisioner.lint),
+    ]
+    assert x == linters
+    assert config_instance.lint.linted
+
+
+def test_execute_skips_linted_project(
+    patched_yamllint,
+    patched_config_validate,
+    _patched_execute_concurrently,
+    _patched_linted,
+    config_instance,
+):
+    config_instance.lint.linted = True
+    l = lint.Lint(config_instance)
+    l.execute()
+
+    assert not patched_yamllint.called
+    linters = _patched_execute_concurrently.call_args[0][0]
+    assert ['verifier', 'provisioner'] == [name for name, _ in linters]
+
+
+class _Linter(object):
+    def __init__(self, output, code=0):
+        self._output = output
+        self._code = code
+
+    def execute(self):
+        os.write(1, self._output.encode('utf-8'))
+        if self._code:
+            raise SystemExit(self._code)
+
+
+def test_execute_concurrently(capsys, patched_config_validate, config_instance):
+    l = lint.Lint(config_instance)
+    l._execute_concurrently(
+        [('project', _Linter('yamllint-output')), ('verifier', _Linter('flake8'))]
+    )
+
+    out = capsys.readouterr().out
+    assert out.index('yamllint-output') < out.index('flake8')
+
+
+def test_execute_concurrently_exits_with_first_failure(
+    capsys, patched_logger_critical, patched_config_validate, config_instance
+):
+    l = lint.Lint(config_instance)
+    with pytest.raises(SystemExit) as e:
+        l._execute_concurrently(
+            [
+                ('project', _Linter('yamllint-output')),
+                ('verifier', _Linter('flake8-output', 2)),
+                ('provisioner', _Linter('ansible-lint-output', 3)),
+            ]
+        )
+
+    assert 2 == e.value.code
+    out = capsys.readouterr().out
+    assert 'ansible-lint-output' in out
+
+    msg = 'Failed linter(s): verifier, provisioner'
+    patched_logger_critical.assert_called_once_with(msg)
@@ -17,3 +17,29 @@
 #  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
+
+from click.testing import CliRunner
+
+from molecule.shell import main
+
+
+def test_jobs_read_from_molecule_jobs(mocker):
+    patched_execute = mocker.patch('molecule.command.base.execute_cmdline_scenarios')
+
+    runner = CliRunner()
+    result = runner.invoke(main, ['test'], obj={}, env={'MOLECULE_JOBS': '3'})
+
+    assert 0 == result.exit_code
+    _, _, command_args = patched_execute.call_args[0]
+    assert 3 == command_args['jobs']
+    assert command_args['parallel']
+
+
+def test_jobs_rejects_values_below_one(mocker):
+    patched_execute = mocker.patch('molecule.command.base.execute_cmdline_scenarios')
+
+    runner = CliRunner()
+    result = runner.invoke(main, ['test'], obj={}, env={'MOLECULE_JOBS': '0'})
+
+    assert 2 == result.exit_code
+    assert not patched_execute.called
@@ -0,0 +1,132 @@
+#  Copyright (c) 2019 Red Hat, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import os
+
+import pytest
+
+from molecule import util
+from molecule.command import watch
+
+
+@pytest.fixture
+def _patched_execute_subcommand(mocker):
+    return mocker.patch('molecule.command.base.execute_subcommand')
+
+
+@pytest.fixture
+def _playbooks(config_instance):
+    for name in ('create.yml', 'prepare.yml'):
+        util.write_file(os.path.join(config_instance.scenario.directory, name), '')
+
+
+@pytest.mark.parametrize(
+    'changed,x',
+    [
+        (['tests/test_default.py'], ['verify']),
+        (['prepare.yml'], ['prepare']),
+        (['create.yml'], []),
+        (['molecule.yml'], ['converge', 'verify']),
+        (['../../tasks/main.yml'], ['converge', 'verify']),
+        (['tests/test_default.py', 'prepare.yml'], ['prepare', 'verify']),
+    ],
+)
+def test_get_actions(config_instance, _playbooks, changed, x):
+    directory = config_instance.scenario.directory
+    changed = [os.path.normpath(os.path.join(directory, p)) for p in changed]
+
+    assert x == watch.get_actions(config_instance, changed)
+
+
+def test_get_actions_skips_ephemeral_directory(config_instance):
+    path = os.path.join(config_instance.scenario.ephemeral_directory, 'state.yml')
+
+    assert [] == watch.get_actions(config_instance, [path])
+
+
+def test_run_reuses_created_instances(
+    mocker, _patched_execute_subcommand, patched_config_validate, config_instance
+):
+    config_instance.state.change_state('created', True)
+    w = watch.Watch(config_instance)
+    w._run(['converge', 'verify'])
+
+    x = [
+        mocker.call(config_instance, 'converge'),
+        mocker.call(config_instance, 'verify'),
+    ]
+    assert x == _patched_execute_subcommand.mock_calls
+
+
+def test_run_creates_instances(
+    mocker, _patched_execute_subcommand, patched_config_validate, config_instance
+):
+    w = watch.Watch(config_instance)
+    w._run(['verify'])
+
+    x = [
+        mocker.call(config_instance, action)
+        for action in config_instance.scenario.converge_sequence + ['verify']
+    ]
+    assert x == _patched_execute_subcommand.mock_calls
+
+
+@pytest.mark.parametrize(
+    'config_instance', ['command_driver_delegated_section_data'], indirect=True
+)
+def test_run_reuses_delegated_instances(
+    mocker, _patched_execute_subcommand, patched_config_validate, config_instance
+):
+    w = watch.Watch(config_instance)
+    w._run(['verify'])
+
+    x = [mocker.call(config_instance, 'verify')]
+    assert x == _patched_execute_subcommand.mock_calls
+
+
+def test_run_forces_prepare(
+    _patched_execute_subcommand, patched_config_validate, config_instance
+):
+    forced = []
+    _patched_execute_subcommand.side_effect = lambda c, action: forced.append(
+        c.command_args['force']
+    )
+    config_instance.state.change_state('created', True)
+    w = watch.Watch(config_instance)
+    w._run(['prepare'])
+
+    assert [True] == forced
+    assert 'force' not in config_instance.command_args
+
+
+def test_run_keeps_watching_when_an_action_fails(
+    _patched_execute_subcommand,
+    patched_config_validate,
+    patched_logger_warn,
+    config_instance,
+):
+    _patched_execute_subcommand.side_effect = SystemExit(1)
+    config_instance.state.change_state('created', True)
+    w = watch.Watch(config_instance)
+    w._run(['converge', 'verify'])
+
+    assert 1 == _patched_execute_subcommand.call_count
+    msg = 'Waiting for changes to run the actions again.'
+    patched_logger_warn.assert_called_once_with(msg)
@@ -35,6 +35,13 @@
 from molecule import config
 
 
+@pytest.fixture(autouse=True)
+def _disabled_config_cache(monkeypatch):
+    # configs are read from the files of each test, unless a test enables the
+    # cache itself
+    monkeypatch.setattr(config, 'MOLECULE_CONFIG_CACHE', False)
+
+
 @pytest.helpers.register
 def write_molecule_file(filename, data):
     util.write_file(filename, util.safe_dump(data))
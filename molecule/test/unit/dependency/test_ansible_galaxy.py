@@ -19,16 +19,19 @@
 #  DEALINGS IN THE SOFTWARE.
 
 import os
+import shutil
 
 import pytest
 import sh
 
 from molecule import config
+from molecule import util
 from molecule.dependency import ansible_galaxy
 
 
 @pytest.fixture
-def _patched_ansible_galaxy_has_requirements_file(mocker):
+def _patched_ansible_galaxy_has_requirements_file(mocker, role_file):
+    util.write_file(role_file, '')
     m = mocker.patch(
         ('molecule.dependency.ansible_galaxy.' 'AnsibleGalaxy._has_requirements_file')
     )
@@ -66,6 +69,18 @@ def roles_path(_instance):
     return os.path.join(_instance._config.scenario.ephemeral_directory, 'roles')
 
 
+@pytest.fixture
+def _patched_cache_directory(mocker, temp_dir):
+    cache_directory = os.path.join(temp_dir.strpath, 'molecule_galaxy')
+    os.makedirs(cache_directory)
+    m = mocker.patch(
+        'molecule.dependency.ansible_galaxy.AnsibleGalaxy._cache_directory'
+    )
+    m.return_value = cache_directory
+
+    return m
+
+
 def test_config_private_member(_instance):
     assert isinstance(_instance._config, config.Config)
 
@@ -229,3 +244,209 @@ def test_role_file(role_file, _instance):
 
 def test_has_requirements_file(_instance):
     assert not _instance._has_requirements_file()
+
+
+def test_execute_skips_when_requirements_unchanged(
+    patched_run_command,
+    _patched_ansible_galaxy_has_requirements_file,
+    patched_logger_warn,
+    _instance,
+):
+    _instance._sh_command = 'patched-command'
+    _instance.execute()
+    _instance.execute()
+
+    patched_run_command.assert_called_once_with('patched-command', debug=False)
+
+    msg = 'Skipping, requirements unchanged since the last install.'
+    patched_logger_warn.assert_called_once_with(msg)
+
+
+def test_execute_reinstalls_when_requirements_change(
+    patched_run_command,
+    _patched_ansible_galaxy_has_requirements_file,
+    _instance,
+    role_file,
+):
+    _instance._sh_command = 'patched-command'
+    _instance.execute()
+    util.write_file(role_file, '---\n')
+    _instance.execute()
+
+    assert 2 == patched_run_command.call_count
+
+
+def test_execute_installs_requirements_from_cache(
+    mocker, patched_run_command, _instance, role_file
+):
+    util.write_file(role_file, util.safe_dump([{'src': 'foo'}, 'bar']))
+    m_install = mocker.patch(
+        'molecule.dependency.ansible_galaxy.AnsibleGalaxy._install_cached'
+    )
+    m_install.return_value = ['foo-path', 'bar-path']
+    m_link = mocker.patch(
+        'molecule.dependency.ansible_galaxy.AnsibleGalaxy._link_roles'
+    )
+    _instance.execute()
+
+    m_install.assert_called_once_with([{'src': 'foo'}, 'bar'])
+    m_link.assert_has_calls([mocker.call('foo-path'), mocker.call('bar-path')])
+    assert not patched_run_command.called
+    assert _instance._fingerprint() == _instance._installed_fingerprint()
+
+
+def test_execute_reinstalls_when_cached_roles_are_removed(
+    mocker, temp_dir, patched_run_command, _instance, role_file, roles_path
+):
+    util.write_file(role_file, util.safe_dump(['foo']))
+    cached = os.path.join(temp_dir.strpath, 'cached')
+
+    def _install_cached(requirements):
+        os.makedirs(os.path.join(cached, 'foo'))
+        return [cached]
+
+    m_install = mocker.patch(
+        'molecule.dependency.ansible_galaxy.AnsibleGalaxy._install_cached'
+    )
+    m_install.side_effect = _install_cached
+    _instance.execute()
+    _instance.execute()
+
+    assert 1 == m_install.call_count
+
+    shutil.rmtree(cached)
+    _instance.execute()
+
+    assert 2 == m_install.call_count
+
+
+def test_requirements(_instance, role_file):
+    util.write_file(role_file, util.safe_dump([{'src': 'foo'}]))
+
+    assert [{'src': 'foo'}] == _instance._requirements()
+
+
+def test_requirements_returns_none_when_including(_instance, role_file):
+    util.write_file(role_file, util.safe_dump([{'include': 'other.yml'}]))
+
+    assert _instance._requirements() is None
+
+
+def test_requirements_returns_none_when_not_a_list(_instance, role_file):
+    util.write_file(role_file, util.safe_dump({'roles': [{'src': 'foo'}]}))
+
+    assert _instance._requirements() is None
+
+
+def test_cache_key(_instance):
+    x = _instance._cache_key({'src': 'foo', 'version': '1.0'})
+
+    assert x == _instance._cache_key({'src': 'foo', 'version': '1.0', 'x': 1})
+    assert x != _instance._cache_key({'src': 'foo', 'version': '2.0'})
+    assert x != _instance._cache_key({'src': 'foo'})
+
+
+def _write_role(roles_path, name, dependencies=()):
+    meta = os.path.join(roles_path, name, 'meta')
+    os.makedirs(meta)
+    data = util.safe_dump({'dependencies': list(dependencies)})
+    util.write_file(os.path.join(meta, 'main.yml'), data)
+
+
+def test_install_cached(mocker, _patched_cache_directory, _instance):
+    def _install():
+        options = m_bake.call_args[0][0]
+        assert requirements == util.safe_load_file(options['role-file'])
+        _write_role(options['roles-path'], 'foo', ['common'])
+        _write_role(options['roles-path'], 'common')
+        _write_role(options['roles-path'], 'x.bar')
+
+    requirements = [{'src': 'foo'}, 'x.bar']
+    m_bake = mocker.patch('molecule.dependency.ansible_galaxy.AnsibleGalaxy._bake')
+    m_execute = mocker.patch(
+        'molecule.dependency.ansible_galaxy.AnsibleGalaxy.execute_with_retries'
+    )
+    m_execute.side_effect = _install
+    paths = _instance._install_cached(requirements)
+
+    cache_directory = _patched_cache_directory.return_value
+    x = [os.path.join(cache_directory, _instance._cache_key(r)) for r in requirements]
+    assert x == paths
+    assert 1 == m_execute.call_count
+    assert ['common', 'foo'] == sorted(os.listdir(paths[0]))
+    assert ['x.bar'] == os.listdir(paths[1])
+    assert sorted(os.path.basename(p) for p in paths) == sorted(
+        os.listdir(cache_directory)
+    )
+
+
+def test_install_cached_only_installs_missing_requirements(
+    mocker, _patched_cache_directory, _instance
+):
+    def _install():
+        options = m_bake.call_args[0][0]
+        assert ['bar'] == util.safe_load_file(options['role-file'])
+        _write_role(options['roles-path'], 'bar')
+
+    cached = os.path.join(
+        _patched_cache_directory.return_value, _instance._cache_key('foo')
+    )
+    os.makedirs(cached)
+    m_bake = mocker.patch('molecule.dependency.ansible_galaxy.AnsibleGalaxy._bake')
+    m_execute = mocker.patch(
+        'molecule.dependency.ansible_galaxy.AnsibleGalaxy.execute_with_retries'
+    )
+    m_execute.side_effect = _install
+    paths = _instance._install_cached(['foo', 'bar'])
+
+    assert cached == paths[0]
+    assert ['bar'] == os.listdir(paths[1])
+
+
+def test_install_cached_does_not_install_when_cached(
+    mocker, _patched_cache_directory, _instance
+):
+    requirement = {'src': 'foo'}
+    x = os.path.join(
+        _patched_cache_directory.return_value, _instance._cache_key(requirement)
+    )
+    os.makedirs(x)
+    m_execute = mocker.patch(
+        'molecule.dependency.ansible_galaxy.AnsibleGalaxy.execute_with_retries'
+    )
+
+    assert [x] == _instance._install_cached([requirement])
+    assert not m_execute.called
+
+
+def test_split_roles_gives_unattributed_roles_to_every_entry(temp_dir):
+    roles_path = temp_dir.strpath
+    _write_role(roles_path, 'foo')
+    _write_role(roles_path, 'bar')
+    _write_role(roles_path, 'unknown')
+    x = [['foo', 'unknown'], ['bar', 'unknown']]
+
+    assert x == ansible_galaxy._split_roles(roles_path, ['foo', {'src': 'bar'}])
+
+
+def test_link_roles(temp_dir, _instance, roles_path):
+    path = os.path.join(temp_dir.strpath, 'cached')
+    os.makedirs(os.path.join(path, 'foo'))
+    os.makedirs(os.path.join(path, 'bar'))
+    os.makedirs(os.path.join(roles_path, 'bar'))
+    os.symlink(temp_dir.strpath, os.path.join(roles_path, 'foo'))
+    _instance._link_roles(path)
+
+    for name in ['foo', 'bar']:
+        link = os.path.join(roles_path, name)
+        assert os.path.join(path, name) == os.readlink(link)
+
+
+def test_link_roles_keeps_directories_without_force(temp_dir, _instance, roles_path):
+    path = os.path.join(temp_dir.strpath, 'cached')
+    os.makedirs(os.path.join(path, 'foo'))
+    os.makedirs(os.path.join(roles_path, 'foo'))
+    _instance._config.config['dependency']['options'] = {'force': False}
+    _instance._link_roles(path)
+
+    assert not os.path.islink(os.path.join(roles_path, 'foo'))
@@ -23,6 +23,7 @@
 import pytest
 
 from molecule import config
+from molecule import util
 from molecule.driver import docker
 
 
@@ -131,6 +132,33 @@ def test_status(_instance):
     assert result[1].converged == 'false'
 
 
+def test_image_cache_file_property(_instance):
+    x = os.path.join(_instance._config.scenario.ephemeral_directory, 'image_cache.yml')
+
+    assert x == _instance.image_cache_file
+
+
+def test_status_prints_image_cache_when_debugging(mocker, _instance):
+    patched_print_debug = mocker.patch('molecule.util.print_debug')
+    with util.open_file(_instance.image_cache_file, 'w') as stream:
+        stream.write('molecule_local/centos:7: hit\n')
+    _instance._config.args = {'debug': True}
+    _instance.status()
+
+    patched_print_debug.assert_called_once_with(
+        'IMAGE BUILD CACHE', 'molecule_local/centos:7: hit\n'
+    )
+
+
+def test_status_does_not_print_image_cache(mocker, _instance):
+    patched_print_debug = mocker.patch('molecule.util.print_debug')
+    with util.open_file(_instance.image_cache_file, 'w') as stream:
+        stream.write('molecule_local/centos:7: hit\n')
+    _instance.status()
+
+    assert not patched_print_debug.called
+
+
 def test_created(_instance):
     assert 'false' == _instance._created()
 
@@ -0,0 +1,256 @@
+#  Copyright (c) 2019 Red Hat, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+
+import json
+import os
+
+import pytest
+import sh
+
+from molecule import util
+from molecule.lint import cache
+
+
+@pytest.fixture
+def _patched_cache_directory(mocker, temp_dir):
+    m = mocker.patch('molecule.scenario.ephemeral_directory')
+    m.return_value = temp_dir.strpath
+
+    return m
+
+
+@pytest.fixture
+def _files(temp_dir):
+    files = []
+    for name in ['foo.yml', 'bar.yml']:
+        filename = os.path.join(temp_dir.strpath, name)
+        util.write_file(filename, '---\n')
+        files.append(filename)
+
+    return files
+
+
+@pytest.fixture
+def _instance(_patched_cache_directory):
+    return cache.LintCache('yamllint', '1.0', {'s': True})
+
+
+def _parse(lines):
+    return 1 if lines else 0
+
+
+class _Command(object):
+    def __init__(self, output):
+        self._output = output
+        self.calls = []
+
+    def bake(self, files, _out):
+        self.calls.append(files)
+        for line in self._output:
+            _out(line + '\n')
+
+        return 'patched-command'
+
+
+def test_partition(_files, _instance):
+    _instance.update(_files[0], {'code': 0, 'output': []})
+
+    assert ({_files[0]: {'code': 0, 'output': []}}, [_files[1]]) == (
+        _instance.partition(_files)
+    )
+
+
+def test_partition_when_file_changes(_files, _instance):
+    _instance.update(_files[0], {'code': 0, 'output': []})
+    util.write_file(_files[0], '---\nfoo: bar\n')
+
+    assert ({}, _files) == _instance.partition(_files)
+
+
+def test_save(_files, _instance):
+    _instance.update(_files[0], {'code': 0, 'output': []})
+    _instance.save()
+
+    result = cache.LintCache('yamllint', '1.0', {'s': True})
+    assert [_files[0]] == list(result.partition(_files)[0])
+
+
+@pytest.mark.parametrize(
+    'name, version, options',
+    [
+        ('flake8', '1.0', {'s': True}),
+        ('yamllint', '1.1', {'s': True}),
+        ('yamllint', '1.0', {}),
+    ],
+)
+def test_save_is_keyed_by_linter(_files, _instance, name, version, options):
+    _instance.update(_files[0], {'code': 0, 'output': []})
+    _instance.save()
+
+    result = cache.LintCache(name, version, options)
+    assert ({}, _files) == result.partition(_files)
+
+
+def test_save_is_keyed_by_config_files(temp_dir, _files, _instance):
+    config_file = os.path.join(temp_dir.strpath, '.yamllint')
+    _instance.update(_files[0], {'code': 0, 'output': []})
+    _instance.save()
+    util.write_file(config_file, 'extends: default')
+
+    result = cache.LintCache('yamllint', '1.0', {'s': True}, [config_file])
+    assert ({}, _files) == result.partition(_files)
+
+
+def test_execute(patched_run_command, patched_logger_out, _files, _instance):
+    line = '{}:2:1: [error] foo'.format(_files[1])
+    command = _Command([line])
+    result = cache.execute(_instance, command, _files, _parse)
+
+    assert 1 == result
+    assert [_files] == command.calls
+    patched_run_command.assert_called_once_with('patched-command', debug=False)
+    patched_logger_out.assert_called_once_with(line)
+
+
+def test_execute_replays_cached_results(
+    patched_run_command, patched_logger_out, _files, _instance
+):
+    line = '{}:2:1: [error] foo'.format(_files[1])
+    cache.execute(_instance, _Command([line]), _files, _parse)
+    command = _Command([])
+    patched_logger_out.reset_mock()
+    result = cache.execute(
+        cache.LintCache('yamllint', '1.0', {'s': True}), command, _files, _parse
+    )
+
+    assert 1 == result
+    assert not command.calls
+    patched_logger_out.assert_called_once_with(line)
+
+
+def test_execute_lints_changed_files(
+    patched_run_command, patched_logger_out, _files, _instance
+):
+    cache.execute(_instance, _Command([]), _files, _parse)
+    util.write_file(_files[1], '---\nfoo: bar\n')
+    command = _Command([])
+    result = cache.execute(_instance, command, _files, _parse)
+
+    assert 0 == result
+    assert [[_files[1]]] == command.calls
+
+
+def test_execute_does_not_cache_unattributed_failures(
+    patched_run_command, patched_logger_out, _files, _instance
+):
+    patched_run_command.side_effect = sh.ErrorReturnCode_1(sh.yamllint, b'', b'')
+    result = cache.execute(_instance, _Command(['broken config']), _files, _parse)
+
+    assert 1 == result
+    patched_logger_out.assert_called_once_with('broken config')
+    assert ({}, _files) == _instance.partition(_files)
+
+
+def test_save_keeps_results_of_files_not_linted(_files, _instance):
+    for filename in _files:
+        _instance.update(filename, {'code': 0, 'output': []})
+    _instance.save()
+    result = cache.LintCache('yamllint', '1.0', {'s': True})
+    result.partition(_files[:1])
+    result.save()
+
+    result = cache.LintCache('yamllint', '1.0', {'s': True})
+    assert (dict((f, {'code': 0, 'output': []}) for f in _files), []) == (
+        result.partition(_files)
+    )
+
+
+def test_save_prunes_removed_files(_files, _instance):
+    for filename in _files:
+        _instance.update(filename, {'code': 0, 'output': []})
+    _instance.save()
+    os.unlink(_files[1])
+    result = cache.LintCache('yamllint', '1.0', {'s': True})
+    result.update(_files[0], {'code': 1, 'output': []})
+    result.save()
+
+    with util.open_file(result._filename) as stream:
+        assert [_files[0]] == list(json.load(stream))
+
+
+def test_save_merges_concurrent_results(_files, _instance):
+    other = cache.LintCache('yamllint', '1.0', {'s': True})
+    _instance.update(_files[0], {'code': 0, 'output': []})
+    other.update(_files[1], {'code': 1, 'output': []})
+    _instance.save()
+    other.save()
+
+    result = cache.LintCache('yamllint', '1.0', {'s': True})
+    assert (
+        {_files[0]: {'code': 0, 'output': []}, _files[1]: {'code': 1, 'output': []}},
+        [],
+    ) == result.partition(_files)
+
+
+def test_save_is_keyed_by_scope(_files, _patched_cache_directory):
+    instance = cache.LintCache('flake8', '1.0', {}, scope=['project', 'default'])
+    instance.update(_files[0], {'code': 0, 'output': []})
+    instance.save()
+
+    result = cache.LintCache('flake8', '1.0', {}, scope=['project', 'other'])
+    assert ({}, _files) == result.partition(_files)
+    result = cache.LintCache('flake8', '1.0', {}, scope=['project', 'default'])
+    assert [_files[0]] == list(result.partition(_files)[0])
+
+
+def test_save_writes_atomically(mocker, _files, _instance):
+    patched_write_file_atomically = mocker.patch('molecule.util.write_file_atomically')
+    _instance.update(_files[0], {'code': 0, 'output': []})
+    _instance.save()
+
+    assert 1 == patched_write_file_atomically.call_count
+
+
+def test_save_skips_unchanged_results(mocker, _files, _instance):
+    _instance.update(_files[0], {'code': 0, 'output': []})
+    _instance.save()
+    patched_write_file_atomically = mocker.patch('molecule.util.write_file_atomically')
+    result = cache.LintCache('yamllint', '1.0', {'s': True})
+    result.partition(_files[:1])
+    result.save()
+
+    assert not patched_write_file_atomically.called
+
+
+def test_version(mocker, temp_dir):
+    executable = os.path.join(temp_dir.strpath, 'yamllint')
+    util.write_file(executable, '')
+    mocker.patch('sh.which', return_value=executable)
+    patched_command = mocker.patch('sh.Command')
+    result = cache.version('yamllint')
+
+    assert result[0]
+    assert [executable, os.stat(executable).st_mtime] == result[1:]
+    assert not patched_command.called
+
+
+def test_version_when_linter_is_missing():
+    assert [None, None, None] == cache.version('molecule-missing-linter')
@@ -22,6 +22,7 @@
 import sh
 
 from molecule import config
+from molecule.lint import base
 from molecule.lint import yamllint
 
 
@@ -33,6 +34,11 @@ def _patched_get_files(mocker):
     return m
 
 
+@pytest.fixture
+def _patched_linted(mocker):
+    return mocker.patch.object(base, '_LINTED', set())
+
+
 @pytest.fixture
 def _lint_section_data():
     return {
@@ -160,3 +166,86 @@ def test_executes_catches_and_exits_return_code(patched_run_command, _instance):
         _instance.execute()
 
     assert 1 == e.value.code
+
+
+def test_fingerprint_property(_patched_get_files, _instance):
+    x = _instance.fingerprint
+    assert x == yamllint.Yamllint(_instance._config).fingerprint
+
+    _instance._files = ['foo.yml']
+    assert x != _instance.fingerprint
+
+
+def test_fingerprint_property_includes_options(_patched_get_files, _instance):
+    x = _instance.fingerprint
+    _instance._config.config['lint']['options'] = {'foo': 'baz'}
+
+    assert x != _instance.fingerprint
+
+
+def test_execute_once(
+    patched_yamllint, patched_logger_warn, _patched_linted, _instance
+):
+    _instance.execute_once()
+    _instance.execute_once()
+
+    patched_yamllint.assert_called_once_with()
+    assert _instance.fingerprint in _patched_linted
+
+    msg = 'Skipping, project already linted.'
+    patched_logger_warn.assert_called_once_with(msg)
+
+
+def test_execute_once_does_not_record_failures(
+    patched_run_command, _patched_linted, _instance
+):
+    patched_run_command.side_effect = sh.ErrorReturnCode_1(sh.yamllint, b'', b'')
+    with pytest.raises(SystemExit):
+        _instance.execute_once()
+
+    assert not _patched_linted
+
+
+def test_execute_with_lint_cache(
+    mocker, _patched_get_files, patched_logger_success, _instance
+):
+    m = mocker.patch('molecule.lint.yamllint.Yamllint._execute_incremental')
+    m.return_value = 0
+    _instance._config.args = {'lint_cache': True}
+    _instance.execute()
+
+    m.assert_called_once_with()
+    msg = 'Lint completed successfully.'
+    patched_logger_success.assert_called_once_with(msg)
+
+
+def test_execute_with_lint_cache_exits_return_code(
+    mocker, _patched_get_files, _instance
+):
+    m = mocker.patch('molecule.lint.yamllint.Yamllint._execute_incremental')
+    m.return_value = 2
+    _instance._config.args = {'lint_cache': True}
+    with pytest.raises(SystemExit) as e:
+        _instance.execute()
+
+    assert 2 == e.value.code
+
+
+@pytest.mark.parametrize('config_instance', ['_lint_section_data'], indirect=True)
+def test_execute_incremental(mocker, _patched_get_files, _instance):
+    mocker.patch('molecule.lint.cache.version').return_value = ['1.0', None, None]
+    m_cache = mocker.patch('molecule.lint.cache.LintCache')
+    m_execute = mocker.patch('molecule.lint.cache.execute')
+    m_execute.return_value = 1
+
+    assert 1 == _instance._execute_incremental()
+
+    options = {'s': True, 'foo': 'bar', 'format': 'parsable'}
+    assert options == m_cache.call_args[0][2]
+    assert [_instance._config.project_directory] == m_cache.call_args[0][4]
+    cache, command, files, parse = m_execute.call_args[0]
+    assert '--format=parsable' in str(command)
+    assert ['foo.yml', 'bar.yaml'] == files
+    assert 1 == parse(['foo.yml:1:1: [error] foo', 'foo.yml:2:1: [warning] bar'])
+    assert 2 == parse(['foo.yml:2:1: [warning] bar'])
+    assert 0 == parse([])
@@ -0,0 +1,349 @@
+#  Copyright (c) 2019 Red Hat, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import copy
+
+import pytest
+
+from molecule import util
+from molecule.model import compiler
+from molecule.model import schema_v2
+
+# Configs the compiled schemas must agree on with Cerberus, each merged onto
+# a valid config of the docker driver.  The errors Molecule reports are the
+# ones of Cerberus, the compiled schema must tell the valid configs apart.
+CORPUS = {
+    'base': {},
+    'unknown fields': {'foo': 'bar', 'driver': {'foo': {'bar': 'baz'}}},
+    'dependency shell': {'dependency': {'name': 'shell', 'command': 'make'}},
+    'dependency shell without command': {
+        'dependency': {'name': 'shell', 'command': None}
+    },
+    'dependency unallowed': {'dependency': {'name': 'pip'}},
+    'dependency options': {'dependency': {'options': {'role-file': 'r.yml'}}},
+    'driver name type': {'driver': {'name': 5}},
+    'driver provider null': {'driver': {'provider': {'name': None}}},
+    'driver options managed': {'driver': {'options': {'managed': 'yes'}}},
+    'driver safe files': {'driver': {'safe_files': ['foo', 1]}},
+    'lint unallowed': {'lint': {'name': 'pylint'}},
+    'lint env': {'lint': {'env': {'FOO_BAR': 'baz'}}},
+    'lint env key': {'lint': {'env': {'foo': 'bar'}}},
+    'platforms type': {'platforms': {'name': 'instance'}},
+    'platforms item type': {'platforms': ['instance']},
+    'platforms item null': {'platforms': [None]},
+    'platforms unique': {'platforms': [{'name': 'instance'}, {'name': 'instance'}]},
+    'platforms name type': {'platforms': [{'name': 1}]},
+    'platforms groups': {
+        'platforms': [{'name': 'instance', 'groups': ['foo'], 'children': 'bar'}]
+    },
+    'platforms docker': {
+        'platforms': [
+            {
+                'name': 'instance',
+                'image': 'centos:7',
+                'command': None,
+                'exposed_ports': [53, '53/udp'],
+                'etc_hosts': {'host1.example.com': '10.3.1.5'},
+                'env': {'FOO': 'bar', 'foo': 'bar'},
+                'networks': [{'name': 'foo'}],
+                'sysctls': {'net.core.somaxconn': '1024'},
+            }
+        ]
+    },
+    'platforms docker errors': {
+        'platforms': [
+            {
+                'name': 'instance',
+                'exposed_ports': [53.5],
+                'etc_hosts': ['host1.example.com'],
+                'env': {'FOO BAR': 'baz'},
+                'networks': [{'name': 1}],
+                'restart_retries': '3',
+                'privileged': None,
+            }
+        ]
+    },
+    'platforms docker registry': {
+        'platforms': [
+            {
+                'name': 'instance',
+                'registry': {'url': 1, 'credentials': {'password': 123}},
+            }
+        ]
+    },
+    'platforms podman': {
+        'driver': {'name': 'podman'},
+        'platforms': [{'name': 'instance', 'network': 'host', 'keep_volumes': 1}],
+    },
+    'platforms vagrant': {
+        'driver': {'name': 'vagrant', 'provider': {'name': 'virtualbox'}},
+        'platforms': [
+            {
+                'name': 'instance',
+                'box': 'sandbox',
+                'memory': 1024,
+                'cpus': 2,
+                'interfaces': [{'auto_config': True, 'network_name': 'private'}],
+                'provider_raw_config_args': ['foo'],
+            }
+        ],
+    },
+    'platforms vagrant errors': {
+        'driver': {'name': 'vagrant', 'provider': {'name': 'qemu'}},
+        'platforms': [{'name': 'instance', 'memory': '1G', 'interfaces': [1]}],
+    },
+    'platforms lxd': {
+        'driver': {'name': 'lxd'},
+        'platforms': [
+            {
+                'name': 'instance',
+                'architecture': 'x86_64',
+                'config': {'limits.cpu': '2'},
+                'source': {'mode': 'pull', 'protocol': 'simplestreams'},
+            }
+        ],
+    },
+    'platforms lxd errors': {
+        'driver': {'name': 'lxd'},
+        'platforms': [
+            {'name': 'instance', 'architecture': 'arm', 'source': {'mode': 'push'}}
+        ],
+    },
+    'platforms linode': {
+        'driver': {'name': 'linode'},
+        'platforms': [
+            {'name': 'instance', 'plan': 1, 'datacenter': 2, 'distribution': 3}
+        ],
+    },
+    'platforms linode errors': {
+        'driver': {'name': 'linode'},
+        'platforms': [{'name': 'instance', 'plan': '1', 'datacenter': True}],
+    },
+    'platforms hetznercloud missing': {
+        'driver': {'name': 'hetznercloud'},
+        'platforms': [{'name': 'instance', 'image': 'centos-7'}],
+    },
+    'provisioner executor': {'provisioner': {'executor': 'ssh'}},
+    'provisioner disallowed': {
+        'provisioner': {
+            'config_options': {
+                'defaults': {'roles_path': 'roles'},
+                'privilege_escalation': {},
+            }
+        }
+    },
+    'provisioner env': {
+        'provisioner': {'env': {'ANSIBLE_ROLES_PATH': '../roles', 'FOO': 'bar'}}
+    },
+    'provisioner env disallowed': {'provisioner': {'env': {'ANSIBLE_BECOME': 'x'}}},
+    'provisioner env null': {'provisioner': {'env': {'FOO': None}}},
+    'provisioner inventory': {
+        'provisioner': {
+            'inventory': {'host_vars': {'instance': {'foo': 'bar'}}, 'links': []}
+        }
+    },
+    'provisioner playbooks': {
+        'provisioner': {
+            'playbooks': {'converge': 'playbook.yml', 'docker': {'create': 1}}
+        }
+    },
+    'scenario sequences': {
+        'scenario': {'name': 'default', 'test_sequence': ['lint', 'converge']}
+    },
+    'scenario sequence type': {'scenario': {'converge_sequence': 'converge'}},
+    'verifier goss': {'verifier': {'name': 'goss', 'lint': {'name': 'yamllint'}}},
+    'verifier goss options': {
+        'verifier': {
+            'name': 'goss',
+            'options': {'foo': 'bar'},
+            'lint': {'name': 'yamllint', 'enabled': None},
+        }
+    },
+    'verifier mismatch': {'verifier': {'name': 'inspec', 'lint': {'name': 'flake8'}}},
+    'verifier ansible': {
+        'verifier': {'name': 'ansible', 'lint': {'name': 'ansible-lint'}}
+    },
+    'verifier testinfra': {
+        'verifier': {
+            'name': 'testinfra',
+            'options': {'v': True},
+            'additional_files_or_dirs': ['../foo'],
+            'lint': {'name': 'pre-commit', 'enabled': 'no'},
+        }
+    },
+}
+
+
+@pytest.fixture
+def _config():
+    return util.safe_load(
+        """
+---
+dependency:
+  name: galaxy
+driver:
+  name: docker
+lint:
+  name: yamllint
+platforms:
+  - name: instance
+    image: centos:latest
+provisioner:
+  name: ansible
+  lint:
+    name: ansible-lint
+scenario:
+  name: default
+verifier:
+  name: testinfra
+  lint:
+    name: flake8
+"""
+    )
+
+
+def _cerberus_errors(c):
+    schema = schema_v2._get_schema(
+        c['dependency']['name'], c['driver']['name'], c['verifier']['name']
+    )
+    v = schema_v2.Validator(allow_unknown=True)
+    v.validate(c, schema)
+
+    return v.errors
+
+
+@pytest.mark.parametrize('name', sorted(CORPUS))
+def test_validate_equals_cerberus(_config, name):
+    c = util.merge_dicts(_config, copy.deepcopy(CORPUS[name]))
+    errors = _cerberus_errors(c)
+    schema = schema_v2._get_schema(
+        c['dependency']['name'], c['driver']['name'], c['verifier']['name']
+    )
+    is_valid = compiler.compile_schema(schema, schema_v2.Validator(allow_unknown=True))
+
+    assert errors == schema_v2.validate(c)
+    assert (errors == {}) is is_valid(c)
+
+
+PRE_VALIDATE_CORPUS = {
+    'base': ('driver:\n  name: docker\n', {}),
+    'driver variable': ('driver:\n  name: $DRIVER\n', {'DRIVER': 'docker'}),
+    'driver variable unallowed': ('driver:\n  name: $DRIVER\n', {'DRIVER': 'foo'}),
+    'driver molecule variable': ('driver:\n  name: $MOLECULE_DRIVER\n', {}),
+    'dependency molecule variable': ('dependency:\n  name: ${MOLECULE_DEP}\n', {}),
+    'registry password': (
+        'platforms:\n  - name: i\n    registry:\n'
+        '      credentials:\n        password: $PASSWORD\n',
+        {},
+    ),
+    'registry molecule password': (
+        'platforms:\n  - name: i\n    registry:\n'
+        '      credentials:\n        password: $MOLECULE_PASSWORD\n',
+        {},
+    ),
+    'registry password type': (
+        'platforms:\n  - name: i\n    registry:\n'
+        '      credentials:\n        password: 123\n',
+        {},
+    ),
+}
+
+
+@pytest.mark.parametrize('name', sorted(PRE_VALIDATE_CORPUS))
+def test_pre_validate_equals_cerberus(name):
+    stream, env = PRE_VALIDATE_CORPUS[name]
+    schema = schema_v2.pre_validate_base_schema(env, 'MOLECULE_')
+    v = schema_v2.Validator(allow_unknown=True)
+    v.validate(util.safe_load(stream), schema)
+
+    assert v.errors == schema_v2.pre_validate(stream, env, 'MOLECULE_')
+
+
+def test_compile_schema_unique_counts_once_per_document():
+    schema = {
+        'items': {
+            'type': 'list',
+            'schema': {'type': 'dict', 'schema': {'name': {'unique': True}}},
+        }
+    }
+    is_valid = compiler.compile_schema(schema, schema_v2.Validator(allow_unknown=True))
+
+    assert is_valid({'items': [{'name': 'a'}, {'name': 'b'}]})
+    assert not is_valid({'items': [{'name': 'a'}, {'name': 'a'}]})
+
+
+def test_compile_schema_is_invalid_when_cerberus_raises():
+    schema = {
+        'items': {
+            'type': 'list',
+            'schema': {'type': 'dict', 'schema': {'name': {'unique': True}}},
+        }
+    }
+    is_valid = compiler.compile_schema(schema, schema_v2.Validator(allow_unknown=True))
+
+    assert not is_valid({'items': [{'name': 'a'}, {}]})
+
+
+def test_compile_schema_is_invalid_for_non_mapping():
+    is_valid = compiler.compile_schema({}, schema_v2.Validator(allow_unknown=True))
+
+    assert not is_valid('foo')
+
+
+def test_compile_schema_raises_on_unsupported_rules():
+    with pytest.raises(compiler.UnsupportedSchema):
+        compiler.compile_schema(
+            {'foo': {'type': 'string', 'minlength': 1}},
+            schema_v2.Validator(allow_unknown=True),
+        )
+
+
+def test_validate_falls_back_to_cerberus_for_unsupported_schemas(mocker, _config):
+    schema_v2._get_validator.cache_clear()
+    mocker.patch(
+        'molecule.model.compiler.compile_schema', side_effect=compiler.UnsupportedSchema
+    )
+    errors = schema_v2.validate(util.merge_dicts(_config, {'platforms': [{'name': 1}]}))
+    schema_v2._get_validator.cache_clear()
+
+    assert {'platforms': [{0: [{'name': ['must be of string type']}]}]} == errors
+
+
+def test_pre_validate_compiles_schema_once(mocker):
+    schema_v2._get_pre_validator.cache_clear()
+    patched_compile_schema = mocker.patch(
+        'molecule.model.compiler.compile_schema', wraps=compiler.compile_schema
+    )
+    schema_v2.pre_validate('driver:\n  name: docker\n', {'FOO': 'bar'}, 'MOLECULE_')
+    schema_v2.pre_validate('driver:\n  name: podman\n', {'FOO': 'bar'}, 'MOLECULE_')
+    schema_v2._get_pre_validator.cache_clear()
+
+    assert 1 == patched_compile_schema.call_count
+
+
+def test_pre_validate_falls_back_to_cerberus_for_unsupported_schemas(mocker):
+    schema_v2._get_pre_validator.cache_clear()
+    mocker.patch(
+        'molecule.model.compiler.compile_schema', side_effect=compiler.UnsupportedSchema
+    )
+    errors = schema_v2.pre_validate('driver:\n  name: foo\n', {}, 'MOLECULE_')
+    schema_v2._get_pre_validator.cache_clear()
+
+    assert 'driver' in errors
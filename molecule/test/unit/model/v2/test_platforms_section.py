@@ -33,6 +33,7 @@ def _model_platforms_docker_section_data():
                 'hostname': 'instance',
                 'image': 'image_name:tag',
                 'pull': True,
+                'force': False,
                 'pre_build_image': False,
                 'registry': {
                     'url': 'registry.example.com',
@@ -122,6 +123,7 @@ def _model_platforms_docker_errors_section_data():
                 'hostname': int(),
                 'image': int(),
                 'pull': int(),
+                'force': int(),
                 'dockerfile': bool(),
                 'pre_build_image': int(),
                 'registry': {
@@ -178,6 +180,7 @@ def test_platforms_docker_has_errors(_config):
                         'hostname': ['must be of string type'],
                         'image': ['must be of string type'],
                         'pull': ['must be of boolean type'],
+                        'force': ['must be of boolean type'],
                         'dockerfile': ['must be of string type'],
                         'pre_build_image': ['must be of boolean type'],
                         'registry': [
@@ -29,6 +29,7 @@ def _model_provisioner_section_data():
         'provisioner': {
             'name': 'ansible',
             'log': True,
+            'executor': 'worker',
             'config_options': {'foo': 'bar'},
             'connection_options': {'foo': 'bar'},
             'options': {'foo': 'bar'},
@@ -254,3 +255,17 @@ def _model_provisioner_allows_ansible_section_data():
 )
 def test_provisioner_allows_name(_config):
     assert {} == schema_v2.validate(_config)
+
+
+@pytest.fixture
+def _model_provisioner_executor_section_data():
+    return {'provisioner': {'name': 'ansible', 'executor': 'runner'}}
+
+
+@pytest.mark.parametrize(
+    '_config', ['_model_provisioner_executor_section_data'], indirect=True
+)
+def test_provisioner_executor_has_errors(_config):
+    x = {'provisioner': [{'executor': ['unallowed value runner']}]}
+
+    assert x == schema_v2.validate(_config)
@@ -19,6 +19,7 @@
 #  DEALINGS IN THE SOFTWARE.
 
 import collections
+import json
 import os
 
 import pytest
@@ -66,6 +67,7 @@ def _provisioner_section_data():
                 'ANSIBLE_ROLES_PATH': 'foo/bar',
                 'ANSIBLE_LIBRARY': 'foo/bar',
                 'ANSIBLE_FILTER_PLUGINS': 'foo/bar',
+                'ANSIBLE_CALLBACK_PLUGINS': 'foo/bar',
             },
             'inventory': {
                 'hosts': {
@@ -130,6 +132,7 @@ def test_default_env_property(_instance):
     assert 'ANSIBLE_ROLES_PATH' in _instance.env
     assert 'ANSIBLE_LIBRARY' in _instance.env
     assert 'ANSIBLE_FILTER_PLUGINS' in _instance.env
+    assert 'ANSIBLE_CALLBACK_PLUGINS' in _instance.env
 
 
 def test_name_property(_instance):
@@ -238,6 +241,20 @@ def test_env_appends_env_property(_instance):
     ]
     assert x == _instance.env['ANSIBLE_FILTER_PLUGINS'].split(':')
 
+    x = [
+        _instance._get_callback_plugin_directory(),
+        util.abs_path(
+            os.path.join(
+                _instance._config.scenario.ephemeral_directory, 'plugins', 'callbacks'
+            )
+        ),
+        util.abs_path(
+            os.path.join(_instance._config.project_directory, 'plugins', 'callbacks')
+        ),
+        util.abs_path(os.path.join(_instance._config.scenario.directory, 'foo', 'bar')),
+    ]
+    assert x == _instance.env['ANSIBLE_CALLBACK_PLUGINS'].split(':')
+
 
 @pytest.mark.parametrize(
     'config_instance', ['_provisioner_section_data'], indirect=True
@@ -294,7 +311,7 @@ def test_inventory_property(_instance):
                 'molecule_file': "{{ lookup('env', 'MOLECULE_FILE') }}",
                 'molecule_ephemeral_directory': "{{ lookup('env', 'MOLECULE_EPHEMERAL_DIRECTORY') }}",
                 'molecule_scenario_directory': "{{ lookup('env', 'MOLECULE_SCENARIO_DIRECTORY') }}",
-                'molecule_yml': "{{ lookup('file', molecule_file) | molecule_from_yaml }}",
+                'molecule_yml': "{{ (molecule_ephemeral_directory ~ '/molecule_yml.json') | molecule_from_json }}",
                 'molecule_instance_config': "{{ lookup('env', 'MOLECULE_INSTANCE_CONFIG') }}",
                 'molecule_no_log': "{{ lookup('env', 'MOLECULE_NO_LOG') or not "
                 "molecule_yml.provisioner.log|default(False) | bool }}",
@@ -309,7 +326,7 @@ def test_inventory_property(_instance):
                 'molecule_file': "{{ lookup('env', 'MOLECULE_FILE') }}",
                 'molecule_ephemeral_directory': "{{ lookup('env', 'MOLECULE_EPHEMERAL_DIRECTORY') }}",
                 'molecule_scenario_directory': "{{ lookup('env', 'MOLECULE_SCENARIO_DIRECTORY') }}",
-                'molecule_yml': "{{ lookup('file', molecule_file) | molecule_from_yaml }}",
+                'molecule_yml': "{{ (molecule_ephemeral_directory ~ '/molecule_yml.json') | molecule_from_json }}",
                 'molecule_instance_config': "{{ lookup('env', 'MOLECULE_INSTANCE_CONFIG') }}",
                 'molecule_no_log': "{{ lookup('env', 'MOLECULE_NO_LOG') or not "
                 "molecule_yml.provisioner.log|default(False) | bool }}",
@@ -336,7 +353,7 @@ def test_inventory_property(_instance):
                 'molecule_file': "{{ lookup('env', 'MOLECULE_FILE') }}",
                 'molecule_ephemeral_directory': "{{ lookup('env', 'MOLECULE_EPHEMERAL_DIRECTORY') }}",
                 'molecule_scenario_directory': "{{ lookup('env', 'MOLECULE_SCENARIO_DIRECTORY') }}",
-                'molecule_yml': "{{ lookup('file', molecule_file) | molecule_from_yaml }}",
+                'molecule_yml': "{{ (molecule_ephemeral_directory ~ '/molecule_yml.json') | molecule_from_json }}",
                 'molecule_instance_config': "{{ lookup('env', 'MOLECULE_INSTANCE_CONFIG') }}",
                 'molecule_no_log': "{{ lookup('env', 'MOLECULE_NO_LOG') or not "
                 "molecule_yml.provisioner.log|default(False) | bool }}",
@@ -355,7 +372,7 @@ def test_inventory_property(_instance):
                 'molecule_file': "{{ lookup('env', 'MOLECULE_FILE') }}",
                 'molecule_ephemeral_directory': "{{ lookup('env', 'MOLECULE_EPHEMERAL_DIRECTORY') }}",
                 'molecule_scenario_directory': "{{ lookup('env', 'MOLECULE_SCENARIO_DIRECTORY') }}",
-                'molecule_yml': "{{ lookup('file', molecule_file) | molecule_from_yaml }}",
+                'molecule_yml': "{{ (molecule_ephemeral_directory ~ '/molecule_yml.json') | molecule_from_json }}",
                 'molecule_instance_config': "{{ lookup('env', 'MOLECULE_INSTANCE_CONFIG') }}",
                 'molecule_no_log': "{{ lookup('env', 'MOLECULE_NO_LOG') or not "
                 "molecule_yml.provisioner.log|default(False) | bool }}",
@@ -390,7 +407,7 @@ def test_inventory_property_handles_missing_groups(temp_dir, _instance):
                 'molecule_file': "{{ lookup('env', 'MOLECULE_FILE') }}",
                 'molecule_ephemeral_directory': "{{ lookup('env', 'MOLECULE_EPHEMERAL_DIRECTORY') }}",
                 'molecule_scenario_directory': "{{ lookup('env', 'MOLECULE_SCENARIO_DIRECTORY') }}",
-                'molecule_yml': "{{ lookup('file', molecule_file) | molecule_from_yaml }}",
+                'molecule_yml': "{{ (molecule_ephemeral_directory ~ '/molecule_yml.json') | molecule_from_json }}",
                 'molecule_instance_config': "{{ lookup('env', 'MOLECULE_INSTANCE_CONFIG') }}",
                 'molecule_no_log': "{{ lookup('env', 'MOLECULE_NO_LOG') or not "
                 "molecule_yml.provisioner.log|default(False) | bool }}",
@@ -414,6 +431,37 @@ def test_inventory_file_property(_instance):
     assert x == _instance.inventory_file
 
 
+def test_molecule_yml_file_property(_instance):
+    x = os.path.join(
+        _instance._config.scenario.ephemeral_directory, 'molecule_yml.json'
+    )
+
+    assert x == _instance.molecule_yml_file
+
+
+def test_events_file_property(_instance):
+    x = os.path.join(
+        _instance._config.scenario.ephemeral_directory, 'ansible_events.jsonl'
+    )
+
+    assert x == _instance.events_file
+
+
+def test_events_file_property_from_environment(monkeypatch, _instance):
+    monkeypatch.setenv('MOLECULE_EVENTS_FILE', 'events.jsonl')
+    x = os.path.join(_instance._config.scenario.directory, 'events.jsonl')
+
+    assert x == _instance.events_file
+
+
+def test_events_file_property_from_provisioner_env(_instance):
+    _instance._config.config['provisioner']['env'] = {
+        'MOLECULE_EVENTS_FILE': '/tmp/events.jsonl'
+    }
+
+    assert '/tmp/events.jsonl' == _instance.events_file
+
+
 def test_config_file_property(_instance):
     x = os.path.join(_instance._config.scenario.ephemeral_directory, 'ansible.cfg')
 
@@ -580,6 +628,51 @@ def test_write_config(temp_dir, _instance):
     _instance.write_config()
 
     assert os.path.isfile(_instance.config_file)
+    assert os.path.isfile(_instance.molecule_yml_file)
+
+
+def test_write_molecule_yml(_instance):
+    _instance._write_molecule_yml()
+
+    with open(_instance.molecule_yml_file) as stream:
+        result = json.load(stream)
+
+    assert 'docker' == result['driver']['name']
+    assert ['instance-1', 'instance-2'] == [p['name'] for p in result['platforms']]
+
+
+def test_write_molecule_yml_interpolates_with_provisioner_env(molecule_data, _instance):
+    molecule_data['platforms'] = [{'name': '$MOLECULE_SCENARIO_NAME'}]
+    pytest.helpers.write_molecule_file(_instance._config.molecule_file, molecule_data)
+    _instance._write_molecule_yml()
+
+    with open(_instance.molecule_yml_file) as stream:
+        result = json.load(stream)
+
+    assert [{'name': 'default'}] == result['platforms']
+
+
+def test_write_molecule_yml_parallelizes_platforms(_instance):
+    _instance._config.state.change_state('is_parallel', True)
+    _instance._config.state.change_state('run_uuid', 'uuid')
+    _instance._write_molecule_yml()
+
+    with open(_instance.molecule_yml_file) as stream:
+        result = json.load(stream)
+
+    x = ['instance-1-uuid', 'instance-2-uuid']
+    assert x == [p['name'] for p in result['platforms']]
+
+
+def test_update_inventory(mocker, _instance):
+    patched_remove_vars = mocker.patch(
+        'molecule.provisioner.ansible.Ansible._remove_vars'
+    )
+    _instance.update_inventory()
+
+    assert os.path.isfile(_instance.inventory_file)
+    assert _instance.inventory == util.safe_load_file(_instance.inventory_file)
+    assert not patched_remove_vars.called
 
 
 def test_manage_inventory(
@@ -719,7 +812,7 @@ def test_write_inventory(temp_dir, _instance):
                 'molecule_file': "{{ lookup('env', 'MOLECULE_FILE') }}",
                 'molecule_ephemeral_directory': "{{ lookup('env', 'MOLECULE_EPHEMERAL_DIRECTORY') }}",
                 'molecule_scenario_directory': "{{ lookup('env', 'MOLECULE_SCENARIO_DIRECTORY') }}",
-                'molecule_yml': "{{ lookup('file', molecule_file) | molecule_from_yaml }}",
+                'molecule_yml': "{{ (molecule_ephemeral_directory ~ '/molecule_yml.json') | molecule_from_json }}",
                 'molecule_instance_config': "{{ lookup('env', 'MOLECULE_INSTANCE_CONFIG') }}",
                 'molecule_no_log': "{{ lookup('env', 'MOLECULE_NO_LOG') or not "
                 "molecule_yml.provisioner.log|default(False) | bool }}",
@@ -734,7 +827,7 @@ def test_write_inventory(temp_dir, _instance):
                 'molecule_file': "{{ lookup('env', 'MOLECULE_FILE') }}",
                 'molecule_ephemeral_directory': "{{ lookup('env', 'MOLECULE_EPHEMERAL_DIRECTORY') }}",
                 'molecule_scenario_directory': "{{ lookup('env', 'MOLECULE_SCENARIO_DIRECTORY') }}",
-                'molecule_yml': "{{ lookup('file', molecule_file) | molecule_from_yaml }}",
+                'molecule_yml': "{{ (molecule_ephemeral_directory ~ '/molecule_yml.json') | molecule_from_json }}",
                 'molecule_instance_config': "{{ lookup('env', 'MOLECULE_INSTANCE_CONFIG') }}",
                 'molecule_no_log': "{{ lookup('env', 'MOLECULE_NO_LOG') or not "
                 "molecule_yml.provisioner.log|default(False) | bool }}",
@@ -761,7 +854,7 @@ def test_write_inventory(temp_dir, _instance):
                 'molecule_file': "{{ lookup('env', 'MOLECULE_FILE') }}",
                 'molecule_ephemeral_directory': "{{ lookup('env', 'MOLECULE_EPHEMERAL_DIRECTORY') }}",
                 'molecule_scenario_directory': "{{ lookup('env', 'MOLECULE_SCENARIO_DIRECTORY') }}",
-                'molecule_yml': "{{ lookup('file', molecule_file) | molecule_from_yaml }}",
+                'molecule_yml': "{{ (molecule_ephemeral_directory ~ '/molecule_yml.json') | molecule_from_json }}",
                 'molecule_instance_config': "{{ lookup('env', 'MOLECULE_INSTANCE_CONFIG') }}",
                 'molecule_no_log': "{{ lookup('env', 'MOLECULE_NO_LOG') or not "
                 "molecule_yml.provisioner.log|default(False) | bool }}",
@@ -780,7 +873,7 @@ def test_write_inventory(temp_dir, _instance):
                 'molecule_file': "{{ lookup('env', 'MOLECULE_FILE') }}",
                 'molecule_ephemeral_directory': "{{ lookup('env', 'MOLECULE_EPHEMERAL_DIRECTORY') }}",
                 'molecule_scenario_directory': "{{ lookup('env', 'MOLECULE_SCENARIO_DIRECTORY') }}",
-                'molecule_yml': "{{ lookup('file', molecule_file) | molecule_from_yaml }}",
+                'molecule_yml': "{{ (molecule_ephemeral_directory ~ '/molecule_yml.json') | molecule_from_json }}",
                 'molecule_instance_config': "{{ lookup('env', 'MOLECULE_INSTANCE_CONFIG') }}",
                 'molecule_no_log': "{{ lookup('env', 'MOLECULE_NO_LOG') or not "
                 "molecule_yml.provisioner.log|default(False) | bool }}",
@@ -933,6 +1026,28 @@ def test_get_filter_plugin_directory(_instance):
     assert x == parts[-5:]
 
 
+def test_get_callback_plugin_directory(_instance):
+    result = _instance._get_callback_plugin_directory()
+    parts = pytest.helpers.os_split(result)
+    x = ('molecule', 'provisioner', 'ansible', 'plugins', 'callbacks')
+
+    assert x == parts[-5:]
+
+
+def test_events(_instance):
+    with open(_instance.events_file, 'w') as stream:
+        stream.write('{"event": "playbook_start"}\n')
+        stream.write('{"event": "task_start"}\n')
+        stream.write('{"event": "task_')
+    x = [{'event': 'playbook_start'}, {'event': 'task_start'}]
+
+    assert x == list(_instance.events())
+
+
+def test_events_without_events_file(_instance):
+    assert [] == list(_instance.events())
+
+
 def test_absolute_path_for(_instance):
     env = {'foo': 'foo:bar'}
     x = ':'.join(
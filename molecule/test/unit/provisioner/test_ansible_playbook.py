@@ -18,10 +18,13 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
+import os
+
 import pytest
 import sh
 
 from molecule import config
+from molecule import util
 from molecule.provisioner import ansible_playbook
 
 
@@ -205,6 +208,132 @@ def test_executes_catches_and_exits_return_code_with_stdout(
     patched_logger_critical.assert_called_once_with(msg)
 
 
+@pytest.fixture
+def _patched_worker_run(mocker):
+    m = mocker.patch('molecule.provisioner.ansible_worker.run')
+    m.return_value = 0
+
+    return m
+
+
+def test_execute_in_worker(patched_run_command, _patched_worker_run, _instance):
+    _instance._config.config['provisioner']['executor'] = 'worker'
+    _instance._ansible_command = 'patched-command'
+    result = _instance.execute()
+
+    _patched_worker_run.assert_called_once_with(
+        'patched-command', _instance._log_file, out=_instance._out
+    )
+    assert not patched_run_command.called
+    assert '' == result
+
+
+def test_execute_in_worker_exits_with_return_code(
+    _patched_worker_run, patched_logger_critical, _instance
+):
+    _instance._config.config['provisioner']['executor'] = 'worker'
+    _instance._ansible_command = 'patched-command'
+    _patched_worker_run.return_value = 2
+    with pytest.raises(SystemExit) as e:
+        _instance.execute()
+
+    assert 2 == e.value.code
+
+    patched_logger_critical.assert_called_once_with('')
+
+
+def test_execute_in_worker_quietly_exits_with_log_file(
+    _patched_worker_run, patched_logger_critical, _instance
+):
+    _instance._config.config['provisioner']['executor'] = 'worker'
+    _instance._ansible_command = 'patched-command'
+    _instance._out = None
+    _instance._err = None
+    with open(_instance._log_file, 'w') as stream:
+        stream.write('out')
+    _patched_worker_run.return_value = 2
+    with pytest.raises(SystemExit) as e:
+        _instance.execute()
+
+    assert 2 == e.value.code
+
+    patched_logger_critical.assert_called_once_with('out')
+    assert not os.path.exists(_instance._log_file)
+
+
+def test_log_file_private_member(mocker, _instance):
+    mocker.patch('os.getpid', return_value=42)
+    x = os.path.join(
+        _instance._config.scenario.ephemeral_directory,
+        'ansible-playbook-playbook-42.log',
+    )
+
+    assert x == _instance._log_file
+
+
+def test_execute_quietly_writes_output_to_log_file(
+    patched_run_command, _inventory_directory, _instance
+):
+    _instance._out = None
+    _instance._err = None
+    result = _instance.execute()
+
+    assert '' == result
+    assert not os.path.exists(_instance._log_file)
+
+    cmd = patched_run_command.mock_calls[0][1][0]
+    assert cmd._partial_call_args['out'].name == _instance._log_file
+    assert cmd._partial_call_args['err'].name == _instance._log_file
+
+
+def test_execute_quietly_exits_with_log_file(
+    mocker, patched_run_command, patched_logger_critical, _instance
+):
+    _instance._out = None
+    _instance._err = None
+
+    def _run_command(cmd, debug=False):
+        cmd._partial_call_args['out'].write('out')
+        raise sh.ErrorReturnCode_2(sh.ansible_playbook, b'', b'')
+
+    patched_run_command.side_effect = _run_command
+    with pytest.raises(SystemExit) as e:
+        _instance.execute()
+
+    assert 2 == e.value.code
+
+    patched_logger_critical.assert_called_once_with('out')
+
+
+def test_execute_removes_previous_events(patched_run_command, _instance):
+    events_file = _instance._config.provisioner.events_file
+    util.write_file(events_file, '{}')
+    _instance.execute()
+
+    assert not os.path.exists(events_file)
+
+
+def test_execute_keeps_events_when_syntax_checking(patched_run_command, _instance):
+    events_file = _instance._config.provisioner.events_file
+    util.write_file(events_file, '{}')
+    _instance.add_cli_arg('syntax-check', True)
+    _instance.execute()
+
+    assert os.path.exists(events_file)
+
+
+def test_execute_falls_back_to_subprocess_when_worker_cannot_start(
+    mocker, patched_run_command, _patched_worker_run, _instance
+):
+    mocker.patch('molecule.provisioner.ansible_worker.can_start', return_value=False)
+    _instance._config.config['provisioner']['executor'] = 'worker'
+    _instance._ansible_command = 'patched-command'
+    _instance.execute()
+
+    assert not _patched_worker_run.called
+    patched_run_command.assert_called_once_with('patched-command', debug=False)
+
+
 def test_add_cli_arg(_instance):
     assert {} == _instance._cli
 
@@ -0,0 +1,138 @@
+#  Copyright (c) 2019 Red Hat, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import os
+
+import pytest
+import sh
+from ansible import errors
+
+from molecule.provisioner import ansible_worker
+
+
+@pytest.fixture
+def _log_file(temp_dir):
+    return os.path.join(temp_dir.strpath, 'ansible-playbook.log')
+
+
+def _fake_run_playbook(args, cwd):
+    # pytest replaces ``sys.stdout``, write to the redirected descriptor
+    os.write(1, 'running {} in {}\n'.format(' '.join(args), cwd).encode())
+    os.write(2, b'no trailing newline')
+
+    return 2
+
+
+def test_worker_run_streams_output_and_returns_exit_code(mocker, _log_file):
+    mocker.patch(
+        'molecule.provisioner.ansible_worker._run_playbook', _fake_run_playbook
+    )
+    lines = []
+    worker = ansible_worker.Worker({'FOO': 'bar'})
+    try:
+        exit_code = worker.run(['playbook.yml'], '/tmp', _log_file, out=lines.append)
+        assert worker.alive
+    finally:
+        worker.stop()
+
+    x = ['running playbook.yml in /tmp\n', 'no trailing newline']
+
+    assert 2 == exit_code
+    assert x == lines
+    assert ''.join(x) == open(_log_file).read()
+    assert not worker.alive
+
+
+def test_worker_run_returns_exit_code_when_the_worker_dies(mocker, _log_file):
+    mocker.patch(
+        'molecule.provisioner.ansible_worker._run_playbook',
+        lambda args, cwd: os._exit(3),
+    )
+    worker = ansible_worker.Worker({})
+    try:
+        exit_code = worker.run(['playbook.yml'], '/tmp', _log_file)
+    finally:
+        worker.stop()
+
+    assert 3 == exit_code
+    msg = 'The Ansible worker exited unexpectedly (3).\n'
+    assert msg == open(_log_file).read()
+
+
+def test_run(mocker, _log_file):
+    m = mocker.patch('molecule.provisioner.ansible_worker._get_worker')
+    cmd = sh.ansible_playbook.bake(
+        'playbook.yml', '--inventory=foo', _cwd='/tmp', _env={'FOO': 'bar'}
+    )
+    ansible_worker.run(cmd, _log_file, out='patched-out')
+
+    m.assert_called_once_with({'FOO': 'bar'})
+    m.return_value.run.assert_called_once_with(
+        ['playbook.yml', '--inventory=foo'], '/tmp', _log_file, out='patched-out'
+    )
+
+
+def test_get_worker_reuses_worker_of_same_environment(mocker):
+    m = mocker.patch('molecule.provisioner.ansible_worker.Worker')
+    mocker.patch.dict(ansible_worker._WORKERS, clear=True)
+    worker = ansible_worker._get_worker({'FOO': 'bar'})
+
+    assert worker is ansible_worker._get_worker({'FOO': 'bar'})
+    m.assert_called_once_with({'FOO': 'bar'})
+
+
+def test_get_worker_replaces_worker_of_other_environment(mocker):
+    m = mocker.patch('molecule.provisioner.ansible_worker.Worker')
+    m.side_effect = [mocker.Mock(), mocker.Mock()]
+    mocker.patch.dict(ansible_worker._WORKERS, clear=True)
+    first = ansible_worker._get_worker({'FOO': 'bar'})
+    second = ansible_worker._get_worker({'FOO': 'baz'})
+
+    assert first is not second
+    first.stop.assert_called_once_with()
+    assert [second] == list(ansible_worker._WORKERS.values())
+
+
+@pytest.mark.parametrize(
+    'exception, exit_code',
+    [
+        (errors.AnsibleOptionsError('foo'), 5),
+        (errors.AnsibleParserError('foo'), 4),
+        (errors.AnsibleError('foo'), 1),
+        (KeyboardInterrupt(), 99),
+        (ValueError('foo'), 250),
+    ],
+)
+def test_run_playbook_maps_errors_to_exit_codes(mocker, temp_dir, exception, exit_code):
+    m = mocker.patch('ansible.cli.playbook.PlaybookCLI')
+    m.return_value.run.side_effect = exception
+    mocker.patch('os.chdir')
+
+    assert exit_code == ansible_worker._run_playbook(['playbook.yml'], '/tmp')
+
+
+def test_run_playbook(mocker):
+    m = mocker.patch('ansible.cli.playbook.PlaybookCLI')
+    m.return_value.run.return_value = 0
+    patched_chdir = mocker.patch('os.chdir')
+
+    assert 0 == ansible_worker._run_playbook(['playbook.yml'], '/tmp')
+    m.assert_called_once_with(['ansible-playbook', 'playbook.yml'])
+    patched_chdir.assert_called_once_with('/tmp')
@@ -0,0 +1,135 @@
+#  Copyright (c) 2019 Red Hat, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+
+import imp
+import json
+import os
+
+import pytest
+from ansible.errors import AnsibleFilterError
+from ansible.parsing.dataloader import DataLoader
+from ansible.plugins.loader import filter_loader
+from ansible.template import Templar
+
+import molecule
+
+
+@pytest.fixture
+def molecule_core():
+    # the filter plugin is loaded by Ansible from a path, as the
+    # ``molecule.provisioner.ansible`` module shadows the plugins directory
+    path = os.path.join(
+        os.path.dirname(molecule.__file__),
+        'provisioner',
+        'ansible',
+        'plugins',
+        'filters',
+        'molecule_core.py',
+    )
+
+    return imp.load_source('molecule_core', path)
+
+
+@pytest.fixture
+def _molecule_yml_file(temp_dir):
+    filename = os.path.join(temp_dir.strpath, 'molecule_yml.json')
+    with open(filename, 'w') as stream:
+        json.dump({'platforms': [{'name': 'instance', 'image': '{{ image }}'}]}, stream)
+
+    return filename
+
+
+def test_from_json(molecule_core, _molecule_yml_file):
+    x = {'platforms': [{'name': 'instance', 'image': '{{ image }}'}]}
+
+    assert x == molecule_core.from_json(_molecule_yml_file)
+
+
+def test_from_json_reads_file_once(mocker, molecule_core, _molecule_yml_file):
+    m = mocker.patch.object(molecule_core.json, 'load', wraps=json.load)
+    molecule_core.from_json(_molecule_yml_file)
+    result = molecule_core.from_json(_molecule_yml_file)
+    result['platforms'] = []
+
+    assert 1 == m.call_count
+    assert 1 == len(molecule_core.from_json(_molecule_yml_file)['platforms'])
+
+
+def test_from_json_reads_changed_file(molecule_core, _molecule_yml_file):
+    molecule_core.from_json(_molecule_yml_file)
+    with open(_molecule_yml_file, 'w') as stream:
+        json.dump({'platforms': []}, stream)
+
+    assert {'platforms': []} == molecule_core.from_json(_molecule_yml_file)
+
+
+def test_from_json_raises_when_missing(molecule_core, temp_dir):
+    with pytest.raises(AnsibleFilterError):
+        molecule_core.from_json(os.path.join(temp_dir.strpath, 'missing.json'))
+
+
+def test_from_json_result_is_templated(molecule_core, temp_dir, _molecule_yml_file):
+    # the inventory reads ``molecule_yml`` through the filter, unlike the
+    # result of a lookup its values are templated by Ansible, as they are
+    # when looping over the platforms
+    filter_loader.add_directory(os.path.dirname(molecule_core.__file__))
+    variables = {
+        'image': 'centos:7',
+        'molecule_ephemeral_directory': temp_dir.strpath,
+        'molecule_yml': (
+            "{{ (molecule_ephemeral_directory ~ '/molecule_yml.json') "
+            '| molecule_from_json }}'
+        ),
+    }
+    templar = Templar(loader=DataLoader(), variables=variables)
+    platforms = templar.template('{{ molecule_yml.platforms }}')
+    templar.set_available_variables(dict(variables, item=platforms[0]))
+
+    assert 'centos:7' == templar.template('{{ item.image }}')
+
+
+def test_image_fingerprint(molecule_core):
+    x = molecule_core.image_fingerprint('FROM centos:7', {'foo': 'bar'}, 'sha256:1')
+
+    assert 64 == len(x)
+    assert x == molecule_core.image_fingerprint(
+        'FROM centos:7', {'foo': 'bar'}, 'sha256:1'
+    )
+
+
+def test_image_fingerprint_changes_with_inputs(molecule_core):
+    x = molecule_core.image_fingerprint('FROM centos:7', {}, 'sha256:1')
+
+    assert x != molecule_core.image_fingerprint('FROM centos:8', {}, 'sha256:1')
+    assert x != molecule_core.image_fingerprint('FROM centos:7', {'a': 'b'}, 'sha256:1')
+    assert x != molecule_core.image_fingerprint('FROM centos:7', {}, 'sha256:2')
+
+
+def test_image_label(molecule_core):
+    image = {'Config': {'Labels': {'foo': 'bar'}}}
+
+    assert 'bar' == molecule_core.image_label(image, 'foo')
+    assert '' == molecule_core.image_label(image, 'baz')
+
+
+def test_image_label_without_image(molecule_core):
+    assert '' == molecule_core.image_label({}, 'foo')
+    assert '' == molecule_core.image_label({'Config': {'Labels': None}}, 'foo')
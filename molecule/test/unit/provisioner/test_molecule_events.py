@@ -0,0 +1,167 @@
+#  Copyright (c) 2019 Red Hat, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import imp
+import json
+import os
+
+import pytest
+
+import molecule
+
+
+@pytest.fixture
+def molecule_events():
+    # the callback plugin is loaded by Ansible from a path, as the
+    # ``molecule.provisioner.ansible`` module shadows the plugins directory
+    path = os.path.join(
+        os.path.dirname(molecule.__file__),
+        'provisioner',
+        'ansible',
+        'plugins',
+        'callbacks',
+        'molecule_events.py',
+    )
+
+    return imp.load_source('molecule_events', path)
+
+
+@pytest.fixture
+def _events_file(temp_dir, monkeypatch):
+    filename = os.path.join(temp_dir.strpath, 'events.jsonl')
+    monkeypatch.setenv('MOLECULE_EVENTS_FILE', filename)
+
+    return filename
+
+
+def _task(mocker, name, uuid):
+    task = mocker.Mock(_uuid=uuid)
+    task.get_name.return_value = name
+
+    return task
+
+
+def _result(mocker, host, task, changed=False):
+    result = mocker.Mock(_task=task, _result={'changed': changed})
+    result._host.get_name.return_value = host
+
+    return result
+
+
+def _read(filename):
+    with open(filename) as stream:
+        return [json.loads(line) for line in stream]
+
+
+def test_events_file(molecule_events, monkeypatch):
+    monkeypatch.delenv('MOLECULE_EVENTS_FILE', raising=False)
+    monkeypatch.setenv('MOLECULE_EPHEMERAL_DIRECTORY', '/foo')
+
+    assert '/foo/ansible_events.jsonl' == molecule_events.events_file()
+
+
+def test_events_file_from_env(molecule_events, _events_file):
+    assert _events_file == molecule_events.events_file()
+
+
+def test_events_file_outside_of_molecule(molecule_events, monkeypatch):
+    monkeypatch.delenv('MOLECULE_EVENTS_FILE', raising=False)
+    monkeypatch.delenv('MOLECULE_EPHEMERAL_DIRECTORY', raising=False)
+
+    assert molecule_events.events_file() is None
+
+
+def test_callback_writes_events(mocker, molecule_events, _events_file):
+    callback = molecule_events.CallbackModule()
+    playbook = mocker.Mock(_file_name='playbook.yml')
+    play = mocker.Mock()
+    play.get_name.return_value = 'all'
+    task = _task(mocker, 'Foo', 'task-1')
+    host = mocker.Mock()
+    host.get_name.return_value = 'instance-1'
+    stats = mocker.Mock(processed={'instance-1': 1, 'instance-2': 1})
+    stats.summarize.return_value = {'changed': 1}
+
+    callback.v2_playbook_on_start(playbook)
+    callback.v2_playbook_on_play_start(play)
+    callback.v2_playbook_on_task_start(task, False)
+    callback.v2_runner_on_start(host, task)
+    callback.v2_runner_on_ok(_result(mocker, 'instance-1', task, changed=True))
+    callback.v2_runner_on_failed(
+        _result(mocker, 'instance-2', task), ignore_errors=True
+    )
+    callback.v2_playbook_on_stats(stats)
+
+    events = _read(_events_file)
+
+    assert ['playbook_start', 'task_start', 'task_end', 'task_end', 'playbook_end'] == [
+        e['event'] for e in events
+    ]
+    assert 'playbook.yml' == events[0]['playbook']
+    assert {'play': 'all', 'task': 'Foo', 'id': 'task-1'} == {
+        k: events[1][k] for k in ('play', 'task', 'id')
+    }
+
+    ok, failed = events[2], events[3]
+    assert 'instance-1' == ok['host']
+    assert ok['changed']
+    assert not ok['failed']
+    assert ok['end'] - ok['start'] == ok['duration']
+    assert 'instance-2' == failed['host']
+    assert failed['failed']
+    assert failed['ignored']
+    assert not failed['changed']
+    assert failed['start'] == events[1]['time']
+
+    x = {'instance-1': {'changed': 1}, 'instance-2': {'changed': 1}}
+    assert x == events[4]['stats']
+
+
+def test_callback_writes_skipped_and_unreachable(mocker, molecule_events, _events_file):
+    callback = molecule_events.CallbackModule()
+    task = _task(mocker, 'Foo', 'task-1')
+
+    callback.v2_playbook_on_start(mocker.Mock(_file_name='playbook.yml'))
+    callback.v2_playbook_on_handler_task_start(task)
+    callback.v2_runner_on_skipped(_result(mocker, 'instance-1', task))
+    callback.v2_runner_on_unreachable(_result(mocker, 'instance-2', task))
+
+    skipped, unreachable = _read(_events_file)[2:]
+
+    assert skipped['skipped']
+    assert not skipped['failed']
+    assert unreachable['unreachable']
+    assert unreachable['failed']
+
+
+def test_callback_does_nothing_outside_of_molecule(
+    mocker, molecule_events, monkeypatch
+):
+    monkeypatch.delenv('MOLECULE_EVENTS_FILE', raising=False)
+    monkeypatch.delenv('MOLECULE_EPHEMERAL_DIRECTORY', raising=False)
+    patched_open = mocker.patch('molecule_events.open', create=True)
+    callback = molecule_events.CallbackModule()
+    task = _task(mocker, 'Foo', 'task-1')
+
+    callback.v2_playbook_on_start(mocker.Mock(_file_name='playbook.yml'))
+    callback.v2_playbook_on_task_start(task, False)
+    callback.v2_runner_on_ok(_result(mocker, 'instance-1', task))
+
+    assert not patched_open.called
@@ -0,0 +1,107 @@
+#  Copyright (c) 2019 Red Hat, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import sys
+
+import pytest
+
+from molecule import api
+
+
+@pytest.fixture(autouse=True)
+def _isolated_index(monkeypatch, tmpdir):
+    monkeypatch.setenv('XDG_CACHE_HOME', tmpdir.join('cache').strpath)
+    monkeypatch.delenv('MOLECULE_EPHEMERAL_DIRECTORY', raising=False)
+    _clear_caches()
+    yield
+    _clear_caches()
+
+
+def _clear_caches():
+    api.molecule_drivers.cache_clear()
+    api.load_driver.cache_clear()
+    api._driver_index.cache_clear()
+
+
+def test_molecule_drivers_does_not_import_drivers(monkeypatch):
+    monkeypatch.delitem(sys.modules, 'molecule.driver.ec2', raising=False)
+
+    assert 'ec2' in api.molecule_drivers()
+    assert 'molecule.driver.ec2' not in sys.modules
+
+
+def test_molecule_drivers_as_dict():
+    drivers = api.molecule_drivers(as_dict=True)
+
+    assert 'docker' in drivers
+    assert drivers['docker'].load
+
+
+def test_driver_index_is_reused(mocker):
+    x = api.molecule_drivers()
+    _clear_caches()
+    patched_scan = mocker.patch('molecule.api._scan_entry_points')
+
+    assert x == api.molecule_drivers()
+    assert not patched_scan.called
+
+
+def test_driver_index_is_rebuilt_when_distributions_change(mocker):
+    api.molecule_drivers()
+    _clear_caches()
+    mocker.patch('molecule.api._fingerprint', return_value='changed')
+    mocker.patch(
+        'molecule.api._scan_entry_points', return_value=[['foo', 'molecule.driver.ec2']]
+    )
+
+    assert ['foo'] == api.molecule_drivers()
+
+
+def test_load_driver():
+    from molecule.driver import docker
+
+    assert docker is api.load_driver('docker')
+
+
+def test_load_driver_exits_when_broken(mocker, patched_logger_critical):
+    mocker.patch(
+        'molecule.api._scan_entry_points',
+        return_value=[['broken', 'molecule.driver.broken:load']],
+    )
+
+    with pytest.raises(SystemExit) as e:
+        api.load_driver('broken')
+
+    assert 1 == e.value.code
+    msg = patched_logger_critical.call_args[0][0]
+    assert msg.startswith('Failed to load broken driver: ')
+
+
+def test_molecule_drivers_as_dict_skips_broken_drivers(mocker, patched_logger_error):
+    mocker.patch(
+        'molecule.api._scan_entry_points',
+        return_value=[
+            ['broken', 'molecule.driver.broken:load'],
+            ['docker', 'molecule.driver.docker'],
+        ],
+    )
+
+    assert ['docker'] == list(api.molecule_drivers(as_dict=True))
+    assert patched_logger_error.called
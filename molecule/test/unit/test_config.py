@@ -32,6 +32,7 @@
 from molecule.dependency import gilt
 from molecule.dependency import shell
 from molecule.lint import yamllint
+from molecule.model import schema_v2
 from molecule.provisioner import ansible
 from molecule.verifier import goss
 from molecule.verifier import inspec
@@ -57,6 +58,27 @@ def test_debug_property(config_instance):
     assert not config_instance.debug
 
 
+def test_timings_property(config_instance):
+    assert not config_instance.timings
+
+    config_instance.args = {'timings': True}
+    assert config_instance.timings
+
+
+def test_lint_cache_property(config_instance):
+    assert not config_instance.lint_cache
+
+    config_instance.args = {'lint_cache': True}
+    assert config_instance.lint_cache
+
+
+def test_config_cache_property(config_instance):
+    assert not config_instance.config_cache
+
+    config_instance.args = {'config_cache': True}
+    assert config_instance.config_cache
+
+
 def test_env_file_property(config_instance):
     config_instance.args = {'env_file': '.env'}
     result = config_instance.env_file
@@ -205,6 +227,37 @@ def test_env(config_instance):
     assert x == config_instance.env
 
 
+def test_init_does_not_build_unused_subsystems(
+    mocker, molecule_file_fixture, molecule_data
+):
+    patched_dependency = mocker.patch(
+        'molecule.dependency.ansible_galaxy.AnsibleGalaxy'
+    )
+    patched_lint = mocker.patch('molecule.lint.yamllint.Yamllint')
+    patched_provisioner = mocker.patch('molecule.provisioner.ansible.Ansible')
+    patched_verifier = mocker.patch('molecule.verifier.testinfra.Testinfra')
+    patched_state = mocker.patch('molecule.state.State')
+    patched_load_driver = mocker.patch('molecule.api.load_driver')
+    pytest.helpers.write_molecule_file(molecule_file_fixture, molecule_data)
+    c = config.Config(molecule_file_fixture)
+
+    assert 'galaxy' == c.env['MOLECULE_DEPENDENCY_NAME']
+    assert 'yamllint' == c.env['MOLECULE_LINT_NAME']
+    assert 'docker' == c.env['MOLECULE_DRIVER_NAME']
+    assert not patched_dependency.called
+    assert not patched_lint.called
+    assert not patched_provisioner.called
+    assert not patched_verifier.called
+    assert not patched_state.called
+    assert not patched_load_driver.called
+
+
+def test_env_reads_driver_name_from_state_file(config_instance):
+    config_instance.state.change_state('driver', 'state-driver')
+
+    assert 'state-driver' == config_instance.env['MOLECULE_DRIVER_NAME']
+
+
 def test_lint_property(config_instance):
     assert isinstance(config_instance.lint, yamllint.Yamllint)
 
@@ -322,6 +375,146 @@ def test_reget_config(config_instance):
     assert isinstance(config_instance._reget_config(), dict)
 
 
+def test_init_reads_and_preflights_each_file_once(
+    mocker, molecule_file_fixture, molecule_data
+):
+    pytest.helpers.write_molecule_file(molecule_file_fixture, molecule_data)
+    util.write_file('.env.yml', util.safe_dump({'FOO': 'bar'}))
+    util.write_file('base.yml', util.safe_dump({'foo': 'bar'}))
+    patched_open_file = mocker.spy(util, 'open_file')
+    patched_safe_load_file = mocker.spy(util, 'safe_load_file')
+    patched_pre_validate = mocker.spy(schema_v2, 'pre_validate')
+    patched_validate = mocker.spy(schema_v2, 'validate')
+    config.Config(
+        molecule_file_fixture, args={'base_config': 'base.yml', 'env_file': '.env.yml'}
+    )
+
+    opened = [c[0][0] for c in patched_open_file.call_args_list]
+    assert 1 == opened.count('base.yml')
+    assert 1 == opened.count(molecule_file_fixture)
+    assert 1 == patched_safe_load_file.call_args_list.count(
+        mocker.call(util.abs_path('.env.yml'))
+    )
+    assert 2 == patched_pre_validate.call_count
+    assert 1 == patched_validate.call_count
+
+
+@pytest.fixture
+def _cached_config(monkeypatch, tmpdir, molecule_file_fixture, molecule_data):
+    monkeypatch.setenv('XDG_CACHE_HOME', tmpdir.join('cache').strpath)
+    monkeypatch.delenv('MOLECULE_EPHEMERAL_DIRECTORY', raising=False)
+    monkeypatch.setenv('FOO', 'foo')
+    molecule_data['platforms'][0]['name'] = '${MOLECULE_SCENARIO_NAME}-$FOO'
+    pytest.helpers.write_molecule_file(molecule_file_fixture, molecule_data)
+
+    def _config():
+        return config.Config(molecule_file_fixture, args={'config_cache': True})
+
+    return _config
+
+
+def test_init_with_config_cache_skips_loading(mocker, _cached_config):
+    c = _cached_config()
+    patched_combine = mocker.spy(config.Config, '_combine')
+    patched_preflight = mocker.spy(config.Config, '_preflight')
+    patched_validate = mocker.spy(config.Config, '_validate')
+    cached = _cached_config()
+
+    assert c.config == cached.config
+    assert 'default-foo' == cached.config['platforms'][0]['name']
+    assert not patched_combine.called
+    assert not patched_preflight.called
+    assert not patched_validate.called
+
+
+def test_init_with_config_cache_reloads_changed_file(
+    mocker, _cached_config, molecule_file_fixture, molecule_data
+):
+    _cached_config()
+    molecule_data['platforms'][0]['name'] = 'changed'
+    pytest.helpers.write_molecule_file(molecule_file_fixture, molecule_data)
+    patched_validate = mocker.spy(config.Config, '_validate')
+    c = _cached_config()
+
+    assert 'changed' == c.config['platforms'][0]['name']
+    assert 1 == patched_validate.call_count
+
+
+def test_init_with_config_cache_reloads_changed_variable(
+    mocker, monkeypatch, _cached_config
+):
+    _cached_config()
+    monkeypatch.setenv('FOO', 'bar')
+    patched_validate = mocker.spy(config.Config, '_validate')
+    c = _cached_config()
+
+    assert 'default-bar' == c.config['platforms'][0]['name']
+    assert 1 == patched_validate.call_count
+
+
+def test_init_with_config_cache_reloads_changed_molecule_variable(
+    mocker, _cached_config
+):
+    _cached_config()
+    env = config.Config.env.fget
+    mocker.patch.object(
+        config.Config,
+        'env',
+        property(lambda self: dict(env(self), MOLECULE_SCENARIO_NAME='other')),
+    )
+    patched_validate = mocker.spy(config.Config, '_validate')
+    c = _cached_config()
+
+    assert 'other-foo' == c.config['platforms'][0]['name']
+    assert 1 == patched_validate.call_count
+
+
+def test_init_without_config_cache_validates(
+    mocker, _cached_config, molecule_file_fixture
+):
+    _cached_config()
+    patched_validate = mocker.spy(config.Config, '_validate')
+    config.Config(molecule_file_fixture, args={'config_cache': False})
+
+    assert 1 == patched_validate.call_count
+
+
+def test_init_interpolates_molecule_variables(
+    monkeypatch, molecule_file_fixture, molecule_data
+):
+    monkeypatch.setenv('FOO', 'f$o')
+    molecule_data['platforms'][0]['name'] = '${MOLECULE_SCENARIO_NAME}-$FOO'
+    molecule_data['platforms'][0]['foo'] = '$$FOO'
+    molecule_data['provisioner']['options'] = {'diff': '$MOLECULE_DEBUG'}
+    pytest.helpers.write_molecule_file(molecule_file_fixture, molecule_data)
+    c = config.Config(molecule_file_fixture)
+
+    assert 'default-f$o' == c.config['platforms'][0]['name']
+    assert '$FOO' == c.config['platforms'][0]['foo']
+    assert c.config['provisioner']['options']['diff'] is False
+
+
+def test_init_keeps_quoted_molecule_variables_strings(
+    monkeypatch, molecule_file_fixture, molecule_data
+):
+    monkeypatch.setenv('MOLECULE_VER', '1.10')
+    monkeypatch.setenv('MOLECULE_FLAG', 'no')
+    molecule_data['provisioner']['options'] = {
+        'ver': 'BRACED',
+        'flag': 'SINGLE',
+        'flags': ['DOUBLE'],
+    }
+    content = util.safe_dump(molecule_data)
+    content = content.replace('BRACED', '"${MOLECULE_VER}"')
+    content = content.replace('SINGLE', "'$MOLECULE_FLAG'")
+    content = content.replace('DOUBLE', '"$MOLECULE_FLAG"')
+    util.write_file(molecule_file_fixture, content)
+    c = config.Config(molecule_file_fixture)
+
+    x = {'ver': '1.10', 'flag': 'no', 'flags': ['no']}
+    assert x == c.config['provisioner']['options']
+
+
 def test_interpolate(patched_logger_critical, config_instance):
     string = 'foo: $HOME'
     x = 'foo: {}'.format(os.environ['HOME'])
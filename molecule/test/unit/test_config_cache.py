@@ -0,0 +1,110 @@
+#  Copyright (c) 2019 Red Hat, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import os
+
+import pytest
+
+from molecule import config_cache
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(monkeypatch, tmpdir):
+    monkeypatch.setenv('XDG_CACHE_HOME', tmpdir.join('cache').strpath)
+    monkeypatch.delenv('MOLECULE_EPHEMERAL_DIRECTORY', raising=False)
+
+
+@pytest.fixture
+def _files():
+    return [('/project/molecule/default/molecule.yml', 'name: $FOO-$MOLECULE_BAR\n')]
+
+
+def _cache(files, env, env_file=None):
+    return config_cache.ConfigCache(files, env, 'MOLECULE_', env_file)
+
+
+def test_config_without_entry(_files):
+    c = _cache(_files, {})
+
+    assert c.config is None
+    assert c.get({}) is None
+
+
+def test_save(_files):
+    _cache(_files, {'FOO': 'foo'}).save(
+        {'name': 'foo-$MOLECULE_BAR'}, {'MOLECULE_BAR': 'bar'}, {'name': 'foo-bar'}
+    )
+    c = _cache(_files, {'FOO': 'foo', 'UNUSED': 'unused'})
+
+    assert {'name': 'foo-$MOLECULE_BAR'} == c.config
+    assert {'name': 'foo-bar'} == c.get({'MOLECULE_BAR': 'bar'})
+    assert c.get({'MOLECULE_BAR': 'baz'}) is None
+
+
+def test_save_skips_config_changed_by_json(_files):
+    _cache(_files, {}).save({1: 'foo'}, {}, {1: 'foo'})
+
+    assert _cache(_files, {}).config is None
+
+
+def test_save_skips_config_not_serializable_as_json(_files):
+    _cache(_files, {}).save({'foo': object()}, {}, {})
+
+    assert _cache(_files, {}).config is None
+
+
+def test_config_of_changed_variable(_files):
+    _cache(_files, {'FOO': 'foo'}).save({}, {}, {})
+
+    assert {} == _cache(_files, {'FOO': 'foo'}).config
+    assert _cache(_files, {'FOO': 'bar'}).config is None
+
+
+def test_config_of_changed_file(_files):
+    _cache(_files, {}).save({}, {}, {})
+    filename, _ = _files[0]
+
+    assert _cache([(filename, 'name: foo\n')], {}).config is None
+
+
+def test_config_of_changed_env_file(_files, tmpdir):
+    env_file = tmpdir.join('.env.yml')
+    env_file.write('FOO: foo\n')
+    _cache(_files, {}, env_file.strpath).save({}, {}, {})
+    env_file.write('FOO: bar\n')
+
+    assert _cache(_files, {}, env_file.strpath).config is None
+
+
+def test_config_of_corrupt_entry(_files):
+    c = _cache(_files, {})
+    c.save({}, {}, {})
+    with open(c._filename, 'w') as f:
+        f.write('{')
+
+    assert _cache(_files, {}).config is None
+
+
+def test_save_replaces_entry(_files):
+    _cache(_files, {'FOO': 'foo'}).save({}, {}, {})
+    _cache(_files, {'FOO': 'bar'}).save({}, {}, {})
+
+    directory = os.path.dirname(_cache(_files, {})._filename)
+    assert 1 == len(os.listdir(directory))
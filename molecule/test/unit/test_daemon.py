@@ -0,0 +1,201 @@
+#  Copyright (c) 2019 Red Hat, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import multiprocessing
+import os
+import shutil
+import socket
+import sys
+import tempfile
+import time
+
+import pytest
+
+from molecule import daemon
+
+pytestmark = pytest.mark.skipif(
+    not daemon._supported(), reason='Needs Unix sockets and Python 3'
+)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(monkeypatch):
+    # a short directory, as the path of a socket is limited
+    directory = tempfile.mkdtemp(prefix='molecule-')
+    monkeypatch.setenv('XDG_CACHE_HOME', directory)
+    monkeypatch.delenv('MOLECULE_EPHEMERAL_DIRECTORY', raising=False)
+    monkeypatch.delenv('MOLECULE_DAEMON', raising=False)
+
+    yield directory
+
+    shutil.rmtree(directory)
+
+
+class _Server(daemon.Server):
+    def _preload(self):
+        pass
+
+    def _refresh(self):
+        pass
+
+    def run(self, args):
+        # the standard streams of the client replace the ones of the daemon
+        os.write(1, 'ran {}\n'.format(' '.join(args)).encode('utf-8'))
+
+        return 3
+
+
+@pytest.fixture
+def _project(tmpdir, monkeypatch):
+    project_directory = tmpdir.mkdir('project').strpath
+    monkeypatch.chdir(project_directory)
+    process = multiprocessing.Process(target=_Server(project_directory).serve_forever)
+    process.start()
+    path = daemon.socket_path(project_directory)
+    deadline = time.time() + 10
+    while not os.path.exists(path) and time.time() < deadline:
+        time.sleep(0.01)
+
+    yield project_directory
+
+    daemon.stop(project_directory)
+    process.join(10)
+
+
+def test_socket_path_differs_per_project(_isolated_cache, tmpdir):
+    x = daemon.socket_path(tmpdir.join('foo').strpath)
+
+    assert x == daemon.socket_path(tmpdir.join('foo').strpath)
+    assert x != daemon.socket_path(tmpdir.join('bar').strpath)
+    assert x.startswith(os.path.join(_isolated_cache, 'molecule_daemon'))
+
+
+def test_socket_path_falls_back_to_temporary_directory(monkeypatch, tmpdir):
+    monkeypatch.setenv('XDG_CACHE_HOME', os.path.join(tmpdir.strpath, 'x' * 100))
+    x = daemon.socket_path(tmpdir.strpath)
+
+    directory = 'molecule_daemon-{}'.format(os.getuid())
+    assert os.path.join(tempfile.gettempdir(), directory) == os.path.dirname(x)
+    assert len(x) <= daemon._SOCKET_PATH_MAX
+
+
+def test_serve_forever_exits_when_socket_path_is_too_long(
+    monkeypatch, tmpdir, patched_logger_critical
+):
+    monkeypatch.setattr(daemon, '_SOCKET_PATH_MAX', 10)
+    with pytest.raises(SystemExit) as e:
+        _Server(tmpdir.strpath).serve_forever()
+
+    assert 1 == e.value.code
+    msg = 'The path of the socket is too long: {}'.format(
+        daemon.socket_path(tmpdir.strpath)
+    )
+    patched_logger_critical.assert_called_once_with(msg)
+
+
+def test_server_args_default_to_a_new_dict(tmpdir):
+    x = _Server(tmpdir.strpath)
+    x._args['foo'] = 'bar'
+
+    assert {} == _Server(tmpdir.strpath)._args
+
+
+@pytest.mark.parametrize(
+    'argv,x',
+    [
+        (['converge'], 'converge'),
+        (['--debug', '-c', 'base.yml', 'test', '-s', 'foo'], 'test'),
+        (['--env-file', 'env.yml', 'side-effect'], 'side-effect'),
+        (['--version'], None),
+        ([], None),
+    ],
+)
+def test_command(argv, x):
+    assert x == daemon._command(argv)
+
+
+def test_forward_without_daemon(tmpdir, monkeypatch):
+    monkeypatch.chdir(tmpdir.strpath)
+
+    assert daemon.forward(['converge']) is None
+
+
+def test_forward(_project, capfd):
+    assert 3 == daemon.forward(['converge', '-s', 'default'])
+    assert 'ran converge -s default' in capfd.readouterr().out
+
+
+@pytest.fixture
+def _short_request_timeout(monkeypatch):
+    monkeypatch.setattr(daemon, '_REQUEST_TIMEOUT', 0.1)
+
+
+def test_forward_after_a_stalled_client(_short_request_timeout, _project, capfd):
+    stalled = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stalled.connect(daemon.socket_path(_project))
+    try:
+        assert 3 == daemon.forward(['converge'])
+    finally:
+        stalled.close()
+
+    assert 'ran converge' in capfd.readouterr().out
+
+
+def test_forward_skips_commands_not_forwarded(_project):
+    assert daemon.forward(['init', 'role', '-r', 'foo']) is None
+    assert daemon.forward(['--version']) is None
+
+
+def test_forward_disabled(_project, monkeypatch):
+    monkeypatch.setenv('MOLECULE_DAEMON', 'false')
+
+    assert daemon.forward(['converge']) is None
+
+
+def test_forward_declined_for_other_molecule_variables(_project, monkeypatch):
+    monkeypatch.setenv('MOLECULE_FOO', 'bar')
+
+    assert daemon.forward(['converge']) is None
+
+
+def test_stop(_project):
+    assert daemon.stop(_project)
+    deadline = time.time() + 10
+    while os.path.exists(daemon.socket_path(_project)) and time.time() < deadline:
+        time.sleep(0.01)
+
+    assert not os.path.exists(daemon.socket_path(_project))
+    assert not daemon.stop(_project)
+
+
+def test_cleanup_stops_the_ansible_workers(mocker):
+    from molecule.provisioner import ansible_worker
+
+    patched_shutdown = mocker.patch.object(ansible_worker, 'shutdown')
+    daemon._cleanup()
+
+    patched_shutdown.assert_called_once_with()
+
+
+def test_cleanup_without_ansible_worker(mocker):
+    mocker.patch.dict(sys.modules)
+    sys.modules.pop('molecule.provisioner.ansible_worker', None)
+
+    daemon._cleanup()
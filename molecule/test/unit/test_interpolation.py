@@ -87,6 +87,61 @@ def test_interpolate_does_not_interpolate_MOLECULE_strings(_instance):
     )
 
 
+def test_interpolate_deferred_keeps_a_template(_instance, _mock_env):
+    _mock_env['FOO'] = 'f$o'
+    data = '$FOO ${MOLECULE_SCENARIO_NAME:-x}/bar $$FOO $$MOLECULE_SCENARIO_NAME'
+    x = 'f$$o ${MOLECULE_SCENARIO_NAME:-x}/bar $$FOO $$MOLECULE_SCENARIO_NAME'
+    result = _instance.interpolate(data, keep_string='MOLECULE_', defer=True)
+
+    assert x == result
+    assert _instance.interpolate(data) == _instance.interpolate(result)
+
+
+def test_interpolate_data(_instance):
+    data = {
+        'name': '$MOLECULE_SCENARIO_NAME',
+        'options': {'$FOO': ['${BAR:-def}', 'bar-${FOO}', 1]},
+        'escaped': '$$FOO',
+    }
+    x = {
+        'name': 'default',
+        'options': {'foo': ['def', 'bar-foo', 1]},
+        'escaped': '$FOO',
+    }
+
+    assert x == _instance.interpolate_data(data)
+
+
+def test_interpolate_data_does_not_interpolate_MOLECULE_strings(_instance):
+    data = {'name': 'foo ${MOLECULE_SCENARIO_NAME}', 'bar': '$FOO'}
+    x = {'name': 'foo $MOLECULE_SCENARIO_NAME', 'bar': 'foo'}
+
+    assert x == _instance.interpolate_data(data, keep_string='MOLECULE_')
+
+
+def test_interpolate_data_types_single_variables(_instance, _mock_env):
+    _mock_env.update({'PORT': '80', 'ENABLED': 'true'})
+    data = {'port': '$PORT', 'enabled': '${ENABLED}', 'ports': '$PORT:$PORT'}
+    x = {'port': 80, 'enabled': True, 'ports': '80:80'}
+
+    assert x == _instance.interpolate_data(data)
+
+
+def test_interpolate_data_keeps_quoted_variables_strings(_instance, _mock_env):
+    _mock_env.update({'VER': '1.10', 'FLAG': 'no'})
+    data = interpolation.TemplateLoader(
+        """
+ver: "${VER}"
+flag: '$FLAG'
+flags: ["$FLAG", $FLAG]
+plain: $VER
+"""
+    ).get_single_data()
+    x = {'ver': '1.10', 'flag': 'no', 'flags': ['no', False], 'plain': 1.1}
+
+    assert x == _instance.interpolate_data(data)
+
+
 def test_interpolate_with_molecule_yaml(_instance):
     data = """
 ---
@@ -0,0 +1,96 @@
+#  Copyright (c) 2019 Red Hat, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import os
+
+import pytest
+
+from molecule import profiling
+
+
+@pytest.fixture(autouse=True)
+def _reset_profiler(mocker):
+    mocker.patch('molecule.profiling._PROFILER', None)
+
+
+@pytest.fixture
+def _patched_ephemeral_directory(mocker, temp_dir):
+    m = mocker.patch('molecule.scenario.ephemeral_directory')
+    m.return_value = temp_dir.strpath
+
+    return m
+
+
+def _workload():
+    return sum(i for i in range(1000))
+
+
+def test_stop_writes_and_reports_profile(
+    mocker, patched_logger_info, _patched_ephemeral_directory
+):
+    patched_report = mocker.patch('molecule.profiling.report')
+    profiling.start()
+    _workload()
+    profiling.stop(top=5)
+
+    filename = patched_report.call_args[0][0]
+    assert os.path.isfile(filename)
+    assert filename.endswith('.pstats')
+    assert 5 == patched_report.call_args[0][1]
+    assert profiling._PROFILER is None
+    _patched_ephemeral_directory.assert_called_once_with('molecule')
+
+
+def test_stop_does_nothing_when_not_started(mocker):
+    patched_report = mocker.patch('molecule.profiling.report')
+    profiling.stop()
+
+    assert not patched_report.called
+
+
+def test_report(capsys, temp_dir, patched_logger_info, _patched_ephemeral_directory):
+    filename = profiling._get_profile_file()
+    profiling.start()
+    _workload()
+    profiling._PROFILER.disable()
+    profiling._PROFILER.dump_stats(filename)
+
+    profiling.report(filename, top=3)
+    stdout, _ = capsys.readouterr()
+
+    assert 'cumulative' in stdout
+    assert '_workload' in stdout
+
+    msg = 'Profile written to {}'.format(filename)
+    patched_logger_info.assert_called_once_with(msg)
+
+
+def test_get_profile_file_is_unique_per_process(_patched_ephemeral_directory):
+    x = '-{}.pstats'.format(os.getpid())
+
+    assert profiling._get_profile_file().endswith(x)
+
+
+def test_forked_processes_are_not_profiled():
+    profiling.start()
+    profiler = profiling._PROFILER
+    profiling._forget(profiler)
+
+    assert profiling._PROFILER is None
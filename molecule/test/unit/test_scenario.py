@@ -195,6 +195,45 @@ def test_sequence_property_with_invalid_subcommand(_instance):
     assert [] == _instance.sequence
 
 
+def test_sequence_graph_property(_instance):
+    graph = _instance.sequence_graph
+
+    assert _instance.sequence == [action for action, _ in graph]
+
+
+def test_sequence_graph():
+    sequence = [
+        'dependency',
+        'lint',
+        'cleanup',
+        'destroy',
+        'syntax',
+        'create',
+        'prepare',
+        'converge',
+        'destroy',
+    ]
+    x = [
+        ('dependency', set()),
+        ('lint', {0}),
+        ('cleanup', {0}),
+        ('destroy', {2}),
+        ('syntax', {0}),
+        ('create', {3}),
+        ('prepare', {5}),
+        ('converge', {0, 1, 2, 3, 4, 5, 6}),
+        ('destroy', {7}),
+    ]
+
+    assert x == scenario.sequence_graph(sequence)
+
+
+def test_sequence_graph_without_prerequisites():
+    x = [('syntax', set()), ('create', set())]
+
+    assert x == scenario.sequence_graph(['syntax', 'create'])
+
+
 def test_setup_creates_ephemeral_and_inventory_directories(_instance):
     ephemeral_dir = _instance.config.scenario.ephemeral_directory
     inventory_dir = _instance.config.scenario.inventory_directory
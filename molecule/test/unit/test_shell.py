@@ -18,6 +18,10 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
+import subprocess
+import sys
+
+import click
 import pytest
 
 from molecule import shell
@@ -26,3 +30,33 @@
 def test_shell():
     with pytest.raises(SystemExit):
         shell.main()
+
+
+def test_main_lists_all_commands():
+    ctx = click.Context(shell.main)
+
+    assert sorted(shell.COMMANDS) == shell.main.list_commands(ctx)
+
+
+@pytest.mark.parametrize('name', sorted(shell.COMMANDS))
+def test_main_gets_command(name):
+    ctx = click.Context(shell.main)
+
+    assert name == shell.main.get_command(ctx, name).name
+
+
+def test_main_gets_unknown_command():
+    ctx = click.Context(shell.main)
+
+    assert shell.main.get_command(ctx, 'foo') is None
+
+
+def test_import_does_not_import_subsystems():
+    code = (
+        'import sys; import molecule.shell; '
+        'print(",".join(m for m in ("molecule.config", "molecule.command.base") '
+        'if m in sys.modules))'
+    )
+    result = subprocess.check_output([sys.executable, '-c', code])
+
+    assert b'' == result.strip()
@@ -105,6 +105,13 @@ def test_change_state_raises(_instance):
         _instance.change_state('invalid-state', True)
 
 
+def test_change_state_traces_write(mocker, _instance):
+    patched_span = mocker.patch('molecule.trace.span')
+    _instance.change_state('converged', True)
+
+    patched_span.assert_called_once_with('State._write_state_file', 'state')
+
+
 def test_get_data_loads_existing_state_file(_instance, molecule_data, config_instance):
     data = {'converged': False, 'created': True, 'driver': None, 'prepared': None}
     util.write_file(_instance._state_file, util.safe_dump(data))
@@ -115,3 +122,52 @@ def test_get_data_loads_existing_state_file(_instance, molecule_data, config_ins
     assert s.created
     assert not s.driver
     assert not s.prepared
+
+
+def test_state_file_is_json_readable_as_yaml(_instance):
+    _instance.change_state('converged', True)
+    with util.open_file(_instance.state_file) as stream:
+        content = stream.read()
+
+    assert content.startswith('# Molecule managed\n\n{')
+    assert util.safe_load_file(_instance.state_file)['converged']
+
+
+def test_init_does_not_rewrite_existing_state_file(mocker, _instance, config_instance):
+    patched_write = mocker.patch('molecule.util.write_file_atomically')
+    state.State(config_instance)
+
+    assert not patched_write.called
+
+
+def test_transaction_writes_once(mocker, _instance, config_instance):
+    patched_write = mocker.patch('molecule.util.write_file_atomically')
+    with _instance.transaction():
+        _instance.change_state('created', True)
+        with _instance.transaction():
+            _instance.change_state('driver', 'docker')
+        _instance.change_state('prepared', True)
+
+        assert not patched_write.called
+
+    assert 1 == patched_write.call_count
+
+
+def test_transaction_persists(_instance, config_instance):
+    with _instance.transaction():
+        _instance.change_state('created', True)
+        _instance.change_state('driver', 'docker')
+
+    s = state.State(config_instance)
+
+    assert s.created
+    assert 'docker' == s.driver
+
+
+def test_transaction_persists_changes_made_before_an_error(_instance, config_instance):
+    with pytest.raises(RuntimeError):
+        with _instance.transaction():
+            _instance.change_state('created', True)
+            raise RuntimeError
+
+    assert state.State(config_instance).created
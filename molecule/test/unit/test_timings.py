@@ -0,0 +1,184 @@
+#  Copyright (c) 2015-2018 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import json
+import os
+
+import pytest
+
+from molecule import timings
+
+
+@pytest.fixture(autouse=True)
+def _clear_timings():
+    timings.pop()
+    yield
+    timings.pop()
+
+
+@pytest.fixture
+def _timed_config(config_instance):
+    config_instance.args = {'timings': True}
+
+    return config_instance
+
+
+def _write_events(config, events):
+    with open(config.provisioner.events_file, 'w') as stream:
+        for event in events:
+            stream.write(json.dumps(event) + '\n')
+
+
+def _step(action, duration, scenario='default'):
+    return {'scenario': scenario, 'action': action, 'start': 0, 'duration': duration}
+
+
+def _task(task, duration):
+    return {
+        'scenario': 'default',
+        'action': 'converge',
+        'task': task,
+        'host': 'instance-1',
+        'start': 0,
+        'duration': duration,
+    }
+
+
+def test_step(_timed_config):
+    with timings.step(_timed_config, 'converge'):
+        pass
+
+    records = timings.pop()
+    step = records['steps'][0]
+
+    assert 'default' == step['scenario']
+    assert 'converge' == step['action']
+    assert step['duration'] >= 0
+    assert [] == records['tasks']
+
+
+def test_step_records_failed_action(_timed_config):
+    with pytest.raises(SystemExit):
+        with timings.step(_timed_config, 'converge'):
+            raise SystemExit(1)
+
+    assert 1 == len(timings.pop()['steps'])
+
+
+def test_step_does_not_record_by_default(config_instance):
+    with timings.step(config_instance, 'converge'):
+        pass
+
+    assert {'steps': [], 'tasks': []} == timings.pop()
+
+
+def test_step_records_tasks(mocker, _timed_config):
+    mocker.patch('time.time', side_effect=[10.0, 20.0])
+    _write_events(
+        _timed_config,
+        [
+            {'event': 'playbook_start', 'time': 11.0},
+            {'event': 'task_start', 'task': 'Foo', 'time': 12.0},
+            {
+                'event': 'task_end',
+                'task': 'Foo',
+                'host': 'instance-1',
+                'start': 12.0,
+                'duration': 1.5,
+            },
+            {'event': 'playbook_end', 'time': 14.0},
+        ],
+    )
+    with timings.step(_timed_config, 'converge'):
+        pass
+
+    x = {
+        'steps': [_step('converge', 10.0)],
+        'tasks': [
+            {
+                'scenario': 'default',
+                'action': 'converge',
+                'task': 'Foo',
+                'host': 'instance-1',
+                'start': 12.0,
+                'duration': 1.5,
+            }
+        ],
+    }
+    x['steps'][0]['start'] = 10.0
+
+    assert x == timings.pop()
+
+
+def test_step_ignores_events_of_earlier_actions(mocker, _timed_config):
+    mocker.patch('time.time', side_effect=[10.0, 20.0])
+    _write_events(
+        _timed_config,
+        [
+            {'event': 'playbook_start', 'time': 5.0},
+            {'event': 'task_end', 'task': 'Foo', 'host': 'i', 'start': 6.0},
+        ],
+    )
+    with timings.step(_timed_config, 'lint'):
+        pass
+
+    assert [] == timings.pop()['tasks']
+
+
+def test_extend():
+    timings.extend({'steps': [_step('converge', 1.0)], 'tasks': [_task('Foo', 1.0)]})
+
+    x = {'steps': [_step('converge', 1.0)], 'tasks': [_task('Foo', 1.0)]}
+
+    assert x == timings.pop()
+
+
+def test_report(capsys, patched_logger_info, temp_dir):
+    filename = os.path.join(temp_dir.strpath, 'timings.json')
+    timings.extend(
+        {
+            'steps': [_step('lint', 1.0), _step('converge', 30.0)],
+            'tasks': [_task('Foo', 0.5), _task('Bar', 25.0)],
+        }
+    )
+    timings.report(filename)
+
+    out, _ = capsys.readouterr()
+    lines = out.splitlines()
+
+    assert lines[2].split() == ['default', 'converge', '30.0s']
+    assert lines[3].split() == ['default', 'lint', '1.0s']
+    assert lines[6].split() == ['default', 'converge', 'Bar', 'instance-1', '25.00s']
+
+    with open(filename) as stream:
+        data = json.load(stream)
+
+    assert 2 == len(data['steps'])
+    assert 2 == len(data['tasks'])
+
+    msg = 'Timings written to {}'.format(filename)
+    patched_logger_info.assert_any_call(msg)
+
+
+def test_report_without_records(capsys, temp_dir):
+    filename = os.path.join(temp_dir.strpath, 'timings.json')
+    timings.report(filename)
+
+    assert not os.path.exists(filename)
@@ -0,0 +1,163 @@
+#  Copyright (c) 2015-2018 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import json
+import os
+
+import pytest
+
+from molecule import trace
+
+
+@pytest.fixture(autouse=True)
+def _reset_trace(mocker):
+    mocker.patch('molecule.trace._ENABLED', False)
+    mocker.patch.dict('molecule.trace._HOSTS', clear=True)
+    trace.pop()
+    yield
+    trace.pop()
+
+
+@pytest.fixture
+def _enabled_trace():
+    trace.enable()
+    trace.pop()
+
+
+def _task(host, task='Foo', scenario='default'):
+    return {
+        'scenario': scenario,
+        'action': 'converge',
+        'task': task,
+        'host': host,
+        'start': 1.5,
+        'duration': 0.25,
+    }
+
+
+def test_enable():
+    assert not trace.enabled()
+
+    trace.enable()
+
+    assert trace.enabled()
+    x = [
+        {
+            'name': 'process_name',
+            'ph': 'M',
+            'pid': os.getpid(),
+            'tid': 0,
+            'args': {'name': 'molecule'},
+        },
+        {
+            'name': 'thread_name',
+            'ph': 'M',
+            'pid': os.getpid(),
+            'tid': 0,
+            'args': {'name': 'molecule'},
+        },
+    ]
+    assert x == trace.pop()
+
+
+def test_span(mocker, _enabled_trace):
+    mocker.patch('time.time', side_effect=[1.0, 3.5])
+    with trace.span('converge', 'action', scenario='default'):
+        pass
+
+    x = [
+        {
+            'name': 'converge',
+            'cat': 'action',
+            'ph': 'X',
+            'ts': 1000000,
+            'dur': 2500000,
+            'pid': os.getpid(),
+            'tid': 0,
+            'args': {'scenario': 'default'},
+        }
+    ]
+    assert x == trace.pop()
+
+
+def test_span_records_failures(_enabled_trace):
+    with pytest.raises(SystemExit):
+        with trace.span('converge', 'action'):
+            raise SystemExit(1)
+
+    assert ['converge'] == [e['name'] for e in trace.pop()]
+
+
+def test_span_does_nothing_when_disabled():
+    with trace.span('converge', 'action'):
+        pass
+
+    assert [] == trace.pop()
+
+
+def test_name_process_does_nothing_when_disabled():
+    trace.name_process('foo')
+
+    assert [] == trace.pop()
+
+
+def test_tasks(_enabled_trace):
+    trace.tasks([_task('instance-1'), _task('instance-2'), _task('instance-1')])
+    events = trace.pop()
+
+    metadata = [e for e in events if e['ph'] == 'M']
+    assert [(1, 'instance-1 (default)'), (2, 'instance-2 (default)')] == [
+        (e['tid'], e['args']['name']) for e in metadata
+    ]
+
+    tasks = [e for e in events if e['ph'] == 'X']
+    assert [1, 2, 1] == [e['tid'] for e in tasks]
+    assert {
+        'name': 'Foo',
+        'cat': 'task',
+        'ph': 'X',
+        'ts': 1500000,
+        'dur': 250000,
+        'pid': os.getpid(),
+        'tid': 1,
+        'args': {'scenario': 'default', 'action': 'converge', 'host': 'instance-1'},
+    } == tasks[0]
+
+
+def test_extend():
+    trace.extend([{'name': 'foo'}])
+
+    assert [{'name': 'foo'}] == trace.pop()
+
+
+def test_write(temp_dir, patched_logger_info, _enabled_trace):
+    filename = os.path.join(temp_dir.strpath, 'trace.json')
+    with trace.span('converge', 'action'):
+        pass
+    trace.write(filename)
+
+    with open(filename) as stream:
+        data = json.load(stream)
+
+    assert 'ms' == data['displayTimeUnit']
+    assert ['converge'] == [e['name'] for e in data['traceEvents']]
+
+    msg = 'Trace written to {}'.format(filename)
+    patched_logger_info.assert_called_once_with(msg)
@@ -23,6 +23,7 @@
 import binascii
 import io
 import os
+import stat
 
 import colorama
 import pytest
@@ -176,6 +177,14 @@ def test_run_command():
     assert 0 == x.exit_code
 
 
+def test_run_command_traces_command(mocker):
+    patched_span = mocker.patch('molecule.trace.span')
+    cmd = sh.ls.bake('-l')
+    util.run_command(cmd)
+
+    patched_span.assert_called_once_with('ls', 'subprocess', command=str(cmd))
+
+
 def test_run_command_with_debug(mocker, patched_print_debug):
     cmd = sh.ls.bake(_env={'ANSIBLE_FOO': 'foo', 'MOLECULE_BAR': 'bar'})
     util.run_command(cmd, debug=True)
@@ -232,6 +241,69 @@ def test_write_file(temp_dir):
     assert x == data
 
 
+def test_write_file_keeps_identical_file(temp_dir):
+    dest_file = os.path.join(temp_dir.strpath, 'test_util_write_file.tmp')
+    util.write_file(dest_file, 'foo')
+    os.utime(dest_file, (0, 0))
+    util.write_file(dest_file, 'foo')
+
+    assert 0 == os.path.getmtime(dest_file)
+
+
+def test_write_file_replaces_changed_file(temp_dir):
+    dest_file = os.path.join(temp_dir.strpath, 'test_util_write_file.tmp')
+    util.write_file(dest_file, 'foo')
+    os.utime(dest_file, (0, 0))
+    util.write_file(dest_file, 'bar')
+
+    with util.open_file(dest_file) as stream:
+        assert '# Molecule managed\n\nbar' == stream.read()
+    assert 0 != os.path.getmtime(dest_file)
+
+
+def test_write_file_atomically(temp_dir):
+    dest_file = os.path.join(temp_dir.strpath, 'test_util_write_file.tmp')
+    util.write_file(dest_file, 'foo')
+    util.write_file_atomically(dest_file, 'bar')
+
+    with util.open_file(dest_file) as stream:
+        assert 'bar' == stream.read()
+    assert ['test_util_write_file.tmp'] == os.listdir(temp_dir.strpath)
+
+
+def test_write_file_atomically_keeps_file_on_error(mocker, temp_dir):
+    dest_file = os.path.join(temp_dir.strpath, 'test_util_write_file.tmp')
+    util.write_file_atomically(dest_file, 'foo')
+    mocker.patch('os.rename', side_effect=OSError)
+
+    with pytest.raises(OSError):
+        util.write_file_atomically(dest_file, 'bar')
+
+    with util.open_file(dest_file) as stream:
+        assert 'foo' == stream.read()
+    assert ['test_util_write_file.tmp'] == os.listdir(temp_dir.strpath)
+
+
+def test_write_file_atomically_keeps_existing_mode(temp_dir):
+    dest_file = os.path.join(temp_dir.strpath, 'test_util_write_file.tmp')
+    util.write_file(dest_file, 'foo')
+    os.chmod(dest_file, 0o640)
+    util.write_file_atomically(dest_file, 'bar')
+
+    assert 0o640 == stat.S_IMODE(os.stat(dest_file).st_mode)
+
+
+def test_write_file_atomically_applies_umask_to_new_file(temp_dir):
+    dest_file = os.path.join(temp_dir.strpath, 'test_util_write_file.tmp')
+    umask = os.umask(0o022)
+    try:
+        util.write_file_atomically(dest_file, 'foo')
+    finally:
+        os.umask(umask)
+
+    assert 0o644 == stat.S_IMODE(os.stat(dest_file).st_mode)
+
+
 def molecule_prepender(content):
     x = '# Molecule managed\n\nfoo bar'
 
@@ -350,6 +422,26 @@ def test_filter_verbose_permutation():
     assert x == util.filter_verbose_permutation(options)
 
 
+def test_cached_property():
+    class Foo(object):
+        calls = 0
+
+        @util.cached_property
+        def bar(self):
+            self.calls += 1
+            return self.calls
+
+    foo = Foo()
+
+    assert 1 == foo.bar
+    assert 1 == foo.bar
+
+    foo.bar = 'baz'
+
+    assert 'baz' == foo.bar
+    assert isinstance(Foo.bar, util.cached_property)
+
+
 def test_title():
     assert 'Foo' == util.title('foo')
     assert 'Foo Bar' == util.title('foo_bar')
@@ -377,6 +469,12 @@ def test_underscore():
     assert 'foo_bar_baz' == util.underscore('FooBarBaz')
 
 
+def test_merge_strategy_is_anyconfig_ms_dicts():
+    import anyconfig
+
+    assert anyconfig.MS_DICTS == util.MERGE_STRATEGY
+
+
 def test_merge_dicts():
     # example taken from python-anyconfig/anyconfig/__init__.py
     a = {'b': [{'c': 0}, {'c': 2}], 'd': {'e': 'aaa', 'f': 3}}
@@ -0,0 +1,95 @@
+#  Copyright (c) 2019 Red Hat, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import os
+import threading
+import time
+
+import pytest
+
+from molecule import watcher
+
+
+@pytest.fixture(params=[False, True], ids=['inotify', 'poll'])
+def _watcher(request, tmpdir, monkeypatch):
+    monkeypatch.setattr(watcher, 'POLL_INTERVAL', 0.05)
+    tmpdir.mkdir('tasks')
+    w = watcher.Watcher([tmpdir.strpath], poll=request.param)
+    yield w
+    w.close()
+
+
+def _write_later(*paths):
+    def write():
+        time.sleep(0.1)
+        for path in paths:
+            if not os.path.isdir(os.path.dirname(path)):
+                os.makedirs(os.path.dirname(path))
+            with open(path, 'a') as f:
+                f.write('foo\n')
+
+    t = threading.Thread(target=write)
+    t.start()
+
+    return t
+
+
+def test_wait(_watcher, tmpdir):
+    x = [tmpdir.join('tasks', 'main.yml').strpath]
+    t = _write_later(*x)
+    changed = _watcher.wait(debounce=0.2)
+    t.join()
+
+    assert x == changed
+
+
+def test_wait_skips_excluded_files(_watcher, tmpdir):
+    x = [tmpdir.join('tasks', 'main.yml').strpath]
+    t = _write_later(
+        tmpdir.join('tasks', '.main.yml.swp').strpath,
+        tmpdir.join('.git', 'index').strpath,
+        x[0],
+    )
+    changed = _watcher.wait(debounce=0.2)
+    t.join()
+
+    assert x == [path for path in changed if not os.path.isdir(path)]
+
+
+def test_wait_watches_new_directories(_watcher, tmpdir):
+    path = tmpdir.join('templates', 'foo', 'bar.j2').strpath
+    t = _write_later(path)
+    changed = _watcher.wait(debounce=0.2)
+    t.join()
+
+    assert path in changed
+
+
+def test_watcher_watches_outermost_directories(tmpdir):
+    tmpdir.mkdir('molecule').mkdir('default')
+    directories = [
+        tmpdir.join('molecule', 'default').strpath,
+        tmpdir.strpath,
+        tmpdir.join('missing').strpath,
+    ]
+    w = watcher.Watcher(directories, poll=True)
+
+    assert [tmpdir.strpath] == w.directories
+    assert w.polling
@@ -180,3 +180,44 @@ def test_executes_catches_and_exits_return_code(
         _instance.execute()
 
     assert 1 == e.value.code
+
+
+def test_execute_with_lint_cache(
+    mocker, patched_logger_info, patched_logger_success, _instance
+):
+    mocker.patch('molecule.lint.cache.version').return_value = ['3.7.9', None, None]
+    m = mocker.patch('molecule.lint.cache.execute')
+    m.return_value = 0
+    _instance._tests = ['test1', 'test2']
+    _instance._config.args = {'lint_cache': True}
+    _instance.execute()
+
+    cache, command, files, parse = m.call_args[0]
+    assert ['test1', 'test2'] == files
+    assert 1 == parse(['test1:1:1: E101 foo'])
+    assert 0 == parse([])
+
+    msg = 'Lint completed successfully.'
+    patched_logger_success.assert_called_once_with(msg)
+
+
+def test_execute_with_lint_cache_exits_return_code(mocker, _instance):
+    mocker.patch('molecule.lint.cache.version').return_value = ['3.7.9', None, None]
+    mocker.patch('molecule.lint.cache.execute').return_value = 1
+    _instance._tests = ['test1']
+    _instance._config.args = {'lint_cache': True}
+    with pytest.raises(SystemExit) as e:
+        _instance.execute()
+
+    assert 1 == e.value.code
+
+
+def test_execute_incremental_is_scoped_to_scenario(mocker, _instance):
+    mocker.patch('molecule.lint.cache.version').return_value = ['3.7.9', None, None]
+    m_cache = mocker.patch('molecule.lint.cache.LintCache')
+    mocker.patch('molecule.lint.cache.execute').return_value = 0
+    _instance._tests = ['test1']
+    _instance._execute_incremental()
+
+    x = [_instance._config.project_directory, 'default']
+    assert x == m_cache.call_args[0][4]
@@ -0,0 +1,173 @@
+#  Copyright (c) 2019 Red Hat, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+from __future__ import print_function
+
+import contextlib
+import json
+import time
+
+import tabulate
+
+from molecule import logger
+from molecule import util
+
+LOG = logger.get_logger(__name__)
+TOP = 20
+
+# the records of the current process, processes running scenarios or steps
+# on behalf of this one hand theirs over through ``pop`` and ``extend``
+_STEPS = []
+_TASKS = []
+
+
+@contextlib.contextmanager
+def step(config, action):
+    """
+    Record the wall-clock time of the given action, and of the Ansible tasks
+    it ran, when timings are enabled and returns None.
+
+    :param config: An instance of a Molecule config.
+    :param action: A string containing the name of the action.
+    :return: None
+    """
+    if not config.timings:
+        yield
+        return
+
+    start = time.time()
+    try:
+        yield
+    finally:
+        _STEPS.append(
+            {
+                'scenario': config.scenario.name,
+                'action': action,
+                'start': start,
+                'duration': time.time() - start,
+            }
+        )
+        _TASKS.extend(tasks(config, action, start))
+
+
+def pop():
+    """
+    Remove the records of the current process and returns a dict.
+
+    :return: dict
+    """
+    records = {'steps': list(_STEPS), 'tasks': list(_TASKS)}
+    del _STEPS[:]
+    del _TASKS[:]
+
+    return records
+
+
+def extend(records):
+    """
+    Add records handed over by another process and returns None.
+
+    :param records: A dict as returned by :func:`pop`.
+    :return: None
+    """
+    _STEPS.extend(records['steps'])
+    _TASKS.extend(records['tasks'])
+
+
+def report(filename):
+    """
+    Print the slowest steps and tasks, write all records to the given file
+    and returns None.
+
+    :param filename: A string containing the path of the JSON file.
+    :return: None
+    """
+    if not _STEPS:
+        return
+
+    steps = sorted(_STEPS, key=_by_duration, reverse=True)
+    LOG.info('Slowest steps')
+    data = [
+        (r['scenario'], r['action'], '{:.1f}s'.format(r['duration']))
+        for r in steps[:TOP]
+    ]
+    print(tabulate.tabulate(data, ['Scenario', 'Action', 'Duration']))
+
+    if _TASKS:
+        tasks = sorted(_TASKS, key=_by_duration, reverse=True)
+        LOG.info('Slowest tasks')
+        data = [
+            (
+                r['scenario'],
+                r['action'],
+                r['task'],
+                r['host'],
+                '{:.2f}s'.format(r['duration']),
+            )
+            for r in tasks[:TOP]
+        ]
+        headers = ['Scenario', 'Action', 'Task', 'Host', 'Duration']
+        print(tabulate.tabulate(data, headers))
+
+    records = {
+        'steps': sorted(_STEPS, key=_by_start),
+        'tasks': sorted(_TASKS, key=_by_start),
+    }
+    with util.open_file(filename, 'w') as stream:
+        json.dump(records, stream, indent=2)
+    LOG.info('Timings written to {}'.format(filename))
+
+
+def _by_duration(record):
+    return record['duration']
+
+
+def _by_start(record):
+    return record['start']
+
+
+def tasks(config, action, start):
+    """
+    Collect the per host task results of the playbook run by the action, if
+    any, and returns a list.
+
+    :param config: An instance of a Molecule config.
+    :param action: A string containing the name of the action.
+    :param start: A float containing the time the action started.
+    :return: list
+    """
+    tasks = []
+    for event in config.provisioner.events():
+        if event['event'] == 'playbook_start' and event['time'] < start:
+            # the events were left by an earlier action
+            break
+        if event['event'] == 'task_end':
+            tasks.append(
+                {
+                    'scenario': config.scenario.name,
+                    'action': action,
+                    'task': event['task'],
+                    'host': event['host'],
+                    'start': event['start'],
+                    'duration': event['duration'],
+                }
+            )
+
+    return tasks
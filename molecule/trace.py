@@ -0,0 +1,187 @@
+#  Copyright (c) 2019 Red Hat, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import contextlib
+import json
+import os
+import time
+
+from molecule import logger
+
+LOG = logger.get_logger(__name__)
+
+# the events of the current process, processes running scenarios or steps
+# on behalf of this one hand theirs over through ``pop`` and ``extend``
+_EVENTS = []
+_HOSTS = {}
+_ENABLED = False
+
+
+def enable():
+    """
+    Start recording trace events in this process, and the processes forked
+    from it, and returns None.
+
+    :return: None
+    """
+    global _ENABLED
+    _ENABLED = True
+    name_process('molecule')
+
+
+def enabled():
+    return _ENABLED
+
+
+@contextlib.contextmanager
+def span(name, category, **args):
+    """
+    Record the time spent in the block as a complete event, when tracing is
+    enabled, and returns None.
+
+    :param name: A string containing the name of the span.
+    :param category: A string containing the category of the span.
+    :param args: Optional keyword arguments shown with the span.
+    :return: None
+    """
+    if not enabled():
+        yield
+        return
+
+    start = time.time()
+    try:
+        yield
+    finally:
+        complete(name, category, start, time.time() - start, **args)
+
+
+def complete(name, category, start, duration, tid=0, **args):
+    """
+    Record a complete event on the given track of this process and returns
+    None.
+
+    :param name: A string containing the name of the event.
+    :param category: A string containing the category of the event.
+    :param start: A float containing the start time in seconds.
+    :param duration: A float containing the duration in seconds.
+    :param tid: An optional int identifying the track within the process.
+    :param args: Optional keyword arguments shown with the event.
+    :return: None
+    """
+    _EVENTS.append(
+        {
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': int(start * 1e6),
+            'dur': int(duration * 1e6),
+            'pid': os.getpid(),
+            'tid': tid,
+            'args': args,
+        }
+    )
+
+
+def tasks(records):
+    """
+    Record the given Ansible task results, each on the track of its host,
+    and returns None.
+
+    :param records: A list of task records, as collected for timings.
+    :return: None
+    """
+    for record in records:
+        complete(
+            record['task'],
+            'task',
+            record['start'],
+            record['duration'],
+            tid=_host_track(record['scenario'], record['host']),
+            scenario=record['scenario'],
+            action=record['action'],
+            host=record['host'],
+        )
+
+
+def name_process(name):
+    """
+    Name the tracks of this process and returns None.
+
+    :param name: A string containing the name of the process.
+    :return: None
+    """
+    if enabled():
+        _EVENTS.append(_metadata('process_name', name, 0))
+        _EVENTS.append(_metadata('thread_name', name, 0))
+
+
+def pop():
+    """
+    Remove the events of the current process and returns a list.
+
+    :return: list
+    """
+    events = list(_EVENTS)
+    del _EVENTS[:]
+
+    return events
+
+
+def extend(events):
+    """
+    Add events handed over by another process and returns None.
+
+    :param events: A list as returned by :func:`pop`.
+    :return: None
+    """
+    _EVENTS.extend(events)
+
+
+def write(filename):
+    """
+    Write the recorded events in the Chrome Trace Event format, which trace
+    viewers such as Perfetto load, and returns None.
+
+    :param filename: A string containing the path of the trace file.
+    :return: None
+    """
+    with open(filename, 'w') as stream:
+        json.dump({'traceEvents': _EVENTS, 'displayTimeUnit': 'ms'}, stream)
+    LOG.info('Trace written to {}'.format(filename))
+
+
+def _host_track(scenario, host):
+    key = (os.getpid(), scenario, host)
+    if key not in _HOSTS:
+        _HOSTS[key] = len([k for k in _HOSTS if k[0] == key[0]]) + 1
+        name = '{} ({})'.format(host, scenario)
+        _EVENTS.append(_metadata('thread_name', name, _HOSTS[key]))
+
+    return _HOSTS[key]
+
+
+def _metadata(kind, name, tid):
+    return {
+        'name': kind,
+        'ph': 'M',
+        'pid': os.getpid(),
+        'tid': tid,
+        'args': {'name': name},
+    }
@@ -24,16 +24,40 @@
 import jinja2
 import os
 import re
+import stat
 import sys
+import tempfile
 
-import anyconfig
 import colorama
 import yaml
 
+from molecule import trace
 from molecule.logger import get_logger
 
 LOG = get_logger(__name__)
-MERGE_STRATEGY = anyconfig.MS_DICTS
+# The value of ``anyconfig.MS_DICTS``, pinned as anyconfig imports
+# ``pkg_resources`` and is only imported once dicts are merged.  A test checks
+# it still equals the anyconfig constant.
+MERGE_STRATEGY = 'merge_dicts'
+
+
+class cached_property(object):
+    """
+    A property computed on first access and kept on the instance, which may
+    also be assigned, like ``functools.cached_property`` of Python 3.8.
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.__doc__ = func.__doc__
+
+    def __get__(self, obj, cls):
+        if obj is None:
+            return self
+
+        value = obj.__dict__[self.func.__name__] = self.func(obj)
+
+        return value
 
 
 class SafeDumper(yaml.SafeDumper):
@@ -109,7 +133,10 @@ def run_command(cmd, debug=False):
         print_environment_vars(cmd._partial_call_args.get('env', {}))
         print_debug('COMMAND', str(cmd))
         print()
-    return cmd(_truncate_exc=False)
+    command = str(cmd)
+    name = os.path.basename(command.split(' ', 1)[0])
+    with trace.span(name, 'subprocess', command=command):
+        return cmd(_truncate_exc=False)
 
 
 def os_walk(directory, pattern, excludes=[]):
@@ -131,16 +158,55 @@ def render_template(template, **kwargs):
 
 def write_file(filename, content):
     """
-    Writes a file with the given filename and content and returns None.
+    Writes a file with the given filename and content, prepended with the
+    header of the files managed by Molecule, and returns None.  A file which
+    already has the content is left untouched, keeping its modification time.
 
     :param filename: A string containing the target filename.
     :param content: A string containing the data to be written.
     :return: None
     """
+    content = molecule_prepender(content)
+    try:
+        with open_file(filename) as f:
+            if f.read() == content:
+                return
+    except (IOError, OSError, UnicodeDecodeError):
+        pass
+
     with open_file(filename, 'w') as f:
         f.write(content)
 
-    file_prepender(filename)
+
+def write_file_atomically(filename, content):
+    """
+    Writes a file with the given filename and content, replacing the file at
+    once so it is never left partially written, and returns None.
+
+    :param filename: A string containing the target filename.
+    :param content: A string containing the data to be written.
+    :return: None
+    """
+    directory, basename = os.path.split(os.path.abspath(filename))
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix='.{}.'.format(basename))
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(content)
+        os.chmod(tmp, _file_mode(filename))
+        os.rename(tmp, filename)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _file_mode(filename):
+    try:
+        return stat.S_IMODE(os.stat(filename).st_mode)
+    except OSError:
+        umask = os.umask(0)
+        os.umask(umask)
+
+        return 0o666 & ~umask
 
 
 def molecule_prepender(content):
@@ -176,15 +242,16 @@ def safe_dump(data):
     )
 
 
-def safe_load(string):
+def safe_load(string, loader=yaml.SafeLoader):
     """
     Parse the provided string returns a dict.
 
     :param string: A string to be parsed.
+    :param loader: An optional subclass of ``yaml.SafeLoader`` to parse with.
     :return: dict
     """
     try:
-        return yaml.safe_load(string) or {}
+        return yaml.load(string, Loader=loader) or {}
     except yaml.scanner.ScannerError as e:
         sysexit_with_message(str(e))
 
@@ -213,6 +280,32 @@ def open_file(filename, mode='r'):
         yield stream
 
 
+@contextlib.contextmanager
+def redirect_output(filename):
+    """
+    Redirect the process' stdout and stderr, including those inherited by
+    subprocesses, to the given file and returns None.
+
+    :param filename: A string containing the path to the log file.
+    :returns: None
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved = [os.dup(1), os.dup(2)]
+    with open_file(filename, 'w') as stream:
+        os.dup2(stream.fileno(), 1)
+        os.dup2(stream.fileno(), 2)
+        try:
+            yield
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.dup2(saved[0], 1)
+            os.dup2(saved[1], 2)
+            for fd in saved:
+                os.close(fd)
+
+
 def instance_with_scenario_name(instance_name, scenario_name):
     return '{}-{}'.format(instance_name, scenario_name)
 
@@ -304,6 +397,8 @@ def merge_dicts(a, b):
     :param b: the dictionary to import
     :return: dict
     """
+    import anyconfig
+
     anyconfig.merge(a, b, ac_merge=MERGE_STRATEGY)
 
     return a
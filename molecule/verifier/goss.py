@@ -101,8 +101,10 @@ def __init__(self, config):
         :return: None
         """
         super(Goss, self).__init__(config)
-        if config:
-            self._tests = self._get_tests()
+
+    @util.cached_property
+    def _tests(self):
+        return self._get_tests()
 
     @property
     def name(self):
@@ -24,6 +24,7 @@
 
 from molecule import logger
 from molecule import util
+from molecule.lint import cache as lint_cache
 from molecule.verifier.lint import base
 
 LOG = logger.get_logger(__name__)
@@ -80,8 +81,10 @@ def __init__(self, config):
         """
         super(Flake8, self).__init__(config)
         self._flake8_command = None
-        if config:
-            self._tests = self._get_tests()
+
+    @util.cached_property
+    def _tests(self):
+        return self._get_tests()
 
     @property
     def default_options(self):
@@ -120,6 +123,14 @@ def execute(self):
         )
         LOG.info(msg)
 
+        if self._config.lint_cache:
+            exit_code = self._execute_incremental()
+            if exit_code:
+                util.sysexit(exit_code)
+            msg = 'Lint completed successfully.'
+            LOG.success(msg)
+            return
+
         try:
             util.run_command(self._flake8_command, debug=self._config.debug)
             msg = 'Lint completed successfully.'
@@ -127,6 +138,30 @@ def execute(self):
         except sh.ErrorReturnCode as e:
             util.sysexit(e.exit_code)
 
+    def _execute_incremental(self):
+        """
+        Lint the tests changed since their results were cached, replay the
+        cached results of the others, and returns the exit code.
+
+        :return: int
+        """
+        cache = lint_cache.LintCache(
+            self.name,
+            lint_cache.version('flake8'),
+            self.options,
+            ['.flake8', 'setup.cfg', 'tox.ini'],
+            [self._config.project_directory, self._config.scenario.name],
+        )
+        command = sh.flake8.bake(self.options, _env=self.env, _err=LOG.error)
+
+        return lint_cache.execute(
+            cache,
+            command,
+            self._tests,
+            lambda lines: 1 if lines else 0,
+            debug=self._config.debug,
+        )
+
     def _get_tests(self):
         """
         Walk the verifier's directory for tests and returns a list.
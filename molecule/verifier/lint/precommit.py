@@ -100,8 +100,10 @@ def __init__(self, config):
         """
         super(PreCommit, self).__init__(config)
         self._precommit_command = None
-        if config:
-            self._tests = self._get_tests()
+
+    @util.cached_property
+    def _tests(self):
+        return self._get_tests()
 
     @property
     def default_options(self):
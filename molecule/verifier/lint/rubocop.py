@@ -80,8 +80,10 @@ def __init__(self, config):
         """
         super(RuboCop, self).__init__(config)
         self._rubocop_command = None
-        if config:
-            self._tests = self._get_tests()
+
+    @util.cached_property
+    def _tests(self):
+        return self._get_tests()
 
     @property
     def default_options(self):
@@ -99,8 +99,10 @@ def __init__(self, config):
         """
         super(Testinfra, self).__init__(config)
         self._testinfra_command = None
-        if config:
-            self._tests = self._get_tests()
+
+    @util.cached_property
+    def _tests(self):
+        return self._get_tests()
 
     @property
     def name(self):
@@ -0,0 +1,288 @@
+#  Copyright (c) 2019 Red Hat, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import ctypes
+import ctypes.util
+import errno
+import fnmatch
+import os
+import select
+import struct
+import sys
+import time
+
+# The names of the files and directories never watched, editors write some of
+# them next to the files they save.  ``4913`` is the file ``vim`` probes a
+# directory with.
+EXCLUDES = [
+    '.git',
+    '.tox',
+    '.pytest_cache',
+    '__pycache__',
+    '*.pyc',
+    '*.swp',
+    '*.swx',
+    '*~',
+    '.#*',
+    '4913',
+]
+
+# How long the files have to stay unchanged before the changes are reported,
+# an editor saving a file, or a checkout, change several files at once.
+DEBOUNCE = 0.3
+
+# How often the files are compared when polling.
+POLL_INTERVAL = 0.5
+
+# ``inotify_event`` structs, followed by their ``name``.
+_EVENT = struct.Struct('iIII')
+
+# See inotify(7).
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_Q_OVERFLOW = 0x00004000
+_IN_ISDIR = 0x40000000
+_IN_MASK = (
+    _IN_MODIFY
+    | _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+)
+
+
+class Watcher(object):
+    """
+    Watches directory trees for files being changed, added or removed, with
+    inotify where the platform has it, and by comparing the modification
+    times of the files otherwise.
+    """
+
+    def __init__(self, directories, excludes=EXCLUDES, poll=False):
+        """
+        Start watching the given directories and returns None.
+
+        :param directories: A list of paths of the directories watched, with
+         all the directories below them.
+        :param excludes: An optional list of patterns matching the names of
+         the files and directories which are not watched.
+        :param poll: An optional bool to compare modification times even where
+         inotify is available.
+        :return: None
+        """
+        directories = [os.path.abspath(d) for d in directories if os.path.isdir(d)]
+        self._directories = _outermost(directories)
+        self._excludes = excludes
+        self._backend = None
+        if not poll:
+            self._backend = _Inotify.create(self._directories, self._excluded)
+        if self._backend is None:
+            self._backend = _Polling(self._directories, self._excluded)
+
+    @property
+    def directories(self):
+        return self._directories
+
+    @property
+    def polling(self):
+        return isinstance(self._backend, _Polling)
+
+    def wait(self, debounce=DEBOUNCE):
+        """
+        Block until files changed, and stayed unchanged for the given time
+        since, and returns a sorted list of their paths.
+
+        :param debounce: An optional float containing the seconds the files
+         have to stay unchanged.
+        :return: list
+        """
+        changed = set()
+        while not changed:
+            changed.update(self._backend.read(None))
+        while True:
+            paths = self._backend.read(debounce)
+            if not paths:
+                break
+            changed.update(paths)
+
+        return sorted(changed)
+
+    def close(self):
+        """
+        Stop watching and returns None.
+
+        :return: None
+        """
+        self._backend.close()
+
+    def _excluded(self, path):
+        name = os.path.basename(path)
+
+        return any(fnmatch.fnmatch(name, pattern) for pattern in self._excludes)
+
+
+class _Inotify(object):
+    def __init__(self, libc, fd, directories, excluded):
+        self._libc = libc
+        self._fd = fd
+        self._excluded = excluded
+        self._watches = {}
+        for directory in directories:
+            self._add_tree(directory)
+
+    @classmethod
+    def create(cls, directories, excluded):
+        # Python 2 polls, it has no ``os.fsencode``
+        if not sys.platform.startswith('linux') or not hasattr(os, 'fsencode'):
+            return None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+            inotify_init1 = libc.inotify_init1
+        except (OSError, AttributeError):
+            return None
+
+        fd = inotify_init1(os.O_CLOEXEC)
+        if fd < 0:
+            # out of instances, which ``fs.inotify.max_user_instances`` limits
+            return None
+        try:
+            return cls(libc, fd, directories, excluded)
+        except OSError:
+            # out of watches, which ``fs.inotify.max_user_watches`` limits
+            os.close(fd)
+            return None
+
+    def read(self, timeout):
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return []
+
+        data = os.read(self._fd, 65536)
+        paths = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size
+            name = data[offset : offset + length].rstrip(b'\0')
+            offset += length
+
+            if mask & _IN_Q_OVERFLOW:
+                # events were lost, the directories are all that is known
+                paths.extend(self._watches.values())
+                continue
+            directory = self._watches.get(wd)
+            if directory is None or not name:
+                continue
+            path = os.path.join(directory, os.fsdecode(name))
+            if self._excluded(path):
+                continue
+            if mask & _IN_ISDIR and mask & (_IN_CREATE | _IN_MOVED_TO):
+                # the files created before the directory is watched are new too
+                paths.extend(self._add_tree(path))
+            paths.append(path)
+
+        return paths
+
+    def close(self):
+        os.close(self._fd)
+
+    def _add_tree(self, directory):
+        paths = []
+        for root, dirs, files in os.walk(directory):
+            dirs[:] = [d for d in dirs if not self._excluded(os.path.join(root, d))]
+            wd = self._libc.inotify_add_watch(
+                self._fd, os.fsencode(root), ctypes.c_uint32(_IN_MASK)
+            )
+            if wd < 0:
+                e = ctypes.get_errno()
+                # the directory was removed while walking the tree
+                if e in (errno.ENOENT, errno.ENOTDIR):
+                    continue
+                raise OSError(e, os.strerror(e), root)
+            self._watches[wd] = root
+            paths.extend(
+                os.path.join(root, name)
+                for name in files
+                if not self._excluded(os.path.join(root, name))
+            )
+
+        return paths
+
+
+class _Polling(object):
+    def __init__(self, directories, excluded):
+        self._directories = directories
+        self._excluded = excluded
+        self._snapshot = self._take_snapshot()
+
+    def read(self, timeout):
+        deadline = None if timeout is None else time.time() + timeout
+        while True:
+            interval = POLL_INTERVAL
+            if deadline is not None:
+                interval = min(interval, max(deadline - time.time(), 0))
+            time.sleep(interval)
+
+            snapshot = self._take_snapshot()
+            paths = [
+                path
+                for path in set(snapshot) | set(self._snapshot)
+                if snapshot.get(path) != self._snapshot.get(path)
+            ]
+            self._snapshot = snapshot
+            if paths or (deadline is not None and time.time() >= deadline):
+                return paths
+
+    def close(self):
+        pass
+
+    def _take_snapshot(self):
+        snapshot = {}
+        for directory in self._directories:
+            for root, dirs, files in os.walk(directory):
+                dirs[:] = [d for d in dirs if not self._excluded(os.path.join(root, d))]
+                for name in files:
+                    path = os.path.join(root, name)
+                    if self._excluded(path):
+                        continue
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    snapshot[path] = (stat.st_mtime, stat.st_size)
+
+        return snapshot
+
+
+def _outermost(directories):
+    # the directories below a watched one are watched already
+    result = []
+    for directory in sorted(set(directories)):
+        if not any(directory.startswith(os.path.join(d, '')) for d in result):
+            result.append(directory)
+
+    return result